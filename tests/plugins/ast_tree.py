@@ -5,8 +5,20 @@ from textwrap import dedent
 
 import pytest
 
+from wemake_python_styleguide.logic import tables
 from wemake_python_styleguide.transformations.ast_tree import transform
 
+_node_tables = []
+
+
+@pytest.fixture(autouse=True)
+def _drop_node_tables():
+    """Drops node tables after each test, like the checker does."""
+    yield
+    for table in _node_tables:
+        tables.drop(table)
+    _node_tables.clear()
+
 
 @pytest.fixture(scope='session')
 def parse_ast_tree():
@@ -32,6 +44,11 @@ def parse_ast_tree():
             # that are validated after the `ast` is processed:
             # like double arguments or `break` outside of loops.
             compile(code_to_parse, '<filename>', 'exec')  # noqa: WPS421
-        return transform(ast.parse(code_to_parse))
+        tree = ast.parse(code_to_parse)
+        table = tables.NodeTable(tree)
+        # Visitors are run on this tree later, so its table stays active:
+        tables.activate(table)
+        _node_tables.append(table)
+        return transform(tree, table)
 
     return factory
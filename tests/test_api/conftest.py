@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def source():
+    """Returns a source with a lot of violations."""
+    with open('./tests/fixtures/noqa/noqa.py') as source_file:
+        return source_file.read()
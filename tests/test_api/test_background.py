@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import closing
+
+import pytest
+
+from wemake_python_styleguide.api.background import STAGES, check_stage, lint
+from wemake_python_styleguide.api.linting import lint_source
+from wemake_python_styleguide.checker import Checker
+
+_FILENAME = './tests/fixtures/noqa/noqa.py'
+
+#: Not enough to finish any stage.
+_SHORT_TIMEOUT = 0.01
+
+
+class _IdleExecutor(Executor):
+    def submit(self, *args, **kwargs):
+        return Future()
+
+
+def _run(coroutine):
+    with closing(asyncio.new_event_loop()) as loop:
+        return loop.run_until_complete(coroutine)
+
+
+def test_all_stages():
+    """Ensures that all visitors are executed exactly once."""
+    staged_visitors = [
+        visitor_class
+        for stage in STAGES
+        for visitor_class in stage
+    ]
+    checker_visitors = Checker._visitors  # noqa: WPS437
+
+    assert len(staged_visitors) == len(checker_visitors)
+    assert set(staged_visitors) == set(checker_visitors)
+
+
+@pytest.mark.parametrize('executor', [
+    None,
+    ThreadPoolExecutor(),
+])
+def test_same_as_lint_source(source, executor):
+    """Ensures that staged checks find the same violations."""
+    report = _run(lint(source, _FILENAME, executor=executor))
+    expected = lint_source(source, _FILENAME)
+
+    assert report.is_complete
+    assert len(report.violations) == len(expected)
+    assert set(report.violations) == set(expected)
+
+
+@pytest.mark.parametrize(('timeout', 'executor'), [
+    (0, None),
+    (_SHORT_TIMEOUT, _IdleExecutor()),
+])
+def test_time_budget(source, timeout, executor):
+    """Ensures that unfinished stages are not reported."""
+    report = _run(lint(source, _FILENAME, timeout=timeout, executor=executor))
+
+    assert not report.is_complete
+    assert not report.violations
+
+
+def test_new_document(source):
+    """Ensures that workers check new documents."""
+    assert check_stage(source, _FILENAME, None, STAGES[0])
+    assert not check_stage('', _FILENAME, None, STAGES[0])
+
+
+def test_cancel(source):
+    """Ensures that lint tasks can be cancelled."""
+    async def factory():
+        task = asyncio.ensure_future(lint(source, _FILENAME))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        _run(factory())
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide import checker as checker_module
+from wemake_python_styleguide.api.incremental import IncrementalLinter
+from wemake_python_styleguide.api.linting import lint_source
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors.ast.statements import (
+    PointlessStarredVisitor,
+)
+
+_SYSTEM_SOURCE = """
+def first():
+    return 1
+
+def second():
+    return 2
+"""
+
+_NEW_FUNCTION = """
+
+def new_function(argument):
+    for index in argument:
+        print(index)
+    return index
+"""
+
+
+@pytest.mark.parametrize('change', [
+    pytest.param(lambda source: source, id='same'),
+    pytest.param(
+        lambda source: '# New comment\n\n{0}'.format(source),
+        id='new_comment',
+    ),
+    pytest.param(
+        lambda source: '{0}{1}'.format(source, _NEW_FUNCTION),
+        id='new_last_function',
+    ),
+    pytest.param(
+        lambda source: source.replace('\n\n\n', _NEW_FUNCTION, 1),
+        id='new_function_between',
+    ),
+    pytest.param(
+        lambda source: source.replace('def ', 'async def ', 1),
+        id='async_function',
+    ),
+    pytest.param(lambda source: '', id='empty'),
+])
+def test_same_as_lint_source(source, change):
+    """Ensures that changed sources have the same violations."""
+    linter = IncrementalLinter(options={'max_line_complexity': 30})
+    linter.lint(source)
+
+    changed_source = change(source)
+    assert sorted(linter.lint(changed_source)) == sorted(lint_source(
+        changed_source,
+        options={'max_line_complexity': 30},
+    ))
+
+
+def test_reuses_definitions(source, monkeypatch):
+    """Ensures that unchanged definitions are not checked again."""
+    checked = []
+    run_visitors = Checker.run_visitors
+
+    def factory(checker, visitors, tree=None, budget=None):
+        checked.append(tree)
+        return run_visitors(checker, visitors, tree, budget)
+
+    linter = IncrementalLinter()
+    linter.lint(source)
+    monkeypatch.setattr(Checker, 'run_visitors', factory)
+
+    linter.lint('# New comment\n{0}{1}'.format(source, _NEW_FUNCTION))
+    assert len(checked) == 2
+    assert checked[0] is None
+    assert checked[1].name == 'new_function'
+
+
+def _internal_errors(violations):
+    return [
+        violation.line_number
+        for violation in violations
+        if violation.code == 'WPS000'
+    ]
+
+
+def test_internal_errors_are_not_cached(monkeypatch):
+    """Ensures that failed definitions are checked again and not moved."""
+    checked = []
+
+    def factory(visitor):
+        checked.append(visitor.tree)
+        raise ValueError('Failed')
+
+    monkeypatch.setattr(PointlessStarredVisitor, 'run', factory)
+    linter = IncrementalLinter()
+    linter.lint(_SYSTEM_SOURCE)
+    changed_source = '# New comment\n{0}'.format(_SYSTEM_SOURCE)
+    violations = linter.lint(changed_source)
+
+    assert len(checked) == 4
+    assert _internal_errors(violations) == [0]
+    assert _internal_errors(violations) == _internal_errors(
+        lint_source(changed_source),
+    )
+
+
+class _Clock(object):
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def perf_counter(self) -> float:
+        self.seconds += 1
+        return self.seconds
+
+
+def test_single_time_budget(monkeypatch):
+    """Ensures that visitors out of time are reported once per document."""
+    monkeypatch.setattr(checker_module, 'time', _Clock())
+    linter = IncrementalLinter(options={'max_visitor_seconds': 1})
+
+    budget_violations = [
+        violation
+        for violation in linter.lint(_SYSTEM_SOURCE)
+        if violation.code == 'WPS002'
+    ]
+    assert len(budget_violations) == 1
+    assert budget_violations[0].text.count(
+        PointlessStarredVisitor.__qualname__,
+    ) == 1
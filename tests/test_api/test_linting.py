@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+
+import pytest
+
+from wemake_python_styleguide.api.linting import LintViolation, lint_source
+
+_FILENAME = './tests/fixtures/formatter/formatter1.py'
+
+
+def test_same_as_flake8():
+    """Ensures that the same violations are found as with ``flake8``."""
+    process = subprocess.Popen(
+        [
+            'flake8',
+            '--isolated',
+            '--select',
+            'WPS',
+            '--format',
+            '%(code)s:%(row)d:%(col)d:%(text)s',
+            _FILENAME,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf8',
+    )
+    output, _ = process.communicate()
+
+    with open(_FILENAME) as source_file:
+        violations = lint_source(source_file.read(), filename=_FILENAME)
+
+    assert output.splitlines() == [
+        '{0}:{1}:{2}:{3}'.format(
+            violation.code,
+            violation.line_number,
+            violation.column,
+            violation.text,
+        )
+        for violation in violations
+    ]
+
+
+def test_options():
+    """Ensures that options are passed to visitors."""
+    assert lint_source('x = 1') == [
+        LintViolation('WPS111', 1, 1, 'Found too short name: x'),
+    ]
+    assert not lint_source('x = 1', options={'min_name_length': 1})
+
+
+@pytest.mark.parametrize('options', [
+    {'max_returns': 0},
+    {'unknown_option': 1},
+])
+def test_invalid_options(options):
+    """Ensures that invalid options are not allowed."""
+    with pytest.raises(ValueError, match='[Oo]ption'):
+        lint_source('', options=options)
+
+
+@pytest.mark.parametrize(('source', 'codes'), [
+    ('x = 1  # noqa: WPS111\n', []),
+    ('x = 1  # NOQA:WPS1,WPS400\n', []),
+    ('x = 1  # noqa: WPS110\n', ['WPS111']),
+    ('x = 1\n\n\n# noqa: WPS111\n', ['WPS111']),
+    ('x = 1  # noqa\n', ['WPS400']),
+])
+def test_noqa(source, codes):
+    """Ensures that violations can be ignored inline."""
+    violations = lint_source(source)
+
+    assert codes == [violation.code for violation in violations]
+
+
+def test_syntax_error():
+    """Ensures that invalid code is not checked."""
+    with pytest.raises(SyntaxError):
+        lint_source('def')
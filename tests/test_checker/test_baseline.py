@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import struct
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.baseline import (
+    Baseline,
+    Fingerprints,
+    write_baseline,
+)
+from wemake_python_styleguide.checker import Checker
+
+_SOURCE = """
+class Example(object):
+    def method(self):
+        print(1)
+
+async def function():
+    print(1)
+"""
+
+_SHIFTED_SOURCE = """
+class Example(object):
+    # Comments do not change fingerprints:
+    def method(self):
+        print(1)    # noqa: E501
+    def other(self):
+        print(1)
+async def function():
+    print(1)
+"""
+
+_CHANGED_SOURCE = """
+class Example(object):
+    def method(self):
+        print(2)
+
+async def function():
+    print(2)
+"""
+
+
+def _fingerprints(source, filename='module.py'):
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    return Fingerprints(filename, list(tokens))
+
+
+def _check(source, options):
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=list(tokens),
+        filename='./module.py',
+        options=options,
+    )
+    return {
+        (line, message.split(' ', 1)[0])
+        for line, _, message, _ in checker.run()
+    }
+
+
+@pytest.mark.parametrize(('source', 'filename', 'code', 'line', 'is_same'), [
+    (_SOURCE, './module.py', 'WPS421', 4, True),
+    (_SHIFTED_SOURCE, 'module.py', 'WPS421', 5, True),
+    (_SHIFTED_SOURCE, 'module.py', 'WPS421', 7, False),
+    (_SHIFTED_SOURCE, 'module.py', 'WPS421', 9, False),
+    (_CHANGED_SOURCE, 'module.py', 'WPS421', 4, False),
+    (_SOURCE, 'other.py', 'WPS421', 4, False),
+    (_SOURCE, 'module.py', 'WPS432', 4, False),
+])
+def test_fingerprints(source, filename, code, line, is_same):
+    """Ensures that fingerprints do not depend on line numbers only."""
+    fingerprint = _fingerprints(_SOURCE).get('WPS421', 4)
+    other_fingerprint = _fingerprints(source, filename).get(code, line)
+
+    assert is_same is (fingerprint == other_fingerprint)
+
+
+@pytest.mark.parametrize('fingerprints_count', [0, 1, 10, 1000])
+def test_baseline_lookup(tmp_path, fingerprints_count):
+    """Ensures that all written fingerprints are found."""
+    baseline_path = str(tmp_path / 'baseline')
+    fingerprints = [
+        fingerprint * 1024 + 1 for fingerprint in range(fingerprints_count)
+    ]
+    write_baseline(baseline_path, fingerprints)
+
+    known_violations = Baseline(baseline_path)
+
+    assert all(
+        fingerprint in known_violations for fingerprint in fingerprints
+    )
+    assert fingerprints_count * 1024 + 1 not in known_violations
+
+
+@pytest.mark.parametrize('broken_table', [
+    b'',
+    b'WPS1',
+    b'flake8',
+    struct.pack('<4sQ', b'WPS1', 2),
+    struct.pack('<4s4Q', b'WPS1', 3, 1, 1, 1),
+    struct.pack('<4s3Q', b'WPS2', 2, 1, 1),
+])
+def test_broken_baseline(tmp_path, broken_table):
+    """Ensures that broken baseline files are not used."""
+    baseline_path = tmp_path / 'baseline'
+    baseline_path.write_bytes(broken_table)
+
+    with pytest.raises(ValueError):
+        Baseline(str(baseline_path))
+
+
+def test_full_baseline(tmp_path):
+    """Ensures that lookups stop when there are no empty slots."""
+    baseline_path = tmp_path / 'baseline'
+    baseline_path.write_bytes(struct.pack('<4s3Q', b'WPS1', 2, 2, 3))
+
+    assert 1 not in Baseline(str(baseline_path))
+
+
+@pytest.mark.parametrize('max_violations', [0, 1])
+def test_checker_baseline(tmp_path, options, max_violations):
+    """Ensures that known violations are not reported by the checker."""
+    baseline_path = str(tmp_path / 'baseline')
+    fingerprints = _fingerprints(_SOURCE, './module.py')
+    write_baseline(baseline_path, [fingerprints.get('WPS421', 4)])
+    option_values = options(
+        baseline_file=baseline_path,
+        max_violations=max_violations,
+    )
+
+    shifted_violations = _check(_SHIFTED_SOURCE, option_values)
+    changed_violations = _check(_CHANGED_SOURCE, option_values)
+
+    assert (5, 'WPS421') not in shifted_violations
+    assert (7, 'WPS421') in shifted_violations
+    assert (4, 'WPS421') in changed_violations
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.violations.naming import TooShortNameViolation
+
+_SOURCE = 'ab = 1\n'
+_CODE = 'WPS{0}'.format(TooShortNameViolation.code)
+
+#: Names of two chars are allowed with the first option only.
+_NAME_LENGTHS = (2, 3) * 8
+
+
+def _check(options) -> bool:
+    tokens = tokenize.generate_tokens(io.StringIO(_SOURCE).readline)
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=list(tokens),
+        filename='module.py',
+        options=options,
+    )
+    return any(
+        violation[2].startswith(_CODE)
+        for violation in checker.run()
+    )
+
+
+def test_options_per_instance(options, default_options):
+    """Ensures that instance options take priority over parsed ones."""
+    Checker.parse_options(default_options)
+
+    assert _check(options(min_name_length=3))
+    assert not _check(None)
+
+
+def test_concurrent_checks(options):
+    """Ensures that checkers with different options run at the same time."""
+    all_options = [
+        options(min_name_length=length)
+        for length in _NAME_LENGTHS
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(all_options)) as executor:
+        reported = list(executor.map(_check, all_options))
+
+    assert reported == [length > 2 for length in _NAME_LENGTHS]
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+_DEPTH = 3000
+
+_INTERNAL_ERROR_CODE = 'WPS000'
+
+
+def _name() -> ast.Name:
+    return ast.Name(id='some', ctx=ast.Load(), lineno=1, col_offset=0)
+
+
+def _nested_lists() -> ast.AST:
+    node: ast.AST = _name()
+    for _ in range(_DEPTH):
+        node = ast.List(elts=[node], ctx=ast.Load(), lineno=1, col_offset=0)
+    return node
+
+
+def _nested_dicts() -> ast.AST:
+    node: ast.AST = _name()
+    for _ in range(_DEPTH):
+        node = ast.Dict(keys=[_name()], values=[node], lineno=1, col_offset=0)
+    return node
+
+
+def _long_chain() -> ast.AST:
+    code = ' + '.join('some' for _ in range(_DEPTH))
+    return ast.parse(code).body[0].value  # type: ignore
+
+
+@pytest.mark.parametrize('expression', [
+    _nested_lists,
+    _nested_dicts,
+    _long_chain,
+])
+def test_deep_nesting(default_options, expression):
+    """Ensures that deeply nested expressions do not cause internal errors."""
+    statement = ast.Expr(value=expression(), lineno=1, col_offset=0)
+    tree = ast.Module(body=[statement], type_ignores=[])
+
+    Checker.parse_options(default_options)
+    checker = Checker(tree=tree, file_tokens=[], filename='deep.py')
+    messages = [violation[2] for violation in checker.run()]
+
+    assert messages
+    assert not any(
+        message.startswith(_INTERNAL_ERROR_CODE) for message in messages
+    )
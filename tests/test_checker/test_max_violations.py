@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+_SOURCE = """
+x = 1
+y = 2  # noqa: WPS111
+z = 3
+w = 4
+"""
+
+_LIMIT_CODE = 'WPS001'
+
+
+def _check(options):
+    tokens = tokenize.generate_tokens(io.StringIO(_SOURCE).readline)
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=list(tokens),
+        filename='module.py',
+        options=options,
+    )
+    return [
+        (line_number, message.split(' ', 1)[0])
+        for line_number, _, message, _ in checker.run()
+    ]
+
+
+@pytest.mark.parametrize(('max_violations', 'expected'), [
+    (1, [(2, 'WPS111'), (0, 'WPS001')]),
+    (2, [(2, 'WPS111'), (3, 'WPS111'), (4, 'WPS111'), (0, 'WPS001')]),
+])
+def test_max_violations(options, max_violations, expected):
+    """Ensures that checks are stopped when enough violations are found."""
+    assert _check(options(max_violations=max_violations)) == expected
+
+
+def test_no_limit(options):
+    """Ensures that all violations are reported without the limit."""
+    check_results = _check(options(max_violations=0))
+
+    assert len(check_results) == 4
+    assert _LIMIT_CODE not in {code for _, code in check_results}
+
+
+def test_limit_is_not_reached(options):
+    """Ensures that limit violation is not reported for cleaner modules."""
+    check_results = _check(options(max_violations=4))
+
+    assert len(check_results) == 4
+    assert _LIMIT_CODE not in {code for _, code in check_results}
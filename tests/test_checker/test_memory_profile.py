@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import json
+import os
+import tokenize
+import tracemalloc
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.tracing import create_trace_files
+
+_SOURCE = 'print(1)\n'
+
+_VISITORS_COUNT = len(Checker._visitors)  # noqa: WPS437
+
+
+def _check(options):
+    tokens = tokenize.generate_tokens(io.StringIO(_SOURCE).readline)
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=list(tokens),
+        filename='module.py',
+        options=options,
+    )
+    return [message for _, _, message, _ in checker.run()]
+
+
+@pytest.fixture(autouse=True)
+def _stop_tracemalloc():
+    was_tracing = tracemalloc.is_tracing()
+    yield
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_memory_profile(tmp_path, options):
+    """Ensures that memory of each checked file is written."""
+    profile_path = tmp_path / 'memory.jsonl'
+    profile_path.write_text('stale\n')
+    option_values = options(memory_profile=str(profile_path))
+    create_trace_files(option_values)
+    _check(option_values)
+    _check(option_values)
+
+    file_profiles = [
+        json.loads(file_profile)
+        for file_profile in profile_path.read_text().splitlines()
+    ]
+
+    assert len(file_profiles) == 2
+    assert file_profiles[0]['filename'] == 'module.py'
+    assert file_profiles[0]['pid'] == os.getpid()
+    assert file_profiles[0]['peak_rss'] > 0
+
+
+def test_memory_steps(tmp_path, options):
+    """Ensures that memory of the transformation and visitors is written."""
+    profile_path = tmp_path / 'memory.jsonl'
+    _check(options(memory_profile=str(profile_path)))
+
+    steps = json.loads(profile_path.read_text())['steps']
+
+    assert len(steps) == _VISITORS_COUNT + 1
+    assert steps['transform']['allocated'] > 0
+    assert all(
+        0 <= step['retained'] <= step['allocated']
+        for step in steps.values()
+    )
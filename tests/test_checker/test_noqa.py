@@ -54,6 +54,8 @@ VERSION_SPECIFIC = types.MappingProxyType({
 #: Number and count of violations that would be raised.
 SHOULD_BE_RAISED = types.MappingProxyType({
     'WPS000': 0,  # logically unacceptable.
+    'WPS001': 0,  # only raised with `--max-violations`.
+    'WPS002': 0,  # only raised with `--max-file-seconds`.
 
     'WPS100': 0,  # logically unacceptable.
     'WPS101': 0,  # logically unacceptable.
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.presets import tiers
+from wemake_python_styleguide.presets.types import file_tokens, filename, tree
+
+_FILENAME = './tests/fixtures/noqa/noqa.py'
+
+
+def _check(options):
+    with open(_FILENAME, 'rb') as source_file:
+        source = source_file.read()
+
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=list(tokenize.tokenize(io.BytesIO(source).readline)),
+        filename=_FILENAME,
+        options=options,
+    )
+    return {
+        message.split(' ', 1)[0]
+        for _, _, message, _ in checker.run()
+    }
+
+
+def test_tiers_are_nested():
+    """Ensures that more expensive tiers include cheaper ones."""
+    all_visitors = Checker._visitors  # noqa: WPS437
+    fast = tiers.select_tier(all_visitors, 'fast')
+    standard = tiers.select_tier(all_visitors, 'standard')
+
+    assert set(fast) < set(standard)
+    assert set(standard) < set(all_visitors)
+    assert tiers.select_tier(all_visitors, 'full') == tuple(all_visitors)
+    assert set(file_tokens.PRESET) <= set(fast)
+    assert set(filename.PRESET) <= set(fast)
+
+
+def test_limited_visitors_order():
+    """Ensures that cheaper visitors go first and keep the preset order."""
+    limited = Checker._limited_visitors  # noqa: WPS437
+    costs = [visitor_class.cost for visitor_class in limited]
+    presets = (*filename.PRESET, *file_tokens.PRESET, *tree.PRESET)
+
+    assert costs == sorted(costs)
+    assert set(limited) == set(Checker._visitors)  # noqa: WPS437
+    for cost in set(costs):
+        assert [
+            visitor_class
+            for visitor_class in limited
+            if visitor_class.cost == cost
+        ] == [
+            visitor_class
+            for visitor_class in presets
+            if visitor_class.cost == cost
+        ]
+
+
+def test_cheaper_tiers_report_less(options):
+    """Ensures that cheaper tiers only report some of the violations."""
+    fast = _check(options(checks_tier='fast'))
+    standard = _check(options(checks_tier='standard'))
+
+    assert fast < standard
+    assert standard < _check(options(checks_tier='full'))
+
+
+def test_unknown_tier(options):
+    """Ensures that only known tiers can be used."""
+    with pytest.raises(ValueError):
+        _check(options(checks_tier='slow'))
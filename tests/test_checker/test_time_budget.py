@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import time
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors.ast.loops import SyncForLoopVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+)
+
+#: There are more nodes and tokens than visitors check the time after.
+_NUMBERS = 2000
+_SOURCE = 'numbers = [{0}]\n'.format('1, ' * _NUMBERS)
+
+#: Each slow visit takes this much of fake time.
+_VISIT_SECONDS = 0.01
+
+
+class _Clock(object):
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def perf_counter(self) -> float:
+        return self.seconds
+
+
+_clock = _Clock()
+
+
+class _SlowNodeVisitor(BaseNodeVisitor):
+    def visit(self, node: ast.AST) -> None:
+        _clock.seconds += _VISIT_SECONDS
+        self.generic_visit(node)
+
+
+class _SlowTokenVisitor(BaseTokenVisitor):
+    def visit(self, token: tokenize.TokenInfo) -> None:
+        _clock.seconds += _VISIT_SECONDS
+
+
+def _check(options, visitors):
+    tokens = tokenize.generate_tokens(io.StringIO(_SOURCE).readline)
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=list(tokens),
+        filename='module.py',
+        options=options,
+    )
+    checker._visitors = visitors  # noqa: WPS437
+    return [message for _, _, message, _ in checker.run()]
+
+
+@pytest.fixture(autouse=True)
+def _fake_clock(monkeypatch):
+    _clock.seconds = 0.0
+    monkeypatch.setattr(time, 'perf_counter', _clock.perf_counter)
+
+
+@pytest.mark.parametrize(('slow_visitor', 'budget', 'skipped'), [
+    (
+        _SlowNodeVisitor,
+        {'max_visitor_seconds': 1},
+        '_SlowNodeVisitor',
+    ),
+    (
+        _SlowTokenVisitor,
+        {'max_visitor_seconds': 1},
+        '_SlowTokenVisitor',
+    ),
+    (
+        _SlowNodeVisitor,
+        {'max_file_seconds': 1},
+        '_SlowNodeVisitor, SyncForLoopVisitor',
+    ),
+    (
+        _SlowNodeVisitor,
+        {'max_file_seconds': 20, 'max_visitor_seconds': 1},
+        '_SlowNodeVisitor',
+    ),
+])
+def test_skipped_visitors(options, slow_visitor, budget, skipped):
+    """Ensures that visitors out of time are stopped and reported."""
+    messages = _check(options(**budget), [slow_visitor, SyncForLoopVisitor])
+
+    assert messages == [
+        'WPS002 Found visitors that ran out of time: {0}'.format(skipped),
+    ]
+    # Time is checked after each thousand of visits:
+    assert _clock.seconds == pytest.approx(10)
+
+
+@pytest.mark.parametrize('budget', [
+    {},
+    {'max_file_seconds': 1000, 'max_visitor_seconds': 1000},
+])
+def test_enough_time(options, budget):
+    """Ensures that slow visitors are not stopped when they fit in."""
+    visitors = [_SlowNodeVisitor, _SlowTokenVisitor]
+
+    assert not _check(options(**budget), visitors)
+    assert _clock.seconds > _NUMBERS * _VISIT_SECONDS * 2
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import json
+import multiprocessing
+import os
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.tracing import create_trace_files
+
+_SOURCE = 'print(1)\n'
+
+_VISITORS_COUNT = len(Checker._visitors)  # noqa: WPS437
+
+
+def _check(options):
+    tokens = tokenize.generate_tokens(io.StringIO(_SOURCE).readline)
+    checker = Checker(
+        tree=ast.parse(_SOURCE),
+        file_tokens=list(tokens),
+        filename='module.py',
+        options=options,
+    )
+    return [message for _, _, message, _ in checker.run()]
+
+
+def _read_trace(trace_path):
+    trace = trace_path.read_text()
+    assert trace.startswith('[\n')
+    assert trace.endswith(',\n')
+    return json.loads('{0}]'.format(trace[:-2]))
+
+
+@pytest.mark.parametrize('checks_count', [1, 2])
+def test_trace_file(tmp_path, options, checks_count):
+    """Ensures that spans of files, transformations, and visitors exist."""
+    trace_path = tmp_path / 'trace.json'
+    option_values = options(trace_file=str(trace_path))
+    for _ in range(checks_count):
+        _check(option_values)
+
+    trace_events = _read_trace(trace_path)
+    categories = [trace_event['cat'] for trace_event in trace_events]
+
+    assert categories.count('file') == checks_count
+    assert categories.count('transform') == checks_count
+    assert categories.count('visitor') == checks_count * _VISITORS_COUNT
+    assert {trace_event['pid'] for trace_event in trace_events} == {
+        os.getpid(),
+    }
+    assert all(trace_event['dur'] >= 0 for trace_event in trace_events)
+
+
+def test_no_trace_file(tmp_path, monkeypatch, options):
+    """Ensures that nothing is written without the trace file."""
+    monkeypatch.chdir(tmp_path)
+
+    assert _check(options())
+    assert not list(tmp_path.iterdir())
+
+
+def test_create_trace_file(tmp_path, monkeypatch, options):
+    """Ensures that main process starts a new trace."""
+    trace_path = tmp_path / 'trace.json'
+    option_values = options(trace_file=str(trace_path))
+    monkeypatch.setattr(Checker, 'options', option_values, raising=False)
+    _check(option_values)
+
+    Checker.parse_options(option_values)
+    _check(option_values)
+
+    assert len(_read_trace(trace_path)) == _VISITORS_COUNT + 2
+
+
+def test_trace_in_job_process(tmp_path, monkeypatch, options):
+    """Ensures that job processes do not start a new trace."""
+    trace_path = tmp_path / 'trace.json'
+    trace_path.write_text('[\n{"cat": "file"},\n')
+    monkeypatch.setattr(
+        multiprocessing.current_process(), 'name', 'ForkPoolWorker-1',
+    )
+
+    create_trace_files(options(trace_file=str(trace_path)))
+
+    assert _read_trace(trace_path) == [{'cat': 'file'}]
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+from wemake_python_styleguide import checker as checker_module
+from wemake_python_styleguide.checker import Checker
+
+_FILENAMES = (
+    './tests/fixtures/noqa/noqa.py',
+    './tests/fixtures/formatter/formatter1.py',
+    './tests/fixtures/noqa/noqa.py',
+)
+
+
+def _check(filename: str, options):
+    with open(filename, 'rb') as source_file:
+        source = source_file.read()
+
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=list(tokenize.tokenize(io.BytesIO(source).readline)),
+        filename=filename,
+        options=options,
+    )
+    return list(checker.run())
+
+
+def _reset_pool(monkeypatch) -> None:
+    new_pool = checker_module._VisitorPool()  # noqa: WPS437
+    monkeypatch.setattr(checker_module, '_pool', new_pool)
+
+
+def test_visitors_are_reused(monkeypatch, default_options):
+    """Ensures that reused visitors report the same as new ones."""
+    expected = []
+    for filename in _FILENAMES:
+        _reset_pool(monkeypatch)
+        expected.append(_check(filename, default_options))
+
+    _reset_pool(monkeypatch)
+    reported = [_check(path, default_options) for path in _FILENAMES]
+    visitors = dict(checker_module._pool.visitors)  # noqa: WPS437
+    _check(_FILENAMES[0], default_options)
+
+    assert reported == expected
+    assert visitors == checker_module._pool.visitors  # noqa: WPS437
+
+
+def test_visitors_are_released(monkeypatch, default_options):
+    """Ensures that reused visitors do not keep the last checked file."""
+    _reset_pool(monkeypatch)
+    assert _check(_FILENAMES[0], default_options)
+
+    for visitor in checker_module._pool.visitors.values():  # noqa: WPS437
+        assert not visitor.violations
+        assert visitor.filename != _FILENAMES[0]
+        assert not getattr(visitor, 'file_tokens', None)
+        assert not getattr(visitor, 'tree', ast.Module(body=[])).body
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import signal
+
+import pytest
+
+from wemake_python_styleguide.cli import workers
+from wemake_python_styleguide.cli.application import ScheduledApplication
+
+
+@pytest.fixture()
+def runner_options(tmp_path):
+    """Returns options that are only supported by our runner."""
+    return ['--timing-cache', str(tmp_path / 'timings.json')]
+
+
+@pytest.fixture()
+def initialize_worker(tmp_path):
+    """Initializes current process the same way workers are initialized."""
+    def factory(*cli_options: str) -> None:
+        application = ScheduledApplication()
+        application.initialize([
+            '--isolated',
+            '--select',
+            'WPS',
+            '--timing-cache',
+            str(tmp_path / 'timings.json'),
+            *cli_options,
+        ])
+        manager = application.file_checker_manager
+        workers.initialize_process(manager.options, manager.get_checks())
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    return factory
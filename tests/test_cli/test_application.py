@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+End-to-End tests for our own runner.
+
+Its output must be the same as the ``flake8`` one.
+"""
+
+import json
+import os
+import runpy
+import subprocess
+import sys
+
+import pytest
+
+from wemake_python_styleguide.cli.application import ScheduledApplication
+
+#: Both fixtures have this number of violations in total.
+_VIOLATIONS = 8
+
+_FILENAMES = (
+    './tests/fixtures/formatter/formatter1.py',
+    './tests/fixtures/formatter/formatter2.py',
+)
+
+
+@pytest.mark.parametrize('cli_options', [
+    ['--jobs', '1'],
+    ['--jobs', '2'],
+    ['--jobs', '2', '--show-source', '--statistics'],
+    ['--jobs', '2', '--format', 'pylint'],
+])
+def test_same_output(capsys, runner_options, cli_options):
+    """Ensures that our runner shows the same output as ``flake8``."""
+    cli_options = ['--isolated', '--select', 'WPS', *cli_options]
+    process = subprocess.Popen(
+        ['flake8', *cli_options, *_FILENAMES],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf8',
+    )
+    expected, _ = process.communicate()
+
+    application = ScheduledApplication()
+    application.run([*cli_options, *runner_options, *_FILENAMES])
+
+    assert application.result_count == _VIOLATIONS
+    assert capsys.readouterr().out == expected
+
+
+def test_module_run(capsys, monkeypatch, runner_options):
+    """Ensures that runner can be executed as a module."""
+    monkeypatch.setattr(sys, 'argv', [
+        'wemake_python_styleguide',
+        '--isolated',
+        '--exit-zero',
+        *runner_options,
+        *_FILENAMES,
+    ])
+
+    runpy.run_module('wemake_python_styleguide', run_name='__main__')
+
+    assert 'WPS' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_baseline(capsys, tmp_path, runner_options, jobs):
+    """Ensures that violations from the written baseline are not reported."""
+    baseline_path = str(tmp_path / 'baseline')
+    clean_path = tmp_path / 'clean.py'
+    clean_path.write_text('"""Module without violations."""\n')
+    cli_options = ['--isolated', '--select', 'WPS', '--jobs', jobs]
+
+    application = ScheduledApplication()
+    application.run([
+        *cli_options,
+        *runner_options,
+        '--baseline-file',
+        str(tmp_path / 'missing'),
+        '--write-baseline',
+        baseline_path,
+        str(clean_path),
+        str(tmp_path / 'missing.py'),
+        *_FILENAMES,
+    ])
+    assert application.result_count == _VIOLATIONS
+    assert capsys.readouterr().out
+
+    application = ScheduledApplication()
+    application.run([
+        *cli_options,
+        *runner_options,
+        '--baseline-file',
+        baseline_path,
+        *_FILENAMES,
+    ])
+    assert not application.result_count
+    assert not capsys.readouterr().out
+
+
+def test_trace_file(tmp_path, runner_options):
+    """Ensures that all job processes write into the same trace file."""
+    trace_path = tmp_path / 'trace.json'
+
+    application = ScheduledApplication()
+    application.run([
+        '--isolated',
+        '--jobs',
+        '2',
+        '--trace-file',
+        str(trace_path),
+        *runner_options,
+        *_FILENAMES,
+    ])
+
+    trace_text = trace_path.read_text()
+    trace_events = json.loads('{0}]'.format(trace_text[:-2]))
+    file_events = [
+        trace_event
+        for trace_event in trace_events
+        if trace_event['cat'] == 'file'
+    ]
+    assert sorted(
+        trace_event['name'] for trace_event in file_events
+    ) == list(_FILENAMES)
+    assert os.getpid() not in {
+        trace_event['pid'] for trace_event in file_events
+    }
+
+
+def test_without_timing_cache(tmp_path, monkeypatch):
+    """Ensures that no files are written without the timing cache option."""
+    checked_path = tmp_path / 'checked.py'
+    checked_path.write_text('print(1)\n')
+    monkeypatch.chdir(tmp_path)
+
+    application = ScheduledApplication()
+    application.run(['--isolated', '--select', 'WPS', checked_path.name])
+
+    assert application.result_count == 1
+    assert list(tmp_path.iterdir()) == [checked_path]
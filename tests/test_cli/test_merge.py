@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+End-to-End tests for sharded runs and merged reports.
+
+Merged report must be the same as a single ``flake8`` run shows.
+"""
+
+import subprocess
+
+import pytest
+
+from wemake_python_styleguide.cli import merge
+from wemake_python_styleguide.cli.application import ScheduledApplication
+from wemake_python_styleguide.json_formatter import JSONLinesFormatter
+
+_FILENAMES = (
+    './tests/fixtures/formatter/formatter1.py',
+    './tests/fixtures/formatter/formatter2.py',
+)
+
+_CLI_OPTIONS = ('--isolated', '--select', 'WPS')
+
+
+def _run_shard(shard, output_file, runner_options):
+    application = ScheduledApplication()
+    application.run([
+        *_CLI_OPTIONS,
+        *runner_options,
+        '--shard',
+        shard,
+        '--output-file',
+        str(output_file),
+        *_FILENAMES,
+    ])
+    return application
+
+
+@pytest.fixture()
+def _jsonl_formatter(monkeypatch):
+    def factory(self, formatter_plugins=None):
+        self.formatter = JSONLinesFormatter(self.options)
+    monkeypatch.setattr(ScheduledApplication, 'make_formatter', factory)
+
+
+@pytest.mark.usefixtures('_jsonl_formatter')
+@pytest.mark.parametrize('shards', [1, 2, 3])
+@pytest.mark.parametrize('timing_cache', [True, False])
+def test_merged_statistics(
+    capsys,
+    tmp_path,
+    runner_options,
+    shards,
+    timing_cache,
+):
+    """Ensures that merged shards show the same output as ``flake8``."""
+    process = subprocess.Popen(
+        ['flake8', *_CLI_OPTIONS, '--format', 'wemake', '--statistics'] +
+        list(_FILENAMES),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        encoding='utf8',
+    )
+    expected, _ = process.communicate()
+
+    reports = []
+    for shard_number in range(1, shards + 1):
+        reports.append(str(tmp_path / 'shard{0}.jsonl'.format(shard_number)))
+        _run_shard(
+            '{0}/{1}'.format(shard_number, shards),
+            reports[-1],
+            runner_options if timing_cache else [],
+        )
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit, match='^1$'):
+        merge.main(['--statistics', *reports])
+
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.usefixtures('_jsonl_formatter')
+def test_merged_jsonl(capsys, tmp_path, runner_options):
+    """Ensures that merged shards can be formatted with other formatters."""
+    report = tmp_path / 'shard.jsonl'
+    _run_shard('1/1', report, runner_options)
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit, match='^0$'):
+        merge.main(['--format', 'wemake-jsonl', '--exit-zero', str(report)])
+
+    assert capsys.readouterr().out == report.read_text()
+
+
+def test_wrong_shard(capsys, tmp_path, runner_options):
+    """Ensures that wrong shards are reported."""
+    application = _run_shard('3/2', tmp_path / 'shard.jsonl', runner_options)
+
+    assert application.catastrophic_failure
+    assert 'Shard must look like 1/4, got: 3/2' in capsys.readouterr().out
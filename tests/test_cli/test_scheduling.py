@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide.cli import scheduling
+
+_TIMING = ('module.py', 100, 1.0)
+
+
+@pytest.mark.parametrize('cache_content', [
+    '',
+    '[]',
+    '{"module.py": 1}',
+    '{"module.py": []}',
+])
+def test_broken_cache(tmp_path, cache_content):
+    """Ensures that broken cache files are treated as empty ones."""
+    cache_file = tmp_path / 'timings.json'
+    cache_file.write_text(cache_content)
+
+    cache = scheduling.TimingCache(str(cache_file))
+
+    assert not cache.timings
+
+
+@pytest.mark.parametrize(('filename', 'size', 'estimate'), [
+    ('module.py', 100, 1.0),
+    ('module.py', 201, 2.0),
+    ('other.py', 50, 0.5),
+])
+def test_cache_round_trip(tmp_path, filename, size, estimate):
+    """Ensures that timings are saved and used for estimates."""
+    cache_file = str(tmp_path / 'timings.json')
+    cache = scheduling.TimingCache(cache_file)
+    cache.record(*_TIMING)
+    cache.save()
+
+    cache = scheduling.TimingCache(cache_file)
+
+    assert cache.timings == {_TIMING[0]: _TIMING[1:]}
+    assert cache.estimate(filename, size) == estimate
+
+
+def test_disabled_cache(tmp_path):
+    """Ensures that cache can be disabled and can not fail."""
+    cache = scheduling.TimingCache('')
+    cache.record(*_TIMING)
+    cache.save()
+
+    broken = scheduling.TimingCache(str(tmp_path))
+    broken.save()
+
+    assert scheduling.get_size(str(tmp_path / 'missing.py')) == 0
+
+
+def test_make_batches():
+    """Ensures that expensive files go first and are checked alone."""
+    cache = scheduling.TimingCache('')
+    filenames = ['small.py', 'large.py', 'medium.py', 'other.py']
+
+    batches = scheduling.make_batches(filenames, [1, 100, 10, 1], cache, 1)
+
+    assert batches == [
+        [(1, 'large.py')],
+        [(2, 'medium.py'), (3, 'other.py'), (0, 'small.py')],
+    ]
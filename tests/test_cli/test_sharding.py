@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from wemake_python_styleguide.cli import scheduling, sharding
+
+#: Sizes of files in bytes, that are split by their hashes.
+_SIZES = (0, 10, 100, 20, 30, 100, 0, 50, 40, 60)
+
+#: Files with their check time in seconds.
+_TIMINGS = (
+    ('a.py', 1.0),
+    ('b.py', 5.0),
+    ('c.py', 3.0),
+    ('d.py', 3.0),
+    ('e.py', 2.0),
+    ('f.py', 2.0),
+    ('g.py', 4.0),
+)
+
+
+def _make_cache():
+    timing_cache = scheduling.TimingCache('')
+    for filename, seconds in _TIMINGS:
+        timing_cache.record(filename, 0, seconds)
+    return timing_cache
+
+
+@pytest.mark.parametrize(('shard', 'expected'), [
+    ('1/1', (0, 1)),
+    ('1/4', (0, 4)),
+    ('4/4', (3, 4)),
+])
+def test_parse_shard(shard, expected):
+    """Ensures that shards are numbered from one."""
+    assert sharding.parse_shard(shard) == expected
+
+
+@pytest.mark.parametrize('shard', ['', '0/4', '5/4', '1/0', '-1/4', '1/4/2'])
+def test_wrong_shard(shard):
+    """Ensures that wrong shards are not used."""
+    with pytest.raises(ValueError, match='Shard must look like 1/4'):
+        sharding.parse_shard(shard)
+
+
+@pytest.mark.parametrize(('shard_index', 'expected'), [
+    (0, ['b.py', 'f.py']),
+    (1, ['a.py', 'e.py', 'g.py']),
+    (2, ['c.py', 'd.py']),
+])
+def test_select_shard(shard_index, expected):
+    """Ensures that shards are balanced by their expected cost."""
+    filenames = [filename for filename, _ in _TIMINGS]
+    cache = _make_cache()
+
+    assert sharding.select_shard(filenames, cache, shard_index, 3) == expected
+
+
+@pytest.mark.parametrize('shards', [1, 2, 3, 10])
+def test_stable_shards(shards):
+    """Ensures that each file is in one shard despite the files order."""
+    filenames = [filename for filename, _ in _TIMINGS]
+    cache = _make_cache()
+    reversed_filenames = list(reversed(filenames))
+
+    selected = [
+        filename
+        for shard_index in range(shards)
+        for filename in sharding.select_shard(
+            filenames, cache, shard_index, shards,
+        )
+        if filename in sharding.select_shard(
+            reversed_filenames, cache, shard_index, shards,
+        )
+    ]
+
+    assert sorted(selected) == filenames
+
+
+def _make_files(directory):
+    filenames = []
+    for index, size in enumerate(_SIZES):
+        filename = directory / 'module{0}.py'.format(index)
+        filename.write_text('#' * size)
+        filenames.append(str(filename))
+    return filenames
+
+
+@pytest.mark.parametrize('shards', [1, 2, 3, 10, 20])
+def test_hashed_shards(tmp_path, shards):
+    """Ensures that each file is in one shard despite its path spelling."""
+    filenames = _make_files(tmp_path)
+    other_paths = _make_files(tmp_path / '..' / tmp_path.name)[::-1]
+
+    selected = [
+        sharding.select_shard(filenames, None, shard_index, shards)
+        for shard_index in range(shards)
+    ]
+    other_selected = [
+        sharding.select_shard(other_paths, None, shard_index, shards)
+        for shard_index in range(shards)
+    ]
+    shard_sizes = [
+        sum(map(os.path.getsize, shard_files))
+        for shard_files in selected
+    ]
+
+    assert sorted(sum(selected, [])) == filenames
+    assert list(map(sorted, selected)) == [
+        sorted(map(os.path.normpath, shard_files))
+        for shard_files in other_selected
+    ]
+    assert max(shard_sizes) - min(shard_sizes) <= max(_SIZES)
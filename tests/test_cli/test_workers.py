@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide.cli import workers
+
+_FILENAME = './tests/fixtures/formatter/formatter1.py'
+
+
+@pytest.mark.parametrize(('cli_options', 'has_lines'), [
+    ([], False),
+    (['--show-source'], True),
+])
+def test_check_batch(initialize_worker, cli_options, has_lines):
+    """Ensures that physical lines are only kept to show the source."""
+    initialize_worker(*cli_options)
+
+    file_report = workers.check_batch([(1, _FILENAME)])[0]
+
+    assert file_report.index == 1
+    assert file_report.should_process
+    assert file_report.results
+    assert all(
+        has_lines == (physical_line is not None)
+        for *_, physical_line in file_report.results
+    )
+
+
+def test_ignored_file(initialize_worker, tmp_path):
+    """Ensures that ignored files are not checked."""
+    filename = tmp_path / 'ignored.py'
+    filename.write_text('# flake8: noqa\nprint(1)\n')
+    initialize_worker()
+
+    file_report = workers.check_batch([(0, str(filename))])[0]
+
+    assert not file_report.should_process
+    assert not file_report.results
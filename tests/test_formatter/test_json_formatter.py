@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import json
+from argparse import Namespace
+
+import pytest
+from flake8.main.application import Application
+from flake8.style_guide import Violation
+
+from wemake_python_styleguide.json_formatter import (
+    JSONLinesFormatter,
+    SARIFFormatter,
+)
+
+_LONG_LINE_COLUMN = 80
+
+_FILENAME = './tests/fixtures/formatter/formatter1.py'
+
+_VIOLATIONS = (
+    Violation(
+        'WPS211', 'first.py', 2, 1, 'Found too many arguments: 6 > 5', None,
+    ),
+    Violation(
+        'E501',
+        'first.py',
+        3,
+        _LONG_LINE_COLUMN,
+        'line too long (81 > 79)',
+        None,
+    ),
+    Violation(
+        'WPS102', 'second.py', 0, 1, 'Found incorrect module name', None,
+    ),
+)
+
+
+def _format(formatter_class, violations, output_file) -> str:
+    formatter = formatter_class(Namespace(
+        output_file=str(output_file),
+        show_source=True,
+        tee=False,
+    ))
+    formatter.start()
+    for violation in violations:
+        formatter.beginning(violation.filename)
+        formatter.handle(violation)
+        formatter.finished(violation.filename)
+    formatter.stop()
+    return output_file.read_text()
+
+
+def test_json_lines(tmp_path):
+    """Ensures that each violation is a separate JSON object."""
+    output = _format(JSONLinesFormatter, _VIOLATIONS, tmp_path / 'out.jsonl')
+
+    assert [json.loads(line) for line in output.splitlines()] == [
+        {
+            'filename': 'first.py',
+            'line': 2,
+            'column': 1,
+            'code': 'WPS211',
+            'message': 'Found too many arguments: 6 > 5',
+            'baseline': 5,
+        },
+        {
+            'filename': 'first.py',
+            'line': 3,
+            'column': _LONG_LINE_COLUMN,
+            'code': 'E501',
+            'message': 'line too long (81 > 79)',
+            'baseline': None,
+        },
+        {
+            'filename': 'second.py',
+            'line': 0,
+            'column': 1,
+            'code': 'WPS102',
+            'message': 'Found incorrect module name',
+            'baseline': None,
+        },
+    ]
+
+
+def test_sarif(tmp_path):
+    """Ensures that all violations are in a single SARIF document."""
+    output = _format(SARIFFormatter, _VIOLATIONS, tmp_path / 'out.sarif')
+    sarif_run = json.loads(output)['runs'][0]
+
+    assert sarif_run['tool']['driver']['name'] == 'wemake-python-styleguide'
+    assert [sarif['ruleId'] for sarif in sarif_run['results']] == [
+        'WPS211', 'E501', 'WPS102',
+    ]
+    assert sarif_run['results'][0] == {
+        'ruleId': 'WPS211',
+        'message': {'text': 'Found too many arguments: 6 > 5'},
+        'locations': [{
+            'physicalLocation': {
+                'artifactLocation': {'uri': 'first.py'},
+                'region': {'startLine': 2, 'startColumn': 1},
+            },
+        }],
+        'properties': {'baseline': 5},
+    }
+    module_location = sarif_run['results'][2]['locations'][0]
+    assert 'region' not in module_location['physicalLocation']
+
+
+def test_no_violations(tmp_path):
+    """Ensures that output is valid without violations."""
+    sarif_output = _format(SARIFFormatter, [], tmp_path / 'out.sarif')
+
+    assert not _format(JSONLinesFormatter, [], tmp_path / 'out.jsonl')
+    assert not json.loads(sarif_output)['runs'][0]['results']
+
+
+@pytest.mark.parametrize(('formatter_class', 'loads'), [
+    (JSONLinesFormatter, lambda output: list(
+        map(json.loads, output.splitlines()),
+    )),
+    (SARIFFormatter, lambda output: json.loads(output)['runs'][0]['results']),
+])
+def test_statistics(monkeypatch, tmp_path, formatter_class, loads):
+    """Ensures that statistics and benchmarks do not break the output."""
+    def factory(application, formatter_plugins=None):
+        application.formatter = formatter_class(application.options)
+
+    monkeypatch.setattr(Application, 'make_formatter', factory)
+    output_file = tmp_path / 'output'
+    Application().run([
+        '--isolated',
+        '--select',
+        'WPS',
+        '--statistics',
+        '--benchmark',
+        '--output-file',
+        str(output_file),
+        _FILENAME,
+    ])
+
+    assert loads(output_file.read_text())
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import ast
+from textwrap import dedent
+
+from wemake_python_styleguide.logic import aggregates
+
+module_source = """
+if (
+    first and second or
+    third
+):
+    self.profiler._store[cache_id].some()()
+"""
+
+
+def test_subtree_lines_and_boolops(parse_ast_tree):
+    """Ensures that aggregates are collected from whole subtrees."""
+    condition = parse_ast_tree(module_source).body[0]
+
+    assert aggregates.get_max_line(condition.test) == 4
+    assert aggregates.get_max_line(condition) == 6
+    assert aggregates.count_boolops(condition.test) == 2
+    assert aggregates.count_boolops(condition.body[0]) == 0
+
+
+def test_subtree_heights(parse_ast_tree):
+    """Ensures that heights count the longest path down from a node."""
+    condition = parse_ast_tree(module_source).body[0]
+
+    assert aggregates.get_height(condition.test) == 4
+    assert aggregates.get_height(condition.test.values[1]) == 2
+    assert aggregates.get_height(condition.test.op) == 1
+
+
+def test_chain_lengths(parse_ast_tree):
+    """Ensures that calls and accesses are counted in separate chains."""
+    condition = parse_ast_tree(module_source).body[0]
+    expression = condition.body[0].value
+
+    assert aggregates.get_chain_length(expression) == 2
+    assert aggregates.get_chain_length(expression.func.func) == 4
+    assert aggregates.get_chain_length(condition) == 0
+
+
+def test_without_table():
+    """Ensures that subtrees without active tables are aggregated as well."""
+    condition = ast.parse(dedent(module_source)).body[0]
+
+    assert aggregates.get_max_line(condition) == 6
+    assert aggregates.count_boolops(condition.test) == 2
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from wemake_python_styleguide.logic.tree.classes import get_summary
+
+class_source = """
+class Example(object):
+    __slots__ = ('field',)
+    attribute: int
+
+    def __init__(self):
+        self.field = 1
+
+        def nested():
+            ...
+
+    if condition:
+        def conditional(self):
+            self.other.field = 2
+
+    class Nested(object):
+        def method(self):
+            ...
+"""
+
+
+def test_class_summary(parse_ast_tree):
+    """Ensures that class summary contains only own members."""
+    module = parse_ast_tree(class_source)
+    summary = get_summary(module.body[0])
+
+    assert [method.name for method in summary.methods] == [
+        '__init__', 'conditional',
+    ]
+    assert len(summary.assigns) == 2
+    assert summary.slots == summary.assigns[:1]
+    assert [
+        attribute.attr for attribute in summary.instance_attributes
+    ] == ['field', 'field']
+    assert get_summary(module.body[0]) is summary
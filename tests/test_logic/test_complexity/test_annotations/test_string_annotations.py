@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logic.complexity import annotations
+
+
+def test_parsed_annotations_are_shared():
+    """Ensures that the same string annotations are parsed only once."""
+    parsed = annotations.parse_annotation('Optional[User]')
+
+    assert isinstance(parsed, ast.Subscript)
+    assert annotations.parse_annotation('Optional[User]') is parsed
+
+
+@pytest.mark.parametrize(('annotation', 'complexity'), [
+    ('int', 1),
+    ('List[int]', 2),
+    ('Tuple[List[Optional[str]], int]', 4),
+])
+def test_string_annotation_complexity(annotation, complexity):
+    """Ensures that string annotations have the same complexity as nodes."""
+    string_node = ast.Str(s=annotation)
+    expression = ast.parse(annotation).body[0].value
+
+    assert annotations.get_annotation_compexity(string_node) == complexity
+    assert annotations.get_annotation_compexity(expression) == complexity
@@ -8,6 +8,10 @@ Adapted from https://github.com/Melevir/cognitive_complexity
 
 import pytest
 
+from wemake_python_styleguide.logic.complexity import cognitive
+
+_DEPTH = 5000
+
 complexity1_1 = """
 def f(a, b):
     if a:  # +1
@@ -176,3 +180,12 @@ def test_cognitive_complexity(
 ):
     """Ensures that cognitive complexity count is correct."""
     assert get_code_snippet_compexity(mode(code)) == complexity
+
+
+def test_deeply_nested_complexity(parse_ast_tree):
+    """Ensures that deeply nested expressions do not hit recursion limit."""
+    code = 'def f(a):\n    if {0}:  # +1\n        return 1\n'.format(
+        ' + '.join('a' for _ in range(_DEPTH)),
+    )
+    funcdef = parse_ast_tree(code, do_compile=False).body[0]
+    assert cognitive.cognitive_score(funcdef) == 1
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import sys
+
+from wemake_python_styleguide.logic.evaluation import evaluate
+
+
+def test_deeply_nested_literals():
+    """Ensures that deeply nested literals are evaluated without recursion."""
+    depth = sys.getrecursionlimit() * 3
+    node = ast.Num(n=1)
+    for _ in range(depth):
+        nested = ast.List(elts=[node])
+        node = ast.Dict(keys=[ast.Num(n=0)], values=[nested])
+
+    evaluated = evaluate(node, strict=True)
+    for _ in range(depth):
+        evaluated = evaluated[0][0]
+
+    assert evaluated == 1
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logic.safe_eval import get_literal_mark
+
+
+@pytest.mark.parametrize('code', [
+    '1',
+    '-1.5',
+    '1 + 2j',
+    '(1, "a", None)',
+    '[1, [2, (3,)]]',
+    '{1, (2, b"3")}',
+    '{"a": [1], (1, 2): {3}}',
+])
+def test_literal_values(parse_ast_tree, code):
+    """Ensures that marked values are the same as literal_eval returns."""
+    node = parse_ast_tree(code).body[0].value
+    mark = get_literal_mark(node)
+
+    assert mark.has_value
+    assert mark.value == ast.literal_eval(code)
+
+
+@pytest.mark.parametrize(('code', 'has_named_value'), [
+    ('{[1], 2}', False),
+    ('{[name]: 1}', False),
+    ('{(1, [2])}', False),
+    ('{**other}', False),
+    ('[name, (1, name)]', True),
+    ('{name: 1}', True),
+])
+def test_not_literal_values(parse_ast_tree, code, has_named_value):
+    """Ensures that names and unhashable items are not evaluated."""
+    node = parse_ast_tree(code).body[0].value
+    mark = get_literal_mark(node)
+
+    assert mark is None or not mark.has_value
+    assert has_named_value is (mark is not None and mark.has_named_value)
+
+
+def test_named_values(parse_ast_tree):
+    """Ensures that names are evaluated as strings only in named values."""
+    node = parse_ast_tree('[name, (1, 2)]').body[0].value
+    mark = get_literal_mark(node)
+
+    assert mark.named_value == ['name', (1, 2)]
+    assert mark.value != mark.named_value
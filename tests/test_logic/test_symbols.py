@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+from wemake_python_styleguide.logic.scopes import symbols
+from wemake_python_styleguide.logic.walk import get_subtree
+
+module_source = """
+import os
+
+def function(arg):
+    for index in arg:
+        print(index)
+    with open(arg) as (first, second):
+        ...
+"""
+
+
+def test_symbol_table_bindings(parse_ast_tree):
+    """Ensures that bindings are collected in visiting order."""
+    module = parse_ast_tree(module_source)
+    import_node, function = module.body
+    table = symbols.get_symbols(module)
+
+    assert [binding.names for binding in table.bindings] == [
+        ('os',),
+        ('function',),
+        ('arg',),
+        ('index',),
+        ('first', 'second'),
+    ]
+    assert symbols.get_binding(import_node.names[0]).node is import_node
+    assert symbols.get_scope(function).outer is symbols.get_scope(module)
+    assert list(symbols.get_scope(function).uses) == [
+        'arg', 'print', 'index', 'open',
+    ]
+
+
+def test_symbol_table_lookup(parse_ast_tree):
+    """Ensures that lookup finds only bindings defined before usage."""
+    module = parse_ast_tree('x\nx = 1\nx')
+    first_usage = module.body[0].value
+    second_usage = module.body[2].value
+
+    assert not symbols.lookup(first_usage)
+    assert [
+        binding.node for binding in symbols.lookup(second_usage)
+    ] == [module.body[1]]
+
+
+header_source = """
+@decorator
+class Test(Base, metaclass=Meta):
+    @decorator
+    def method(self, arg: Annotation = default, *, other=default) -> Result:
+        return lambda first=default: first + arg
+"""
+
+
+def test_header_scopes(parse_ast_tree):
+    """Ensures that definitions' headers belong to the outer scope."""
+    module = parse_ast_tree(header_source)
+    class_def = module.body[0]
+    method = class_def.body[0]
+
+    assert set(symbols.get_scope(module).uses) == {
+        'decorator', 'Base', 'Meta',
+    }
+    assert set(symbols.get_scope(class_def).uses) == {
+        'decorator', 'Annotation', 'default', 'Result',
+    }
+    assert set(symbols.get_scope(method).uses) == {'default', 'first', 'arg'}
+    assert not symbols.lookup(method.args.defaults[0])
+
+
+def test_subtree_without_table():
+    """Ensures that subtrees are returned in depth-first order."""
+    module = ast.parse('x = y + z')
+
+    assert [
+        node.id for node in get_subtree(module) if isinstance(node, ast.Name)
+    ] == ['x', 'y', 'z']
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.logic.nodes import get_context, get_parent
+from wemake_python_styleguide.transformations.ast_tree import transform
+
+
+def test_nodes_without_table():
+    """Ensures that nodes without active tables do not have annotations."""
+    module = ast.parse('def function(): ...')
+    function = module.body[0]
+
+    assert get_parent(function) is None
+    assert get_context(function) is None
+    assert tables.get_annotation(function, 'literal') is None
+    with pytest.raises(LookupError):
+        tables.get_table(module)
+
+
+def test_table_annotations(parse_ast_tree):
+    """Ensures that tables store parents, contexts, and annotations."""
+    module = parse_ast_tree('def function(): ...')
+    function = module.body[0]
+    table = tables.get_table(module)
+    parse_ast_tree('other = 1')  # tables of other trees might be active
+
+    assert get_parent(function) is module
+    assert get_context(function.body[0]) is function
+    assert table.annotation(table.index(function), 'missing') is None
+
+
+def test_transform_keeps_no_tables():
+    """Ensures that tables are active only while transformations run."""
+    module = ast.parse('x = [1, 2]')
+    assign = module.body[0]
+    table = tables.NodeTable(module)
+
+    transform(module, table)
+
+    assert get_parent(assign) is None
+    with table:
+        with table:
+            assert get_parent(assign) is module
+        assert get_parent(assign) is module
+    assert get_parent(assign) is None
+
+    with table:
+        tables.drop(table)
+    assert table.index(assign) == -1
+
+
+def test_table_drop(parse_ast_tree):
+    """Ensures that dropped tables release all nodes."""
+    module = parse_ast_tree('x = 1')
+    table = tables.get_table(module)
+
+    assert get_parent(module.body[0]) is module
+    tables.drop(table)
+
+    assert not table.nodes
+    assert get_parent(module.body[0]) is None
+
+    tables.drop(table)  # dropping twice is fine
+    assert table.index(module) == -1
+
+
+def test_checker_without_run(default_options):
+    """Ensures that checkers do not keep tables active until they run."""
+    module = ast.parse('x = 1')
+    Checker(tree=module, file_tokens=[], options=default_options)
+
+    assert tables.find(module) == (None, -1)
@@ -5,6 +5,7 @@ import ast
 from pyflakes.checker import Checker as PyFlakesChecker
 
 from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.logic.nodes import get_parent
 
 code_that_brakes = '''
 def current_session(
@@ -44,11 +45,13 @@ def test_regression112(default_options):
     Checker.parse_options(default_options)
 
     # Now we create modifications to the tree:
-    Checker(tree=module, file_tokens=[], filename='custom.py')
+    checker = Checker(tree=module, file_tokens=[], filename='custom.py')
 
     # It was failing on this line:
     # AttributeError: 'ExceptHandler' object has no attribute 'depth'
     flakes = PyFlakesChecker(module)
 
-    assert module.wps_context is None  # augmentation happened!
+    # Annotations are not stored in nodes, they are active only for checks:
+    assert get_parent(module.body[0]) is None
     assert flakes.root
+    assert list(checker.run())
@@ -2,12 +2,24 @@
 
 import ast
 
+from typing_extensions import final
+
 from wemake_python_styleguide.violations.base import ASTViolation
 
 
+@final
+class _TestViolation(ASTViolation):
+    error_template = '{0}'
+    code = 1
+
+
 def test_visitor_returns_location():
     """Ensures that `BaseNodeVisitor` return correct violation message."""
-    visitor = ASTViolation(node=ast.parse(''), text='violation')
-    visitor.error_template = '{0}'
-    visitor.code = 1
-    assert visitor.node_items() == (0, 0, 'WPS001 violation')
+    violation = _TestViolation(node=ast.parse(''), text='violation')
+    assert violation.node_items() == (0, 0, 'WPS001 violation')
+
+
+def test_violations_are_compact(all_violations):
+    """Ensures that violations do not have instance dictionaries."""
+    for violation_class in all_violations:
+        assert not violation_class.__dictoffset__  # noqa: WPS609
@@ -147,6 +147,15 @@ class First(object):
         ...
 """
 
+correct_decorator_lambda = """
+@parametrize(lambda first: first)
+def test(first):
+    ...
+
+def other(first):
+    ...
+"""
+
 # Wrong:
 
 import_overlap1 = """
@@ -254,6 +263,7 @@ def func():
     correct_class2,
     correct_class3,
     correct_class4,
+    correct_decorator_lambda,
 ])
 def test_variable_used_correctly(
     assert_errors,
@@ -56,6 +56,8 @@ def test_useless_len_call(
     'len(some) < 4',
     'len(some) == 10',
     'len(some) != 6',
+    'len(some) > --0',
+    'len(some) == ~1',
     'ye >= len(str(emax))',
     '8 < len(call())',
     'len(str(abs(yc*xe))) <= -ye',
@@ -91,6 +91,16 @@ class First(object):
     async def method2(cls): ...
 """
 
+class_with_conditional_methods = """
+class First(object):
+    def method(self): ...
+
+    if sys.version_info >= (3, 8):
+        def method2(self): ...
+    else:
+        def method2(self): ...
+"""
+
 
 @pytest.mark.parametrize('code', [
     module_without_methods,
@@ -146,3 +156,18 @@ def test_method_counts_violation(
 
     assert_errors(visitor, [TooManyMethodsViolation])
     assert_error_text(visitor, '2', option_values.max_methods)
+
+
+def test_conditional_methods_are_not_counted(
+    assert_errors,
+    parse_ast_tree,
+    options,
+):
+    """Testing that methods inside ``if`` blocks are not counted."""
+    tree = parse_ast_tree(class_with_conditional_methods)
+
+    option_values = options(max_methods=1)
+    visitor = MethodMembersVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
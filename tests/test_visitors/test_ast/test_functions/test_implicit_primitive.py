@@ -25,6 +25,8 @@ from wemake_python_styleguide.visitors.ast.functions import (
     'lambda: b"a"',
     'lambda: (1, 2)',
     'lambda: name',
+    'lambda: -True',
+    'lambda: {[]}',
 ])
 def test_correct_lambda(
     assert_errors,
@@ -45,6 +47,8 @@ def test_correct_lambda(
     'lambda: 0',
     'lambda: 0.0',
     'lambda: 0j',
+    'lambda: -0',
+    'lambda: 0 + 0j',
     'lambda: b""',
     'lambda: ""',
     'lambda: []',
@@ -68,6 +68,31 @@ def logo_and_user():
     logo, __ = some_tuple()
 """
 
+correct_usage_before_definition = """
+def some_function():
+    print(_some)
+    _some = 1
+"""
+
+correct_nested_definition = """
+def some_function():
+    _some = 1
+
+    def inner():
+        _some = 2
+"""
+
+correct_reassigned_argument = """
+def some_function(_charset=None):
+    if _charset is None:
+        _charset = 'utf8'
+"""
+
+correct_argument_default = """
+def some_function(_some=_some):
+    _some = 1
+"""
+
 # Wrong:
 
 wrong_function1 = """
@@ -96,6 +121,23 @@ def some_function():
         print(_ex)
 """
 
+wrong_closure = """
+def some_function():
+    _some = calling()
+
+    def inner():
+        print(_some)
+"""
+
+wrong_nested_function = """
+def some_function():
+    _some = 1
+
+    def inner():
+        _some = 2
+        print(_some)
+"""
+
 wrong_method = """
 class Test(object):
     def some_method(self):
@@ -113,6 +155,10 @@ class Test(object):
     correct_function_with_unnamed_exception,
     correct_func_with_re_store_unused_variable1,
     correct_func_with_re_store_unused_variable2,
+    correct_usage_before_definition,
+    correct_nested_definition,
+    correct_reassigned_argument,
+    correct_argument_default,
 ])
 def test_correct_variables(
     assert_errors,
@@ -135,6 +181,8 @@ def test_correct_variables(
     wrong_function2,
     wrong_function_with_exception,
     wrong_function_with_with,
+    wrong_closure,
+    wrong_nested_function,
     wrong_method,
 ])
 def test_wrong_super_call(
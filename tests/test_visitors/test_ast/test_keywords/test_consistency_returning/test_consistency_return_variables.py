@@ -177,3 +177,24 @@ def test_double_wrong_return_variable(
         InconsistentReturnVariableViolation,
         InconsistentReturnVariableViolation,
     ])
+
+
+def test_reported_return_location(
+    assert_errors,
+    parse_ast_tree,
+    default_options,
+):
+    """Testing that the last `return` in breadth-first order is reported."""
+    tree = parse_ast_tree("""
+    def some_function():
+        some_value = 1
+        if condition:
+            return some_value
+        return some_value
+    """)
+
+    visitor = ConsistentReturningVariableVisitor(default_options, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [InconsistentReturnVariableViolation])
+    assert visitor.violations[0].node_items()[0] == 5
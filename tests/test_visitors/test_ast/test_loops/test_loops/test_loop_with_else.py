@@ -42,14 +42,38 @@ def wrapper():
         ...
 """
 
-wrong_multiple_breaks = """
+wrong_break_in_else = """
 def wrapper():
-    for x in 'zzz':
-        for i in range(10):
-            if i > 1:
-                break
+    for letters in ['abc', 'zxc', 'rrd']:
+        for x in letters:
+            ...
         else:
             break
+"""
+
+wrong_multiple_nested_for_with_break = """
+def wrapper():
+    for letters in ['abc', 'zxc', 'rrd']:
+        for x in letters:
+            break
+
+        for y in letters:
+            break
+
+        while letters:
+            break
+    else:
+        ...
+"""
+
+wrong_break_before_nested_loop = """
+def wrapper():
+    for letters in ['abc', 'zxc', 'rrd']:
+        for x in letters:
+            if x:
+                break
+        for y in letters:
+            ...
     else:
         ...
 """
@@ -71,28 +95,25 @@ def wrapper():
         ...
 """
 
-right_multiple_breaks = """
+right_break_in_nested_else = """
 def wrapper():
-    for x in 'xxx':
+    for x in 'zzz':
         for i in range(10):
             if i > 1:
                 break
-        break
+        else:
+            break
     else:
         ...
 """
 
-right_multiple_nested_for_with_break = """
+right_multiple_breaks = """
 def wrapper():
-    for letters in ['abc', 'zxc', 'rrd']:
-        for x in letters:
-            break
-
-        for y in letters:
-            break
-
-        while letters:
-            break
+    for x in 'xxx':
+        for i in range(10):
+            if i > 1:
+                break
+        break
     else:
         ...
 """
@@ -133,7 +154,9 @@ while x > 2:
     wrong_nested_else_in_for_loop,
     wrong_nested_for_with_break,
     wrong_nested_while_with_break,
-    wrong_multiple_breaks,
+    wrong_break_in_else,
+    wrong_multiple_nested_for_with_break,
+    wrong_break_before_nested_loop,
     wrong_while_without_break,
 ])
 def test_wrong_else_in_for_loop(
@@ -155,8 +178,8 @@ def test_wrong_else_in_for_loop(
 @pytest.mark.parametrize('code', [
     right_else_in_for_loop,
     right_nested_break_in_for_loop,
-    right_multiple_nested_for_with_break,
     right_multiple_breaks,
+    right_break_in_nested_else,
     right_nested_if_else,
     right_while_with_break,
     right_while_without_break_and_else,
@@ -28,6 +28,17 @@ while True:
     print(number)
 """
 
+correct_continue_in_loop_else = """
+def wrapper():
+    for number in [123]:
+        for digit in str(number):
+            if digit == '0':
+                break
+        else:
+            continue
+        print(number)
+"""
+
 # Wrong:
 
 wrong_for_loop = """
@@ -48,6 +59,13 @@ while True:
     continue
 """
 
+wrong_inner_loop = """
+def wrapper():
+    for number in [123]:
+        for digit in str(number):
+            continue
+"""
+
 wrong_nested_while_loop = """
 while True:
     if number == 0:
@@ -60,6 +78,7 @@ while True:
     wrong_nested_for_loop,
     wrong_while_loop,
     wrong_nested_while_loop,
+    wrong_inner_loop,
 ])
 def test_wrong_continue_in_loop(
     assert_errors,
@@ -80,6 +99,7 @@ def test_wrong_continue_in_loop(
 @pytest.mark.parametrize('code', [
     correct_for_loop,
     correct_while_loop,
+    correct_continue_in_loop_else,
 ])
 def test_correct_continue_usage(
     assert_errors,
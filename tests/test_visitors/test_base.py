@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import ast
 from unittest.mock import MagicMock
 
 from wemake_python_styleguide import constants
-from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseFilenameVisitor,
+    BaseNodeVisitor,
+)
+
+_DEPTH = 10000
 
 
 class _TestingFilenameVisitor(BaseFilenameVisitor):
@@ -11,6 +17,27 @@ class _TestingFilenameVisitor(BaseFilenameVisitor):
         """Overridden to satisfy abstract base class."""
 
 
+class _TestingNamesVisitor(BaseNodeVisitor):
+    def __init__(self, *args, **kwargs):
+        """Collects all visited names."""
+        super().__init__(*args, **kwargs)
+        self.names = []
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        """Stores the name and visits its children."""
+        self.names.append(node.id)
+        self.generic_visit(node)
+
+
+class _TestingStateVisitor(BaseNodeVisitor):
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        """Stores the name in the per-file state."""
+        self.names.append(node.id)
+
+    def _pre_visit(self) -> None:
+        self.names = []
+
+
 def test_base_filename_run_do_not_call_visit(default_options):
     """Ensures that `run()` does not call `visit()` method for stdin."""
     instance = _TestingFilenameVisitor(
@@ -21,3 +48,43 @@ def test_base_filename_run_do_not_call_visit(default_options):
     instance.run()
 
     instance.visit_filename.assert_not_called()
+
+
+def test_base_node_visit_order(default_options, parse_ast_tree):
+    """Ensures that `run()` visits nodes in the depth-first order."""
+    tree = parse_ast_tree('first(second, third[fourth]).fifth = sixth')
+    instance = _TestingNamesVisitor(default_options, tree=tree)
+    instance.run()
+
+    assert instance.names == [
+        'first', 'second', 'third', 'fourth', 'sixth',
+    ]
+
+
+def test_base_node_deep_nesting(default_options, parse_ast_tree):
+    """Ensures that `run()` does not hit recursion limit."""
+    tree = parse_ast_tree(
+        ' + '.join('name' for _ in range(_DEPTH)),
+        do_compile=False,  # compiler is recursive
+    )
+    instance = _TestingNamesVisitor(default_options, tree=tree)
+    instance.run()
+
+    assert len(instance.names) == _DEPTH
+
+
+def test_base_reset_drops_state(default_options, parse_ast_tree):
+    """Ensures that `reset()` drops state and `run()` creates it again."""
+    instance = _TestingStateVisitor(
+        default_options,
+        tree=parse_ast_tree('first = second'),
+    )
+    instance.run()
+    instance.reset()
+    instance.reset()
+
+    assert getattr(instance, 'names', None) is None
+
+    instance.run()
+
+    assert not instance.names
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+
+from wemake_python_styleguide.cli.application import main
+
+if __name__ == '__main__':
+    main()
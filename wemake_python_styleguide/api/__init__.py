@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+
+"""
+Public API to use our linter without ``flake8``.
+
+It is useful for editors, bots, and other tools
+that check a lot of small in-memory sources.
+See :mod:`wemake_python_styleguide.api.linting`.
+"""
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lints source code from ``asyncio`` code without blocking the event loop.
+
+Checks are executed in a process pool in several stages.
+Cheap ``tokenize`` based checks go first, then ``ast`` based ones:
+
+.. code:: python
+
+    report = await lint(source, filename, timeout=0.5)
+    if not report.is_complete:
+        ...  # only some stages were finished in time
+
+Stages are sent to the pool one by one.
+So, when the awaiting task is cancelled,
+for example because a newer version of the same document has arrived,
+all the stages that were not started yet are never executed.
+
+Each worker keeps the last checked document,
+so the source code is not parsed again for each stage.
+
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide import constants
+from wemake_python_styleguide.api.linting import (
+    LintViolation,
+    make_checker,
+    make_options,
+    report_violations,
+)
+from wemake_python_styleguide.checker import Checker, VisitorClass
+from wemake_python_styleguide.options.config import ConfigValuesTypes
+from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
+from wemake_python_styleguide.presets.types import filename as filename_preset
+from wemake_python_styleguide.presets.types import tree as tree_preset
+
+_Options = Optional[Mapping[str, ConfigValuesTypes]]
+
+_Stage = Tuple[VisitorClass, ...]
+
+#: Number of ``ast`` visitors that are executed in a single stage.
+_STAGE_SIZE: Final = 20
+
+
+def _split_stages(visitors: Sequence[VisitorClass]) -> Iterator[_Stage]:
+    visitors_iterator = iter(visitors)
+    stage = tuple(islice(visitors_iterator, _STAGE_SIZE))
+    while stage:
+        yield stage
+        stage = tuple(islice(visitors_iterator, _STAGE_SIZE))
+
+
+#: Visitors of each stage in the order they are executed.
+STAGES: Final = (
+    (*tokens_preset.PRESET, *filename_preset.PRESET),
+    *_split_stages(tree_preset.PRESET),
+)
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class LintReport(object):
+    """
+    Violations that were found in all finished stages.
+
+    ``is_complete`` is ``False`` when time budget was over
+    before all stages were finished.
+    """
+
+    violations: List[LintViolation]
+    is_complete: bool
+
+
+@final
+class _LastChecker(threading.local):
+    """Checker of the last document that was checked in this thread."""
+
+    def __init__(self) -> None:
+        self.key: Optional[Tuple[str, str, object]] = None
+        self.checker: Optional[Checker] = None
+
+    def get(self, source: str, filename: str, options: _Options) -> Checker:
+        key = (source, filename, make_options(options))
+        if self.checker is None or self.key != key:
+            if self.checker is not None:
+                self.checker.release()
+            self.checker = make_checker(*key)
+            self.key = key
+        return self.checker
+
+
+_last_checker: Final = _LastChecker()
+
+
+def check_stage(
+    source: str,
+    filename: str,
+    options: _Options,
+    stage: _Stage,
+) -> List[LintViolation]:
+    """Runs visitors of a single stage, it is executed by workers."""
+    checker = _last_checker.get(source, filename, options)
+    return report_violations(source, checker.run_visitors(stage))
+
+
+async def lint(
+    source: str,
+    filename: str = constants.STDIN,
+    options: _Options = None,
+    *,
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+) -> LintReport:
+    """
+    Checks the source code in background, stage by stage.
+
+    When ``timeout`` in seconds is over,
+    returns violations of the finished stages only.
+    All options are the same as
+    :func:`wemake_python_styleguide.api.linting.lint_source` has.
+    Shared process pool is used when ``executor`` is not passed.
+    """
+    loop = asyncio.get_event_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    violations: List[LintViolation] = []
+
+    for stage in STAGES:
+        time_left = None if deadline is None else deadline - loop.time()
+        if time_left is not None and time_left <= 0:
+            return _make_report(violations, is_complete=False)
+
+        try:
+            violations.extend(await asyncio.wait_for(
+                loop.run_in_executor(
+                    executor or _get_shared_executor(),
+                    check_stage,
+                    source,
+                    filename,
+                    options,
+                    stage,
+                ),
+                time_left,
+            ))
+        except asyncio.TimeoutError:
+            return _make_report(violations, is_complete=False)
+    return _make_report(violations, is_complete=True)
+
+
+def _make_report(
+    violations: Sequence[LintViolation],
+    *,
+    is_complete: bool,
+) -> LintReport:
+    return LintReport(
+        violations=sorted(violations, key=attrgetter('line_number', 'column')),
+        is_complete=is_complete,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_shared_executor() -> Executor:
+    return ProcessPoolExecutor()
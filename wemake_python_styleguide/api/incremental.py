@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks new versions of the same document incrementally.
+
+Editors check a document after each change,
+but a single change usually touches a single function.
+So, :class:`IncrementalLinter` stores violations
+of each top-level statement of the last version:
+
+.. code:: python
+
+    linter = IncrementalLinter('module.py')
+    violations = linter.lint(source)
+    violations = linter.lint(changed_source)  # only changes are checked
+
+A top-level statement is unchanged when its source lines are the same.
+It does not matter whether it was moved or not:
+cached violations are moved to the new location of the statement.
+
+Some visitors count things in the whole module,
+like module members, string overuses, or average complexity.
+They are listed in :data:`MODULE_VISITORS` and always check the whole tree.
+The same goes for ``tokenize`` and filename based visitors.
+The source code is parsed again for each version.
+
+Results are the same as
+:func:`wemake_python_styleguide.api.linting.lint_source` returns.
+"""
+
+import ast
+from collections import Counter
+from typing import Counter as CounterType
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide import constants, types
+from wemake_python_styleguide.api.linting import (
+    LintViolation,
+    make_checker,
+    make_options,
+    report_violations,
+)
+from wemake_python_styleguide.checker import Checker, TimeBudget, VisitorClass
+from wemake_python_styleguide.options.config import ConfigValuesTypes
+from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
+from wemake_python_styleguide.presets.types import filename as filename_preset
+from wemake_python_styleguide.presets.types import tree as tree_preset
+from wemake_python_styleguide.visitors.ast import (
+    blocks,
+    keywords,
+    modules,
+    statements,
+)
+from wemake_python_styleguide.visitors.ast.complexity import (
+    counts,
+    function,
+    jones,
+    overuses,
+)
+
+#: Column, source lines, and optional dump of a top-level statement.
+_DefinitionKey = Tuple[int, Tuple[str, ...], str]
+
+#: ``ast`` visitors that depend on several top-level statements.
+MODULE_VISITORS: Final = (
+    statements.StatementsWithBodiesVisitor,
+    keywords.GeneratorKeywordsVisitor,
+    modules.EmptyModuleContentsVisitor,
+    blocks.BlockVariableVisitor,
+    blocks.AfterBlockVariablesVisitor,
+    counts.ModuleMembersVisitor,
+    counts.ImportMembersVisitor,
+    jones.JonesComplexityVisitor,
+    function.CognitiveComplexityVisitor,
+    overuses.StringOveruseVisitor,
+    overuses.ExpressionOveruseVisitor,
+)
+
+_WHOLE_MODULE_VISITORS: Final = (
+    *filename_preset.PRESET,
+    *MODULE_VISITORS,
+    *tokens_preset.PRESET,
+)
+
+_Visitors = Tuple[VisitorClass, ...]
+
+
+def _exclude_module_visitors(visitors: Sequence[VisitorClass]) -> _Visitors:
+    return tuple(
+        visitor_class
+        for visitor_class in visitors
+        if visitor_class not in MODULE_VISITORS
+    )
+
+
+#: ``ast`` visitors that are executed for each changed top-level statement.
+_DEFINITION_VISITORS: Final = _exclude_module_visitors(tree_preset.PRESET)
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class _Definition(object):
+    statement: ast.stmt
+    first_line: int
+    key: _DefinitionKey
+
+
+@final
+class IncrementalLinter(object):
+    """
+    Checks versions of a single document and reuses unchanged results.
+
+    Options are the same as
+    :func:`wemake_python_styleguide.api.linting.lint_source` accepts.
+    """
+
+    def __init__(
+        self,
+        filename: str = constants.STDIN,
+        options: Optional[Mapping[str, ConfigValuesTypes]] = None,
+    ) -> None:
+        """Creates linter for a document, options are validated here."""
+        self.filename = filename
+        self.options = make_options(options)
+        self._definitions: Dict[_DefinitionKey, List[types.CheckResult]] = {}
+
+    def lint(self, source: str) -> List[LintViolation]:
+        """
+        Checks the new version of the document.
+
+        Only the results of the last version are stored,
+        so memory usage does not grow with the number of versions.
+        """
+        checker = make_checker(source, self.filename, self.options)
+        budget = TimeBudget(checker.options)
+        check_results = [
+            *checker.run_visitors(_WHOLE_MODULE_VISITORS, budget=budget),
+            *self._check_definitions(checker, source, budget),
+            *budget.get_violations(type(checker)),
+        ]
+        checker.release()
+        return report_violations(source, check_results)
+
+    def _check_definitions(
+        self,
+        checker: Checker,
+        source: str,
+        budget: TimeBudget,
+    ) -> List[types.CheckResult]:
+        definition_results = []
+        definitions = {}
+        for definition in _split_definitions(checker.tree, source):
+            relative_results = self._definitions.get(definition.key)
+            if relative_results is None:
+                relative_results, is_complete = self._check_definition(
+                    checker, definition, budget,
+                )
+            else:
+                is_complete = True
+
+            if is_complete:
+                definitions[definition.key] = relative_results
+            definition_results.append(_move(
+                relative_results, definition.first_line - 1,
+            ))
+
+        self._definitions = definitions
+        return self._merge_results(definition_results)
+
+    def _check_definition(
+        self,
+        checker: Checker,
+        definition: _Definition,
+        budget: TimeBudget,
+    ) -> Tuple[List[types.CheckResult], bool]:
+        skipped_count = len(budget.skipped)
+        relative_results = _move(
+            checker.run_visitors(
+                _DEFINITION_VISITORS, definition.statement, budget=budget,
+            ),
+            1 - definition.first_line,
+        )
+
+        # Results of visitors that failed or were out of time are not cached:
+        is_complete = len(budget.skipped) == skipped_count and all(
+            line_number for line_number, *_ in relative_results
+        )
+        return relative_results, is_complete
+
+    def _merge_results(
+        self,
+        definition_results: Iterable[List[types.CheckResult]],
+    ) -> List[types.CheckResult]:
+        # Each definition is checked by all visitors on its own,
+        # but a failed visitor is reported once for the whole module.
+        # So, we keep the largest number of the same system violations:
+        check_results: List[types.CheckResult] = []
+        system_results: CounterType[types.CheckResult] = Counter()
+        for relative_results in definition_results:
+            check_results.extend(
+                check_result
+                for check_result in relative_results
+                if check_result[0]
+            )
+            system_results |= Counter(
+                check_result
+                for check_result in relative_results
+                if not check_result[0]
+            )
+        return [*check_results, *system_results.elements()]
+
+
+def _split_definitions(tree: ast.AST, source: str) -> List[_Definition]:
+    lines = source.splitlines()
+    body = getattr(tree, 'body', [])
+    first_lines = [*map(_get_first_line, body), len(lines) + 1]
+
+    return [
+        _Definition(
+            statement=statement,
+            first_line=first_lines[index],
+            key=_make_key(
+                statement, lines, first_lines[index], first_lines[index + 1],
+            ),
+        )
+        for index, statement in enumerate(body)
+    ]
+
+
+def _get_first_line(statement: ast.stmt) -> int:
+    decorators = getattr(statement, 'decorator_list', [])
+    return min([
+        statement.lineno,
+        *(decorator.lineno for decorator in decorators),
+    ])
+
+
+def _make_key(
+    statement: ast.stmt,
+    lines: Sequence[str],
+    first_line: int,
+    next_line: int,
+) -> _DefinitionKey:
+    # Each statement owns all lines until the next one starts:
+    last_line = max(first_line, next_line - 1)
+    own_lines = list(lines[first_line - 1:last_line])
+    while len(own_lines) > 1 and not own_lines[-1].strip():
+        own_lines.pop()  # empty lines do not change anything
+
+    # Multiline strings report their last line before ``python3.8``,
+    # so lines of bare expressions might not contain all their source:
+    dump = ast.dump(statement) if isinstance(statement, ast.Expr) else ''
+    return (statement.col_offset, tuple(own_lines), dump)
+
+
+def _move(
+    check_results: Iterable[types.CheckResult],
+    lines_offset: int,
+) -> List[types.CheckResult]:
+    # System violations are reported for the whole module on line zero,
+    # they are not moved:
+    return [
+        (
+            line_number + lines_offset if line_number else line_number,
+            column,
+            message,
+            checker_type,
+        )
+        for line_number, column, message, checker_type in check_results
+    ]
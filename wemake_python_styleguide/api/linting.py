@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lints source code in the current process without ``flake8``.
+
+``flake8`` has to find plugins, parse options and configuration files,
+and create a new application for each run.
+This takes much more time than checking a small snippet itself.
+So, here we run our :class:`~wemake_python_styleguide.checker.Checker`
+directly:
+
+.. code:: python
+
+    >>> from wemake_python_styleguide.api.linting import lint_source
+    >>> lint_source('x = 1', options={'min_name_length': 1})
+    []
+
+Only our own violations are reported.
+Options are the same as :mod:`wemake_python_styleguide.options.config`
+provides, their names use underscores: ``max_returns``.
+
+Inline ``# noqa`` comments are respected the same way ``flake8`` does it.
+
+"""
+
+import ast
+import io
+import re
+import tokenize
+from operator import attrgetter
+from optparse import Values
+from typing import Iterable, List, Mapping, Optional, Sequence
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide import constants, types
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.options.config import (
+    Configuration,
+    ConfigValuesTypes,
+)
+from wemake_python_styleguide.options.validation import validate_options
+
+#: Option values that are used when nothing is passed.
+_DEFAULTS: Final = Configuration().get_defaults()
+
+#: Options that are used when no overrides are passed.
+_DEFAULT_OPTIONS: Final = validate_options(Values(_DEFAULTS))
+
+#: The same ``noqa`` comments that ``flake8`` supports.
+_NOQA: Final = re.compile(
+    r'# noqa(?::[\s]?(?P<codes>([A-Z]+[0-9]+(?:[,\s]+)?)+))?',
+    re.IGNORECASE,
+)
+
+#: Separates codes inside ``noqa`` comments.
+_CODES_SEPARATOR: Final = re.compile(r'[,\s]')
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class LintViolation(object):
+    """
+    Violation that was found in the source code.
+
+    Lines and columns start from ``1``, the same as ``flake8`` shows them.
+    """
+
+    code: str
+    line_number: int
+    column: int
+    text: str
+
+
+def make_options(
+    overrides: Optional[Mapping[str, ConfigValuesTypes]] = None,
+) -> types.ConfigurationOptions:
+    """
+    Creates validated options from default values and passed overrides.
+
+    Unknown option names and invalid values raise ``ValueError``.
+    Default options are created only once,
+    so checker can reuse its visitors for all calls without overrides.
+    """
+    if not overrides:
+        return _DEFAULT_OPTIONS
+
+    unknown_options = set(overrides).difference(_DEFAULTS)
+    if unknown_options:
+        raise ValueError('Unknown options: {0}'.format(
+            ', '.join(sorted(unknown_options)),
+        ))
+    return validate_options(Values({**_DEFAULTS, **overrides}))
+
+
+def lint_source(
+    source: str,
+    filename: str = constants.STDIN,
+    options: Optional[Mapping[str, ConfigValuesTypes]] = None,
+) -> List[LintViolation]:
+    """
+    Checks the source code and returns violations sorted by location.
+
+    Invalid source code raises ``SyntaxError``,
+    invalid options raise ``ValueError``.
+    """
+    checker = make_checker(source, filename, make_options(options))
+    return report_violations(source, checker.run())
+
+
+def make_checker(
+    source: str,
+    filename: str,
+    options: types.ConfigurationOptions,
+) -> Checker:
+    """Parses and tokenizes the source code to create a checker for it."""
+    return Checker(
+        tree=ast.parse(source, filename),
+        file_tokens=list(
+            tokenize.generate_tokens(io.StringIO(source).readline),
+        ),
+        filename=filename,
+        options=options,
+    )
+
+
+def report_violations(
+    source: str,
+    check_results: Iterable[types.CheckResult],
+) -> List[LintViolation]:
+    """Converts checker results to violations sorted by location."""
+    lines = source.splitlines()
+    return sorted(
+        (
+            violation
+            for violation in map(_make_violation, check_results)
+            if not _is_ignored(violation, lines)
+        ),
+        key=attrgetter('line_number', 'column'),
+    )
+
+
+def _make_violation(check_result: types.CheckResult) -> LintViolation:
+    line_number, column, message, _ = check_result
+    code, text = message.split(' ', 1)
+    return LintViolation(
+        code=code,
+        line_number=line_number,
+        column=column + 1,
+        text=text,
+    )
+
+
+def _is_ignored(violation: LintViolation, lines: Sequence[str]) -> bool:
+    if violation.line_number < 1 or violation.line_number > len(lines):
+        return False
+
+    noqa_match = _NOQA.search(lines[violation.line_number - 1])
+    if noqa_match is None:
+        return False
+
+    codes = noqa_match.group('codes')
+    if not codes:
+        return True
+    return violation.code.startswith(
+        tuple(filter(None, _CODES_SEPARATOR.split(codes))),
+    )
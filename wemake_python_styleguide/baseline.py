@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stores known violations, so only new ones are reported.
+
+New rules are hard to adopt in a large legacy project.
+So, all current violations can be saved into a baseline file:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide --write-baseline=.wps-baseline .
+
+And then only new violations are reported:
+
+.. code:: bash
+
+    flake8 --baseline-file=.wps-baseline .
+
+Each violation is identified by its fingerprint:
+its code, file name, name of the enclosing function or class,
+and tokens of the source line, comments and whitespace are not used.
+Line numbers are not used, so the baseline survives unrelated changes.
+Use the same paths to files both to write and to use the baseline.
+
+Baseline file is a hash table of fingerprints.
+It is memory-mapped, so it is not read into memory of each process,
+and each lookup takes constant time even with millions of fingerprints.
+"""
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import tokenize
+from collections import defaultdict
+from functools import lru_cache
+from typing import DefaultDict, Dict, Iterable, List, Sequence, Tuple
+
+from typing_extensions import Final, final
+
+#: Header of the baseline file: format marker and number of slots.
+_HEADER: Final = struct.Struct('<4sQ')
+_MAGIC: Final = b'WPS1'
+
+#: Each slot is a fingerprint, empty slots are zeros.
+_SLOT: Final = struct.Struct('<Q')
+
+_FINGERPRINT_SIZE: Final = _SLOT.size
+
+#: These tokens do not start logical lines.
+_NON_CODE_TOKENS: Final = frozenset((
+    tokenize.NL,
+    tokenize.COMMENT,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+))
+
+_DEFINITION_KEYWORDS: Final = frozenset(('def', 'class'))
+
+
+@final
+class Fingerprints(object):
+    """Calculates fingerprints of violations in a single file."""
+
+    def __init__(
+        self,
+        filename: str,
+        file_tokens: Sequence[tokenize.TokenInfo],
+    ) -> None:
+        """Finds all definitions and lines of a file once."""
+        self._filename = os.path.normpath(filename)
+        code_tokens = [
+            code_token
+            for code_token in file_tokens
+            if code_token.type not in _NON_CODE_TOKENS
+        ]
+        self._lines: DefaultDict[int, List[str]] = defaultdict(list)
+        for token in code_tokens:
+            self._lines[token.start[0]].append(token.string.strip())
+
+        # Lines before the first logical line are not in any definition:
+        self._line_starts = [0]
+        self._definitions = ['']
+        self._find_definitions(code_tokens)
+
+    def get(self, code: str, line_number: int) -> int:
+        """Returns fingerprint of a violation on the given line."""
+        line = ' '.join(filter(None, self._lines.get(line_number, [])))
+        index = bisect.bisect_right(self._line_starts, line_number) - 1
+        fingerprint = hashlib.blake2b(
+            '\0'.join((
+                code,
+                self._filename,
+                self._definitions[index],
+                line,
+            )).encode('utf8'),
+            digest_size=_FINGERPRINT_SIZE,
+        )
+        # Zero marks empty slots in the baseline file:
+        return int.from_bytes(fingerprint.digest(), 'little') or 1
+
+    def _find_definitions(self, code_tokens: List[tokenize.TokenInfo]) -> None:
+        # Module scope is never closed, since its column is negative:
+        scopes = [(-1, self._definitions[0])]
+        is_line_start = True
+        for index, token in enumerate(code_tokens):
+            if is_line_start:
+                while scopes[-1][0] >= token.start[1]:
+                    scopes.pop()
+                scopes.extend(_get_definition(code_tokens, index, scopes))
+                self._line_starts.append(token.start[0])
+                self._definitions.append(scopes[-1][1])
+            is_line_start = token.type == tokenize.NEWLINE
+
+
+@final
+class Baseline(object):
+    """Read-only hash table of known fingerprints."""
+
+    def __init__(self, filename: str) -> None:
+        """Maps the baseline file into memory, it must be a valid one."""
+        with open(filename, 'rb') as baseline_file:
+            self._table = mmap.mmap(
+                baseline_file.fileno(), 0, access=mmap.ACCESS_READ,
+            )
+
+        magic, slots = _HEADER.unpack(
+            self._table[:_HEADER.size].ljust(_HEADER.size, b'\0'),
+        )
+        if magic != _MAGIC or not _is_table_size(slots, len(self._table)):
+            raise ValueError('Baseline file is broken: {0}'.format(filename))
+        self._mask = slots - 1
+
+    def __contains__(self, fingerprint: int) -> bool:
+        """Tells whether the fingerprint is known."""
+        index = fingerprint & self._mask
+        for _ in range(self._mask + 1):
+            known = _SLOT.unpack_from(
+                self._table, _HEADER.size + index * _SLOT.size,
+            )[0]
+            if known == fingerprint:
+                return True
+            elif not known:
+                return False
+            index = (index + 1) & self._mask
+        return False
+
+
+@lru_cache(maxsize=1)
+def load_baseline(filename: str) -> Baseline:
+    """Returns baseline of the file, it is loaded once per process."""
+    return Baseline(filename)
+
+
+def write_baseline(filename: str, fingerprints: Iterable[int]) -> None:
+    """Writes all fingerprints into a new baseline file."""
+    known_fingerprints = sorted(set(fingerprints))
+    # Table is at most half full, so lookups stop at an empty slot soon:
+    slots = 1 << (len(known_fingerprints) * 2).bit_length()
+    table = _make_table(known_fingerprints, slots)
+
+    with open(filename, 'wb') as baseline_file:
+        baseline_file.write(_HEADER.pack(_MAGIC, slots))
+        baseline_file.write(struct.pack('<{0}Q'.format(slots), *table))
+
+
+def _get_definition(
+    code_tokens: List[tokenize.TokenInfo],
+    index: int,
+    scopes: List[Tuple[int, str]],
+) -> List[Tuple[int, str]]:
+    keyword_index = index + int(code_tokens[index].string == 'async')
+    definition = code_tokens[keyword_index:keyword_index + 2]
+    if len(definition) < 2 or definition[0].string not in _DEFINITION_KEYWORDS:
+        return []
+
+    parent_name = scopes[-1][1]
+    qualname = '{0}.{1}'.format(parent_name, definition[1].string)
+    return [(code_tokens[index].start[1], qualname.lstrip('.'))]
+
+
+def _make_table(fingerprints: Sequence[int], slots: int) -> List[int]:
+    table: Dict[int, int] = {}
+    for fingerprint in fingerprints:
+        index = fingerprint & (slots - 1)
+        while index in table:
+            index = (index + 1) & (slots - 1)
+        table[index] = fingerprint
+    return [table.get(index, 0) for index in range(slots)]
+
+
+def _is_table_size(slots: int, file_size: int) -> bool:
+    is_power_of_two = slots > 0 and not slots & (slots - 1)
+    return is_power_of_two and file_size == _HEADER.size + slots * _SLOT.size
@@ -26,6 +26,11 @@ That's how all ``flake8`` plugins work:
         F3         --> F4[__init__]
         F4	       --> F5[run]
 
+Checker instances do not share any per-file state.
+Options can be passed to each instance,
+so several files with different options
+can be checked at the same time in different threads.
+
 .. _checker:
 
 Checker API
@@ -36,20 +41,28 @@ Checker API
    :exclude-members: name, version, visitors, _run_checks
    :special-members: __init__
 
+.. autoclass:: TimeBudget
+   :no-undoc-members:
+
 """
 
 import ast
+import threading
+import time
 import tokenize
 import traceback
-from typing import ClassVar, Iterator, Sequence, Type
+from operator import attrgetter
+from typing import ClassVar, Dict, Iterator, List, Optional, Sequence, Type
 
 from flake8.options.manager import OptionManager
-from typing_extensions import final
+from typing_extensions import Final, final
 
-from wemake_python_styleguide import constants, types
+from wemake_python_styleguide import baseline, constants, tracing, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.logic import tables
 from wemake_python_styleguide.options.config import Configuration
 from wemake_python_styleguide.options.validation import validate_options
+from wemake_python_styleguide.presets import tiers
 from wemake_python_styleguide.presets.types import file_tokens as tokens_preset
 from wemake_python_styleguide.presets.types import filename as filename_preset
 from wemake_python_styleguide.presets.types import tree as tree_preset
@@ -60,6 +73,81 @@ from wemake_python_styleguide.visitors import base
 VisitorClass = Type[base.BaseVisitor]
 
 
+@final
+class _VisitorPool(threading.local):
+    """
+    Visitors that were created in the current thread with the same options.
+
+    Creating about a hundred visitors with their validators for each file
+    costs more than checking small files. So, visitors are reused:
+    they are only reset for the next file.
+    """
+
+    def __init__(self) -> None:
+        self.options: Optional[types.ConfigurationOptions] = None
+        self.visitors: Dict[VisitorClass, base.BaseVisitor] = {}
+
+    def get(self, visitor_class: VisitorClass, checker) -> base.BaseVisitor:
+        """Returns a visitor that is ready to check a file of the checker."""
+        if self.options is not checker.options:
+            # Each checker validates its own options, they are equal:
+            if self.options != checker.options:
+                self.visitors = {}
+            self.options = checker.options
+
+        visitor = self.visitors.get(visitor_class)
+        if visitor is None:
+            visitor = visitor_class.from_checker(checker)
+            self.visitors[visitor_class] = visitor
+        else:
+            visitor.reset(checker)
+        return visitor
+
+
+_pool: Final = _VisitorPool()
+
+
+@final
+class TimeBudget(object):
+    """
+    Time that is left to check a module and visitors out of time.
+
+    One budget can be shared by several calls of
+    :meth:`Checker.run_visitors` for the same file.
+    """
+
+    def __init__(self, options: types.ConfigurationOptions) -> None:
+        """Starts counting time of a file from now."""
+        self.file_deadline: Optional[float] = None
+        if options.max_file_seconds:
+            self.file_deadline = time.perf_counter() + options.max_file_seconds
+        self.visitor_seconds = options.max_visitor_seconds
+        self.skipped: List[str] = []
+
+    def get_deadline(self) -> Optional[float]:
+        """Returns the deadline of the next visitor, if there's any."""
+        if not self.visitor_seconds:
+            return self.file_deadline
+
+        visitor_deadline = time.perf_counter() + self.visitor_seconds
+        if self.file_deadline is None:
+            return visitor_deadline
+        return min(self.file_deadline, visitor_deadline)
+
+    def is_over(self, deadline: Optional[float]) -> bool:
+        """Tells whether the given deadline has already passed."""
+        return deadline is not None and time.perf_counter() > deadline
+
+    def get_violations(self, checker_type: type) -> List[types.CheckResult]:
+        """Reports all visitors that were out of time, if there are any."""
+        if not self.skipped:
+            return []
+        violation = system.TimeBudgetViolation(
+            text=', '.join(dict.fromkeys(self.skipped)),
+        )
+        return [(*violation.node_items(), checker_type)]
+
+
 @final
 class Checker(object):
     """
@@ -74,7 +162,8 @@ class Checker(object):
         config: custom configuration object used to provide and parse options:
         :class:`wemake_python_styleguide.options.config.Configuration`.
 
-        options: option structure passed by ``flake8``:
+        options: option structure passed by ``flake8``
+        or to the instance itself:
         :class:`wemake_python_styleguide.types.ConfigurationOptions`.
 
         visitors: :term:`preset` of visitors that are run by this checker.
@@ -93,11 +182,20 @@ class Checker(object):
         *tokens_preset.PRESET,
     )
 
+    # Cheaper visitors go first, when we might stop early,
+    # sorting is stable so presets keep their order within each tier:
+    _limited_visitors: ClassVar[Sequence[VisitorClass]] = tuple(sorted(
+        [*filename_preset.PRESET, *tokens_preset.PRESET, *tree_preset.PRESET],
+        key=attrgetter('cost'),
+    ))
+
     def __init__(
         self,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
         filename: str = constants.STDIN,
+        *,
+        options: Optional[types.ConfigurationOptions] = None,
     ) -> None:
         """
         Creates new checker instance.
@@ -109,15 +207,33 @@ class Checker(object):
         ``flake8`` also decides how to execute this plugin
         based on its parameters. This one is executed once per module.
 
+        Keyword-only ``options`` are never passed by ``flake8``.
+        They are used when this checker is embedded into other tools.
+        Options that are parsed by :meth:`parse_options` are used otherwise.
+
         Arguments:
             tree: ``ast`` tree parsed by ``flake8``.
             file_tokens: ``tokenize.tokenize`` parsed file tokens.
             filename: module file name, might be empty if piping is used.
+            options: options of this instance only, they are validated here.
 
         """
-        self.tree = transform(tree)
+        self.options = (
+            type(self).options
+            if options is None
+            else validate_options(options)
+        )
+        self._trace = tracing.Trace(self.options.trace_file, filename)
+        self._memory = tracing.MemoryProfile(
+            self.options.memory_profile, filename,
+        )
+        self._memory.start_step()
+        self._table = tables.NodeTable(tree)
+        self.tree = transform(tree, self._table)
         self.filename = filename
         self.file_tokens = file_tokens
+        self._trace.add_span('transform', 'transform', self._trace.start)
+        self._memory.add_step('transform')
 
     @classmethod
     def add_options(cls, parser: OptionManager) -> None:
@@ -137,6 +253,7 @@ class Checker(object):
     def parse_options(cls, options: types.ConfigurationOptions) -> None:
         """Parses registered options for providing them to each visitor."""
         cls.options = validate_options(options)
+        tracing.create_trace_files(cls.options)
 
     def run(self) -> Iterator[types.CheckResult]:
         """
@@ -145,23 +262,169 @@ class Checker(object):
         This method is used by ``flake8`` API.
         It is executed after all configuration is parsed.
 
+        Node annotations table is dropped when all visitors are finished,
+        so the memory is freed right away.
+
+        When ``baseline_file`` option is set,
+        known violations from this file are not reported.
+
+        When ``max_violations`` option is set, we stop running
+        new visitors as soon as this many violations are found.
+
+        Visitors that do not fit in ``max_file_seconds``
+        or ``max_visitor_seconds`` options are skipped
+        and reported with a single violation.
+
+        When ``trace_file`` option is set, spans of this module,
+        its transformation, and each visitor are written there.
+        The same goes for memory they use and ``memory_profile`` option.
+
         Yields:
             Violations that were found by the passed visitors.
 
         """
-        for visitor_class in self._visitors:
-            visitor = visitor_class.from_checker(self)
-
-            try:
-                visitor.run()
-            except Exception:
-                # In case we fail misserably, we want users to see at
-                # least something! Full stack trace
-                # and some rules that still work.
-                print(traceback.format_exc())  # noqa: T001, WPS421
-                visitor.add_violation(system.InternalErrorViolation())
-
-            yield from (
-                (*error.node_items(), type(self))
-                for error in visitor.violations
+        check_results = self.run_visitors(
+            self._limited_visitors
+            if self.options.max_violations
+            else self._visitors,
+        )
+        if self.options.baseline_file:
+            check_results = _exclude_baseline(
+                check_results,
+                baseline.Fingerprints(self.filename, self.file_tokens),
+                baseline.load_baseline(self.options.baseline_file),
+            )
+        if self.options.max_violations:
+            check_results = _limit_violations(
+                check_results,
+                self.file_tokens,
+                self.options.max_violations,
+            )
+
+        try:  # noqa: WPS501
+            yield from check_results
+        finally:
+            # Table is dropped even when checks are not finished:
+            tables.drop(self._table)
+        self._trace.finish()
+        self._memory.finish()
+
+    def run_visitors(
+        self,
+        visitors: Sequence[VisitorClass],
+        tree: Optional[ast.AST] = None,
+        budget: Optional[TimeBudget] = None,
+    ) -> Iterator[types.CheckResult]:
+        """
+        Runs only the given visitors.
+
+        It can be called several times for the same file,
+        for example to check it in several steps.
+        When ``tree`` is passed, ``ast`` visitors only visit this part
+        of the checked tree, it must be one of its nodes.
+        Visitors that are not in the ``checks_tier`` are skipped.
+        Node annotations table is kept until :meth:`release` is called,
+        it is only active while visitors run.
+
+        Steps of the same file should share a single ``budget``,
+        then the caller reports visitors that were out of time
+        with :meth:`TimeBudget.get_violations` once.
+        """
+        if budget is None:
+            budget = TimeBudget(self.options)
+            yield from self.run_visitors(visitors, tree, budget)
+            yield from budget.get_violations(type(self))
+            return
+
+        tier_visitors = tiers.select_tier(visitors, self.options.checks_tier)
+        with self._table:
+            for visitor_class in tier_visitors:
+                yield from self._run_checks(visitor_class, tree, budget)
+
+    def release(self) -> None:
+        """Drops node annotations table, when no more visitors will run."""
+        tables.drop(self._table)
+        self._trace.finish()
+        self._memory.finish()
+
+    def _run_checks(
+        self,
+        visitor_class: VisitorClass,
+        tree: Optional[ast.AST],
+        budget: TimeBudget,
+    ) -> Iterator[types.CheckResult]:
+        if budget.is_over(budget.file_deadline):
+            budget.skipped.append(visitor_class.__qualname__)
+            return
+
+        visitor = _pool.get(visitor_class, self)
+        if tree is not None and isinstance(visitor, base.BaseNodeVisitor):
+            visitor.tree = tree
+        visitor.deadline = budget.get_deadline()
+
+        start_time = time.perf_counter()
+        self._memory.start_step()
+        _run_visitor(visitor)
+        self._trace.add_span(visitor_class.__qualname__, 'visitor', start_time)
+        self._memory.add_step(visitor_class.__qualname__)
+
+        check_results = [
+            (*error.node_items(), type(self))
+            for error in visitor.violations
+        ]
+        # Pooled visitor must not keep this file alive until the next one:
+        visitor.reset()
+
+        if budget.is_over(visitor.deadline):
+            # Results of visitors that were stopped are not complete:
+            budget.skipped.append(visitor_class.__qualname__)
+            return
+        yield from check_results
+
+
+def _run_visitor(visitor: base.BaseVisitor) -> None:
+    try:
+        visitor.run()
+    except Exception:
+        # In case we fail misserably, we want users to see at
+        # least something! Full stack trace
+        # and some rules that still work.
+        print(traceback.format_exc())  # noqa: T001, WPS421
+        visitor.add_violation(system.InternalErrorViolation())
+
+
+def _exclude_baseline(
+    check_results: Iterator[types.CheckResult],
+    fingerprints: baseline.Fingerprints,
+    known_violations: baseline.Baseline,
+) -> Iterator[types.CheckResult]:
+    for check_result in check_results:
+        code = check_result[2].split(' ', 1)[0]
+        if fingerprints.get(code, check_result[0]) not in known_violations:
+            yield check_result
+
+
+def _limit_violations(
+    check_results: Iterator[types.CheckResult],
+    file_tokens: Sequence[tokenize.TokenInfo],
+    max_violations: int,
+) -> Iterator[types.CheckResult]:
+    # Violations on these lines might be ignored by ``flake8``:
+    noqa_lines = {
+        token.start[0]
+        for token in file_tokens
+        if token.exact_type == tokenize.COMMENT and
+        'noqa' in token.string.lower()
+    }
+
+    found_violations = 0
+    for check_result in check_results:
+        yield check_result
+        if check_result[0] not in noqa_lines:
+            found_violations += 1
+        if found_violations >= max_violations:
+            violation = system.TooManyViolationsViolation(
+                text=str(found_violations),
             )
+            yield (*violation.node_items(), Checker)
+            return
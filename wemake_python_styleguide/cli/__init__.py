@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+"""
+Our own command line runner.
+
+It reuses ``flake8`` to parse options, find files, and report violations,
+but runs only our checker with its own process pool.
+
+.. code:: bash
+
+    python -m wemake_python_styleguide --jobs=4 your_module.py
+
+"""
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runs our checker over files with ``flake8`` options and formatters.
+
+We reuse ``flake8`` application to parse options and configuration files,
+find files, filter violations, and format them.
+So, the output is the same as ``flake8`` would produce.
+
+What we change is how files are checked:
+
+- we only run our own checker
+- files are sorted by their expected cost, see
+  :mod:`wemake_python_styleguide.cli.scheduling`
+- workers are initialized once, see
+  :mod:`wemake_python_styleguide.cli.workers`
+- files are sent to workers and results are sent back in batches
+- all reported violations can be written into a baseline file, see
+  :mod:`wemake_python_styleguide.baseline`
+- files can be split between several machines, see
+  :mod:`wemake_python_styleguide.cli.sharding`
+
+"""
+
+import copy
+import multiprocessing
+import tokenize
+from operator import attrgetter
+from optparse import Values
+from typing import Dict, List, Optional, Sequence
+
+from flake8 import exceptions, utils
+from flake8.checker import Manager
+from flake8.main.application import Application
+from typing_extensions import final
+
+from wemake_python_styleguide import baseline
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.cli import scheduling, sharding, workers
+
+
+@final
+class ScheduledManager(Manager):
+    """Runs our checker over files sorted by their expected cost."""
+
+    def make_checkers(self, paths: Optional[List[str]] = None) -> None:
+        """Finds all files to be checked, they are not read here."""
+        self.filenames = _select_shard(self.options, [
+            filename
+            for argument in paths or self.arguments or ['.']
+            for filename in utils.filenames_from(
+                argument, self.is_path_excluded,
+            )
+            if self._should_check(filename, argument)
+        ])
+
+    def run(self) -> None:
+        """Checks all files, then stores reports in the original order."""
+        cache = scheduling.TimingCache(self.options.timing_cache)
+        sizes = [scheduling.get_size(filename) for filename in self.filenames]
+        checks = self.get_checks()
+
+        if self.jobs > 1 and len(self.filenames) > 1:
+            batches = scheduling.make_batches(
+                self.filenames, sizes, cache, self.jobs,
+            )
+            reports = self._run_parallel(batches, checks)
+        else:
+            workers.initialize(_get_worker_options(self.options), checks)
+            reports = workers.check_batch(list(enumerate(self.filenames)))
+
+        reports.sort(key=attrgetter('index'))
+        self._record_timings(cache, sizes, reports)
+        if self.options.write_baseline:
+            self._write_baseline(reports)
+        self.checkers = [report for report in reports if report.should_process]
+
+    def get_checks(self) -> Dict[str, List[object]]:
+        """Returns serialized plugins, we only run our own checker."""
+        return {
+            'ast_plugins': [
+                plugin.to_dictionary()
+                for plugin in self.checks.ast_plugins
+                if plugin.plugin is Checker
+            ],
+            'logical_line_plugins': [],
+            'physical_line_plugins': [],
+        }
+
+    def _run_parallel(
+        self,
+        batches: Sequence[scheduling.Batch],
+        checks: Dict[str, List[object]],
+    ) -> List[workers.FileReport]:
+        initargs = (_get_worker_options(self.options), checks)
+        with multiprocessing.Pool(
+            self.jobs, workers.initialize_process, initargs,
+        ) as pool:
+            return [
+                report
+                for batch_reports in pool.imap_unordered(
+                    workers.check_batch, batches,
+                )
+                for report in batch_reports
+            ]
+
+    def _record_timings(
+        self,
+        cache: scheduling.TimingCache,
+        sizes: Sequence[int],
+        reports: Sequence[workers.FileReport],
+    ) -> None:
+        for file_report in reports:
+            cache.record(
+                self.filenames[file_report.index],
+                sizes[file_report.index],
+                file_report.seconds,
+            )
+        cache.save()
+
+    def _write_baseline(self, reports: Sequence[workers.FileReport]) -> None:
+        baseline.write_baseline(self.options.write_baseline, (
+            fingerprint
+            for file_report in reports
+            for fingerprint in _get_fingerprints(
+                self.filenames[file_report.index], file_report.results,
+            )
+        ))
+
+    def _should_check(self, filename: str, argument: str) -> bool:
+        return (
+            filename in {argument, '-'} or
+            utils.fnmatch(filename, self.options.filename)
+        )
+
+
+@final
+class ScheduledApplication(Application):
+    """Application that uses :class:`ScheduledManager` to check files."""
+
+    def __init__(self) -> None:
+        """Registers options that are only used by this application."""
+        super().__init__()
+        self.option_manager.add_option(
+            '--timing-cache',
+            parse_from_config=True,
+            help=(
+                'File to store check time of each file, ' +
+                'it is used to check expensive files first. ' +
+                'Files are estimated by their size without it.'
+            ),
+        )
+        self.option_manager.add_option(
+            '--write-baseline',
+            default='',
+            help=(
+                'Writes all reported violations into this baseline file, ' +
+                'it is used with --baseline-file to report only new ones.'
+            ),
+        )
+        self.option_manager.add_option(
+            '--shard',
+            default='',
+            help=(
+                'Checks only files of this shard, like 1/4, ' +
+                'files are split between shards by their size or timings.'
+            ),
+        )
+
+    def make_file_checker_manager(self) -> None:
+        """Creates our own manager instead of the ``flake8`` one."""
+        self.file_checker_manager = ScheduledManager(
+            style_guide=self.guide,
+            arguments=self.args,
+            checker_plugins=self.check_plugins,
+        )
+
+
+def _select_shard(options: Values, filenames: List[str]) -> List[str]:
+    if not options.shard:
+        return filenames
+
+    try:
+        shard_index, shards = sharding.parse_shard(options.shard)
+    except ValueError as exc:
+        raise exceptions.ExecutionError(str(exc))
+
+    cache = None
+    if options.timing_cache:
+        cache = scheduling.TimingCache(options.timing_cache)
+    return sharding.select_shard(filenames, cache, shard_index, shards)
+
+
+def _get_worker_options(options: Values) -> Values:
+    if not options.write_baseline:
+        return options
+    # Known violations must be reported to write them again:
+    worker_options = copy.copy(options)
+    worker_options.baseline_file = ''
+    return worker_options
+
+
+def _get_fingerprints(
+    filename: str,
+    file_results: Sequence[workers.Result],
+) -> List[int]:
+    if not file_results:
+        return []
+    try:
+        with open(filename, 'rb') as source_file:
+            file_tokens = list(tokenize.tokenize(source_file.readline))
+    except (OSError, SyntaxError, tokenize.TokenError):
+        return []  # unreadable files are not in the baseline
+
+    fingerprints = baseline.Fingerprints(filename, file_tokens)
+    return [
+        fingerprints.get(code, line_number)
+        for code, line_number, _, _, _ in file_results
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the application, the same way ``flake8`` does."""
+    app = ScheduledApplication()
+    app.run(argv)
+    app.exit()
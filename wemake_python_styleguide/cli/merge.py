@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""
+Merges reports of several shards into a single report.
+
+Each shard writes its violations as JSON lines, see
+:mod:`wemake_python_styleguide.cli.sharding`
+and :mod:`wemake_python_styleguide.json_formatter`:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide --format=wemake-jsonl --shard=1/2 .
+    python -m wemake_python_styleguide --format=wemake-jsonl --shard=2/2 .
+
+Each one is run on its own machine
+and its output is saved as ``shard1.jsonl`` and ``shard2.jsonl``.
+
+Then all reports are merged and formatted
+with one of our formatters, ``wemake`` is the default one:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide.cli.merge --statistics shard*.jsonl
+
+Files are reported in the order of their names.
+Statistics are the same as a single run would show.
+Source lines are not stored in reports, so they are not shown.
+Exit code is ``1`` when there are violations, just like ``flake8`` has.
+"""
+
+import argparse
+import json
+import sys
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Sequence, Type
+
+from flake8.formatting.base import BaseFormatter
+from flake8.statistics import Statistics
+from flake8.style_guide import Violation
+from typing_extensions import Final
+
+from wemake_python_styleguide.formatter import WemakeFormatter
+from wemake_python_styleguide.json_formatter import (
+    JSONLinesFormatter,
+    SARIFFormatter,
+)
+
+_FormatterClass = Type[BaseFormatter]
+
+#: Formatters that can be used for the merged report.
+FORMATTERS: Final[Mapping[str, _FormatterClass]] = MappingProxyType({
+    'wemake': WemakeFormatter,
+    'wemake-jsonl': JSONLinesFormatter,
+    'wemake-sarif': SARIFFormatter,
+})
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Merges reports of all shards, exits with the ``flake8`` exit code."""
+    options = _parse_arguments(argv)
+    violations = sorted(
+        _load_violations(options.reports),
+        key=attrgetter('filename'),
+    )
+
+    formatter = FORMATTERS[options.format](options)
+    formatter.start()
+    statistics = _report(formatter, violations)
+    if options.statistics:
+        formatter.show_statistics(statistics)
+    formatter.stop()
+    sys.exit(int(bool(violations) and not options.exit_zero))
+
+
+def _parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m wemake_python_styleguide.cli.merge',
+        description='Merges JSON lines reports of several shards.',
+    )
+    parser.add_argument('reports', nargs='+', help='Reports of shards.')
+    parser.add_argument(
+        '--format',
+        default='wemake',
+        choices=tuple(FORMATTERS),
+        help='Formatter of the merged report.',
+    )
+    parser.add_argument('--output-file', help='Writes report to this file.')
+    parser.add_argument(
+        '--tee',
+        action='store_true',
+        help='Writes report to stdout as well as the output file.',
+    )
+    parser.add_argument(
+        '--statistics',
+        action='store_true',
+        help='Counts violations of each code.',
+    )
+    parser.add_argument(
+        '--exit-zero',
+        action='store_true',
+        help='Exits with 0 even when there are violations.',
+    )
+    parser.set_defaults(show_source=False)
+    return parser.parse_args(argv)
+
+
+def _load_violations(reports: Sequence[str]) -> List[Violation]:
+    violations: List[Violation] = []
+    for report_path in reports:
+        with open(report_path, encoding='utf8') as report:
+            violations.extend(
+                Violation(
+                    reported['code'],
+                    reported['filename'],
+                    reported['line'],
+                    reported['column'],
+                    reported['message'],
+                    None,
+                )
+                for reported in map(json.loads, filter(str.strip, report))
+            )
+    return violations
+
+
+def _report(
+    formatter: BaseFormatter,
+    violations: Sequence[Violation],
+) -> Statistics:
+    statistics = Statistics()
+    file_groups = groupby(violations, key=attrgetter('filename'))
+    for filename, file_violations in file_groups:
+        formatter.beginning(filename)
+        for violation in file_violations:
+            statistics.record(violation)
+            formatter.handle(violation)
+        formatter.finished(filename)
+    return statistics
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
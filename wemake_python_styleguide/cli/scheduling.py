@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Schedules files between worker processes.
+
+Files are checked in the order of their expected cost:
+the most expensive files go first,
+so a single large module at the end of the list
+does not leave all other workers idle.
+
+Expected costs come from timings of previous runs,
+when a timing cache file is passed with ``--timing-cache`` option.
+Files that we have never seen are estimated by their size.
+"""
+
+import json
+import os
+from typing import Dict, List, Sequence, Tuple
+
+from typing_extensions import Final, final
+
+#: Seconds per byte that we use when there are no timings at all.
+_DEFAULT_RATE: Final = 1e-5
+
+#: We split files in more batches than we have jobs to balance the load.
+_BATCHES_PER_JOB: Final = 4
+
+#: Maps file names to their size in bytes and check time in seconds.
+_Timings = Dict[str, Tuple[int, float]]
+
+#: Files to be checked by a single worker call, with their original indexes.
+Batch = List[Tuple[int, str]]
+
+
+@final
+class TimingCache(object):
+    """Stores how long it took to check each file last time."""
+
+    __slots__ = ('filename', 'timings', '_rate')
+
+    def __init__(self, filename: str) -> None:
+        """
+        Loads timings from the given file.
+
+        Missing and broken cache files are treated as empty ones.
+        Empty ``filename`` disables the cache.
+        """
+        self.filename = filename
+        self.timings: _Timings = {}
+        if filename:
+            self.timings = _load_timings(filename)
+
+        total_size = sum(size for size, _ in self.timings.values())
+        total_time = sum(seconds for _, seconds in self.timings.values())
+        self._rate = total_time / total_size if total_size else _DEFAULT_RATE
+
+    def estimate(self, filename: str, size: int) -> float:
+        """Returns expected check time of a file in seconds."""
+        if filename not in self.timings:
+            return size * self._rate
+
+        cached_size, seconds = self.timings[filename]
+        return seconds * (size + 1) / (cached_size + 1)
+
+    def record(self, filename: str, size: int, seconds: float) -> None:
+        """Stores new timing of a file."""
+        self.timings[filename] = (size, seconds)
+
+    def save(self) -> None:
+        """Saves timings back to the cache file, if it is enabled."""
+        if not self.filename:
+            return
+
+        try:
+            with open(self.filename, 'w') as cache_file:
+                json.dump(self.timings, cache_file)
+        except OSError:  # cache is optional, we do not fail on it
+            return
+
+
+def get_size(filename: str) -> int:
+    """Returns the size of a file in bytes or ``0`` if it is not a file."""
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
+
+
+def make_batches(
+    filenames: Sequence[str],
+    sizes: Sequence[int],
+    cache: TimingCache,
+    jobs: int,
+) -> List[Batch]:
+    """
+    Splits files into batches, the most expensive files go first.
+
+    Each batch costs about the same.
+    Files that are more expensive than a single batch are checked alone.
+    """
+    batches: Dict[int, Batch] = {}
+    position = 0.0
+    for share, index, filename in _get_shares(filenames, sizes, cache, jobs):
+        batches.setdefault(int(position), []).append((index, filename))
+        position += share
+    return list(batches.values())
+
+
+def _get_shares(
+    filenames: Sequence[str],
+    sizes: Sequence[int],
+    cache: TimingCache,
+    jobs: int,
+) -> List[Tuple[float, int, str]]:
+    costs = [
+        cache.estimate(filename, sizes[index])
+        for index, filename in enumerate(filenames)
+    ]
+    batch_cost = sum(costs) / (jobs * _BATCHES_PER_JOB) or 1.0
+    return sorted(
+        (
+            (costs[index] / batch_cost, index, filename)
+            for index, filename in enumerate(filenames)
+        ),
+        reverse=True,
+    )
+
+
+def _load_timings(filename: str) -> _Timings:
+    try:
+        with open(filename) as cache_file:
+            return {
+                str(name): (int(timing[0]), float(timing[1]))
+                for name, timing in json.load(cache_file).items()
+            }
+    except (OSError, ValueError, TypeError, AttributeError, IndexError):
+        return {}
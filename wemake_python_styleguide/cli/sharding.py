@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""
+Splits files between shards, that are checked on several machines.
+
+.. code:: bash
+
+    python -m wemake_python_styleguide --shard=1/4 .
+
+Each file goes to exactly one shard of ``--shard=1/4`` to ``--shard=4/4``.
+Files are ordered by a stable hash of their normalized paths
+and split into shards of the same total size.
+So, each shard selects its files the same way on any machine,
+as long as all shards check the same files.
+
+With an explicit ``--timing-cache`` shards are balanced by
+the expected cost of their files instead, see
+:mod:`wemake_python_styleguide.cli.scheduling`:
+the most expensive files are given to the least loaded shard first.
+Equally expensive files are sorted by their names.
+Use it only with a cache file that is shared between all machines,
+otherwise they might split files differently.
+
+See :mod:`wemake_python_styleguide.cli.merge` to merge their reports.
+"""
+
+import hashlib
+import heapq
+import os
+import re
+from pathlib import PurePath
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.cli import scheduling
+
+#: Shards are numbered from one: ``1/4`` is the first one of four shards.
+_SHARD: Final = re.compile(r'^(\d+)/(\d+)$')
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """Returns zero based index of a shard and number of all shards."""
+    shard_match = _SHARD.match(shard)
+    if shard_match:
+        shard_number, shards = map(int, shard_match.groups())
+        if 0 < shard_number <= shards:
+            return shard_number - 1, shards
+    raise ValueError('Shard must look like 1/4, got: {0}'.format(shard))
+
+
+def select_shard(
+    filenames: Sequence[str],
+    cache: Optional[scheduling.TimingCache],
+    shard_index: int,
+    shards: int,
+) -> List[str]:
+    """
+    Returns files of the given shard, keeps their order.
+
+    Files are balanced by their timings only when ``cache`` is passed,
+    otherwise they are split by their hashes and sizes.
+    """
+    if cache is None:
+        file_shards = _split_shards(filenames, shards)
+    else:
+        costs = {
+            filename: cache.estimate(filename, scheduling.get_size(filename))
+            for filename in filenames
+        }
+        file_shards = _assign_shards(costs, shards)
+
+    return [
+        filename
+        for filename in filenames
+        if file_shards[filename] == shard_index
+    ]
+
+
+def _split_shards(filenames: Sequence[str], shards: int) -> Dict[str, int]:
+    # Empty files are not free to check either:
+    sizes = {
+        filename: scheduling.get_size(filename) + 1
+        for filename in filenames
+    }
+    total_size = sum(sizes.values())
+    file_shards = {}
+    offset = 0
+    for filename in sorted(sizes, key=_get_path_hash):
+        # Each file goes to the shard that contains its middle:
+        file_shards[filename] = int(
+            (offset + sizes[filename] / 2) * shards / total_size,
+        )
+        offset += sizes[filename]
+    return file_shards
+
+
+def _assign_shards(costs: Mapping[str, float], shards: int) -> Dict[str, int]:
+    loads = [(0.0, shard) for shard in range(shards)]
+    file_shards = {}
+    for filename in sorted(costs, key=lambda name: (-costs[name], name)):
+        load, shard = heapq.heappop(loads)
+        heapq.heappush(loads, (load + costs[filename], shard))
+        file_shards[filename] = shard
+    return file_shards
+
+
+def _get_path_hash(filename: str) -> bytes:
+    path = PurePath(os.path.normpath(filename)).as_posix()
+    return hashlib.blake2b(path.encode('utf8'), digest_size=8).digest()
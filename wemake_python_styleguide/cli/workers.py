@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checks files inside worker processes.
+
+Each worker is initialized only once with parsed options and plugins,
+so all imports and option validation happen once per process.
+Then workers receive batches of file names
+and send back compact reports for the whole batch.
+"""
+
+import signal
+import time
+from optparse import Values
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import attr
+from flake8.checker import FileChecker
+from typing_extensions import final
+
+from wemake_python_styleguide.checker import Checker
+
+#: Single result in the same format ``flake8`` uses: code, line, column,
+#: text, and physical line.
+Result = Tuple[str, int, int, str, Optional[str]]
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class FileReport(object):
+    """
+    Contains all results of a single file.
+
+    It has the same attributes as ``flake8`` file checkers,
+    that are required to report results.
+    """
+
+    index: int
+    display_name: str
+    results: List[Result]  # noqa: WPS110
+    statistics: Dict[str, int]
+    seconds: float
+    should_process: bool
+
+
+@final
+class _WorkerState(object):
+    """Parsed options and plugins of the current process."""
+
+    __slots__ = ('options', 'checks')
+
+    def __init__(self) -> None:
+        self.options = Values()
+        self.checks: Dict[str, List[object]] = {}
+
+
+_state = _WorkerState()
+
+
+def initialize(options: Values, checks: Dict[str, List[object]]) -> None:
+    """Prepares current process to check files."""
+    Checker.parse_options(options)
+    _state.options = options
+    _state.checks = checks
+
+
+def initialize_process(
+    options: Values,
+    checks: Dict[str, List[object]],
+) -> None:
+    """Prepares worker process, the main process handles interrupts."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    initialize(options, checks)
+
+
+def check_batch(batch: Sequence[Tuple[int, str]]) -> List[FileReport]:
+    """Checks all files in a batch."""
+    return [_check_file(index, filename) for index, filename in batch]
+
+
+def _check_file(index: int, filename: str) -> FileReport:
+    start_time = time.perf_counter()
+    file_checker = FileChecker(filename, _state.checks, _state.options)
+    if file_checker.should_process:
+        file_checker.run_checks()
+
+    return FileReport(
+        index=index,
+        display_name=file_checker.display_name,
+        results=_compact(file_checker.results),
+        statistics=file_checker.statistics,
+        seconds=time.perf_counter() - start_time,
+        should_process=file_checker.should_process,
+    )
+
+
+def _compact(file_results: List[Result]) -> List[Result]:
+    if _state.options.show_source:
+        return file_results
+    # Physical lines are only needed to show the source,
+    # ``noqa`` comments are checked by reading lines again:
+    return [
+        (code, line_number, column, text, None)
+        for code, line_number, column, text, _ in file_results
+    ]
@@ -27,11 +27,12 @@ That's how all ``flake8`` formatters work:
 
 """
 
-from collections import defaultdict
-from typing import ClassVar, DefaultDict, List
+from itertools import groupby
+from operator import attrgetter
+from typing import ClassVar, Dict, List, Set, Tuple
 
 from flake8.formatting.base import BaseFormatter
-from flake8.statistics import Statistics
+from flake8.statistics import Statistic, Statistics
 from flake8.style_guide import Violation
 from pygments import highlight
 from pygments.formatters import TerminalFormatter
@@ -45,6 +46,8 @@ DOCS_URL_TEMPLATE: Final = (
     'https://wemake-python-stylegui.de/en/{0}/pages/usage/violations/'
 )
 
+_CodeStatistics = Tuple[str, List[Statistic]]
+
 
 class WemakeFormatter(BaseFormatter):  # noqa: WPS214
     """
@@ -59,6 +62,10 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
     3. Grouping, we need explicit grouping by filename
     4. Incomplete and non-informative statistics
 
+    Output of each file is written at once, when the file is finished.
+    Highlighted source lines are cached until then,
+    so several violations on the same line are highlighted once.
+
     """
 
     _doc_url: ClassVar[str] = DOCS_URL_TEMPLATE.format(pkg_version)
@@ -71,18 +78,25 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
         self._formatter = TerminalFormatter()
 
         # Logic:
-        self._proccessed_filenames: List[str] = []
+        self._proccessed_filenames: Set[str] = set()
+        self._highlighted_lines: Dict[Tuple[str, int], str] = {}
+        self._output_lines: List[str] = []
         self._error_count = 0
 
     def handle(self, error: Violation) -> None:  # noqa: WPS110
         """Processes each :term:`violation` to print it and all related."""
         if error.filename not in self._proccessed_filenames:
             self._print_header(error.filename)
-            self._proccessed_filenames.append(error.filename)
+            self._proccessed_filenames.add(error.filename)
 
         super().handle(error)
         self._error_count += 1
 
+    def finished(self, filename: str) -> None:
+        """Called when all violations of a file are handled."""
+        self._highlighted_lines = {}
+        self._flush()
+
     def format(self, error: Violation) -> str:  # noqa: A003
         """Called to format each individual :term:`violation`."""
         return '{newline}  {row_col:<8} {code:<5} {text}'.format(
@@ -100,35 +114,24 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
         formated_line = error.physical_line.lstrip()
         adjust = len(error.physical_line) - len(formated_line)
 
-        code = _highlight(
-            formated_line,
-            self._lexer,
-            self._formatter,
-        )
+        line_key = (error.filename, error.line_number)
+        code = self._highlighted_lines.get(line_key)
+        if code is None:
+            code = _highlight(formated_line, self._lexer, self._formatter)
+            self._highlighted_lines[line_key] = code
 
         return '  {code}  {pointer}^'.format(
             code=code,
             pointer=' ' * (error.column_number - 1 - adjust),
         )
 
-    def show_statistics(self, statistics: Statistics) -> None:  # noqa: WPS210
+    def show_statistics(self, statistics: Statistics) -> None:
         """Called when ``--statistic`` option is passed."""
         all_errors = 0
-        for error_code in statistics.error_codes():
-            stats_for_error_code = statistics.statistics_for(error_code)
-            statistic = next(stats_for_error_code)
-
-            count = statistic.count
-            count += sum(stat.count for stat in stats_for_error_code)
+        for error_code, code_statistics in _group_by_code(statistics):
+            count = sum(statistic.count for statistic in code_statistics)
             all_errors += count
-            error_by_file = _count_per_filename(statistics, error_code)
-
-            self._print_violation_per_file(
-                statistic,
-                error_code,
-                count,
-                error_by_file,
-            )
+            self._print_violation_per_file(code_statistics, error_code, count)
 
         self._write(self.newline)
         self._write(_underline(_bold('All errors: {0}'.format(all_errors))))
@@ -138,6 +141,7 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
         if self._error_count:
             message = '{0}Full list of violations and explanations:{0}{1}'
             self._write(message.format(self.newline, self._doc_url))
+        self._flush()
 
     # Our own methods:
 
@@ -151,23 +155,22 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
 
     def _print_violation_per_file(
         self,
-        statistic: Statistics,
+        code_statistics: List[Statistic],
         error_code: str,
         count: int,
-        error_by_file: DefaultDict[str, int],
     ):
         self._write(
             '{newline}{error_code}: {message}'.format(
                 newline=self.newline,
                 error_code=_bold(error_code),
-                message=statistic.message,
+                message=code_statistics[0].message,
             ),
         )
-        for filename, error_count in error_by_file.items():
+        for statistic in code_statistics:
             self._write(
                 '  {error_count:<5} {filename}'.format(
-                    error_count=error_count,
-                    filename=filename,
+                    error_count=statistic.count,
+                    filename=statistic.filename,
                 ),
             )
         self._write(_underline('Total: {0}'.format(count)))
@@ -175,6 +178,15 @@ class WemakeFormatter(BaseFormatter):  # noqa: WPS214
     def _should_show_source(self, error: Violation) -> bool:
         return self.options.show_source and error.physical_line is not None
 
+    def _write(self, output: str) -> None:
+        self._output_lines.append(output)
+
+    def _flush(self) -> None:
+        if self._output_lines:
+            output = self.newline.join(self._output_lines)
+            super()._write(output)  # noqa: WPS613
+            self._output_lines = []
+
 
 # Formatting text:
 
@@ -218,14 +230,15 @@ def _highlight(source: str, lexer, formatter) -> str:
 
 # Helpers:
 
-def _count_per_filename(
-    statistics: Statistics,
-    error_code: str,
-) -> DefaultDict[str, int]:
-    filenames: DefaultDict[str, int] = defaultdict(int)
-    stats_for_error_code = statistics.statistics_for(error_code)
-
-    for stat in stats_for_error_code:
-        filenames[stat.filename] += stat.count
-
-    return filenames
+def _group_by_code(statistics: Statistics) -> List[_CodeStatistics]:
+    # Statistics are sorted by filenames and then by codes:
+    all_statistics = sorted(
+        statistics.statistics_for(''),
+        key=attrgetter('error_code'),
+    )
+    return [
+        (error_code, list(code_statistics))
+        for error_code, code_statistics in groupby(
+            all_statistics, key=attrgetter('error_code'),
+        )
+    ]
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+Machine readable ``flake8`` formatters.
+
+Parsing colored text output with regular expressions is slow and fragile.
+So, we also provide formatters that are easy to parse:
+
+.. code:: bash
+
+    flake8 --format=wemake-jsonl  # one JSON object per line
+    flake8 --format=wemake-sarif  # SARIF 2.1.0 document
+
+Both formatters write each :term:`violation` as soon as it is handled.
+Nothing is stored in memory, so they work fine with millions of violations.
+Source lines, ``--statistics``, and ``--benchmark`` are not shown,
+so the output is always valid.
+
+Each violation has its code, message, filename, line and column numbers,
+and a ``baseline`` threshold, when the violation has one.
+``flake8`` does not report end positions of violations,
+so we do not report them either.
+
+.. autoclass:: JSONLinesFormatter
+   :no-undoc-members:
+
+.. autoclass:: SARIFFormatter
+   :no-undoc-members:
+
+"""
+
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from flake8.formatting.base import BaseFormatter
+from flake8.statistics import Statistics
+from flake8.style_guide import Violation
+from typing_extensions import Final
+
+from wemake_python_styleguide.formatter import DOCS_URL_TEMPLATE
+from wemake_python_styleguide.version import pkg_name, pkg_version
+
+#: Thresholds are shown at the end of complexity violations' messages.
+_BASELINE: Final = re.compile(r' > (\d+)$')
+
+#: https://docs.oasis-open.org/sarif/sarif/v2.1.0/sarif-v2.1.0.html
+_SARIF_SCHEMA: Final = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+
+class _MachineReadableFormatter(BaseFormatter):
+    """Writes nothing but violations, plain text would break the output."""
+
+    def show_source(self, error: Violation) -> str:
+        """Source lines are not shown, they are easy to find."""
+        return ''
+
+    def show_statistics(self, statistics: Statistics) -> None:
+        """Statistics are not shown, they are easy to count."""
+
+    def show_benchmarks(self, benchmarks: List[Tuple[str, float]]) -> None:
+        """Benchmarks are not shown, they are not violations."""
+
+
+class JSONLinesFormatter(_MachineReadableFormatter):
+    """Writes each :term:`violation` as a JSON object on its own line."""
+
+    def format(self, error: Violation) -> str:  # noqa: A003
+        """Formats a violation as a JSON object."""
+        return json.dumps({
+            'filename': error.filename,
+            'line': error.line_number,
+            'column': error.column_number,
+            'code': error.code,
+            'message': error.text,
+            'baseline': _get_baseline(error),
+        })
+
+
+class SARIFFormatter(_MachineReadableFormatter):
+    """
+    Writes a single SARIF document with all violations.
+
+    The document is written line by line:
+    its beginning on ``start``, a result for each violation,
+    and its ending on ``stop``.
+    """
+
+    def after_init(self) -> None:
+        """Splits an empty document to write results in between."""
+        document = json.dumps({
+            '$schema': _SARIF_SCHEMA,
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {
+                    'driver': {
+                        'name': pkg_name,
+                        'version': pkg_version,
+                        'informationUri': DOCS_URL_TEMPLATE.format(
+                            pkg_version,
+                        ),
+                    },
+                },
+                'results': [],
+            }],
+        })
+        document_start, _, document_end = document.rpartition('[]')
+        self._document_start = document_start
+        self._document_end = document_end
+        self._results_separator = ''
+
+    def start(self) -> None:
+        """Writes the beginning of the document."""
+        super().start()
+        self._write('{0}['.format(self._document_start))
+
+    def format(self, error: Violation) -> str:  # noqa: A003
+        """Formats a violation as a SARIF result."""
+        location: Dict[str, object] = {
+            'artifactLocation': {'uri': error.filename},
+        }
+        if error.line_number:
+            location['region'] = {
+                'startLine': error.line_number,
+                'startColumn': error.column_number,
+            }
+
+        separator = self._results_separator
+        self._results_separator = ','
+        return '{0}{1}'.format(separator, json.dumps({
+            'ruleId': error.code,
+            'message': {'text': error.text},
+            'locations': [{'physicalLocation': location}],
+            'properties': {'baseline': _get_baseline(error)},
+        }))
+
+    def stop(self) -> None:
+        """Writes the ending of the document."""
+        self._write(']{0}'.format(self._document_end))
+        super().stop()
+
+
+def _get_baseline(error: Violation) -> Optional[int]:
+    baseline = _BASELINE.search(error.text)
+    if baseline is None or not error.code.startswith('WPS'):
+        return None
+    return int(baseline.group(1))
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+Numbers that are aggregated from whole subtrees.
+
+Some metrics need to look at all children of a node:
+the last line of a node, the number of ``BoolOp`` nodes inside,
+the length of consecutive attribute or call chains, the height of a subtree.
+
+We used to compute them with a new walk for each checked node,
+which is ``O(n * depth)`` for nested nodes.
+Now we compute all of them in a single post-order pass
+over the node table and then just read them.
+"""
+
+import ast
+from typing import List, Tuple, cast
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.logic import tables
+
+#: Nodes that form consecutive attribute and subscript chains.
+_ACCESS_NODES: Final = (ast.Attribute, ast.Subscript)
+
+
+@final
+class Aggregates(object):
+    """Stores aggregated numbers for all nodes of a single tree."""
+
+    __slots__ = ('max_lines', 'boolops', 'chains', 'heights')
+
+    def __init__(self, table: tables.NodeTable) -> None:
+        """
+        Collects all numbers in a single backward pass.
+
+        Nodes are stored in pre-order,
+        so all children are processed before their parents.
+        """
+        self.max_lines: List[int] = [
+            getattr(node, 'lineno', 0) for node in table.nodes
+        ]
+        self.boolops: List[int] = [
+            int(isinstance(node, ast.BoolOp)) for node in table.nodes
+        ]
+        self.chains: List[int] = [0 for _ in table.nodes]
+        self.heights: List[int] = [1 for _ in table.nodes]
+
+        for index, node in reversed(list(enumerate(table.nodes))):
+            self.chains[index] = self._get_chain_length(table, node)
+
+            parent = table.parents[index]
+            if parent is not None:
+                parent_index = table.index(parent)
+                self.max_lines[parent_index] = max(
+                    self.max_lines[parent_index], self.max_lines[index],
+                )
+                self.boolops[parent_index] += self.boolops[index]
+                self.heights[parent_index] = max(
+                    self.heights[parent_index], self.heights[index] + 1,
+                )
+
+    def _get_chain_length(
+        self,
+        table: tables.NodeTable,
+        node: ast.AST,
+    ) -> int:
+        if isinstance(node, _ACCESS_NODES):
+            is_chained = isinstance(node.value, _ACCESS_NODES)
+            inner: ast.AST = node.value
+        elif isinstance(node, ast.Call):
+            is_chained = isinstance(node.func, ast.Call)
+            inner = node.func
+        else:
+            return 0
+        return 1 + self.chains[table.index(inner)] if is_chained else 1
+
+
+def get_max_line(node: ast.AST) -> int:
+    """Returns the last line number of a node and all its children."""
+    aggregates, index = _get_aggregates(node)
+    return aggregates.max_lines[index]
+
+
+def count_boolops(node: ast.AST) -> int:
+    """Counts ``BoolOp`` nodes inside a node including itself."""
+    aggregates, index = _get_aggregates(node)
+    return aggregates.boolops[index]
+
+
+def get_chain_length(node: ast.AST) -> int:
+    """
+    Returns the number of consecutive accesses or calls.
+
+    Attributes and subscripts are counted together,
+    so ``self.profiler._store[cache_id]`` has length ``4``.
+    Calls are counted on their own, so ``some()()`` has length ``2``.
+    All other nodes have zero length.
+    """
+    aggregates, index = _get_aggregates(node)
+    return aggregates.chains[index]
+
+
+def get_height(node: ast.AST) -> int:
+    """Returns the number of nodes in the longest path down from a node."""
+    aggregates, index = _get_aggregates(node)
+    return aggregates.heights[index]
+
+
+def _get_aggregates(node: ast.AST) -> Tuple[Aggregates, int]:
+    table, _ = tables.find(node)
+    if table is None:
+        # Numbers of a subtree do not depend on the rest of the tree:
+        table = tables.NodeTable(node)
+    aggregates = table.annotation(0, 'aggregates')
+    if aggregates is None:
+        aggregates = Aggregates(table)
+        table.annotate(table.nodes[0], 'aggregates', aggregates)
+    return cast(Aggregates, aggregates), table.index(node)
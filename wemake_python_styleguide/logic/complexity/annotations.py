@@ -10,13 +10,31 @@ Adapted from: https://github.com/best-doctor/flake8-annotations-complexity
 """
 
 import ast
+from functools import lru_cache
 from typing import Union
 
+from typing_extensions import Final
+
 _Annotation = Union[
     ast.expr,
     ast.Str,
 ]
 
+#: Number of different string annotations that we keep parsed.
+_CACHE_SIZE: Final = 1024
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_annotation(annotation: str) -> ast.expr:
+    """
+    Parses string annotation into an expression node.
+
+    The same string annotations are repeated all over the codebase,
+    so parsed expressions are cached for the whole run.
+    Returned nodes are shared between all callers: do not modify them.
+    """
+    return ast.parse(annotation).body[0].value  # type: ignore
+
 
 def get_annotation_compexity(annotation_node: _Annotation) -> int:
     """
@@ -26,9 +44,7 @@ def get_annotation_compexity(annotation_node: _Annotation) -> int:
     we additionally parse them to ``ast`` nodes.
     """
     if isinstance(annotation_node, ast.Str):
-        annotation_node = ast.parse(  # type: ignore
-            annotation_node.s,
-        ).body[0].value
+        return _get_string_complexity(annotation_node.s)
 
     if isinstance(annotation_node, ast.Subscript):
         return 1 + get_annotation_compexity(
@@ -40,3 +56,8 @@ def get_annotation_compexity(annotation_node: _Annotation) -> int:
             default=1,
         )
     return 1
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _get_string_complexity(annotation: str) -> int:
+    return get_annotation_compexity(parse_annotation(annotation))
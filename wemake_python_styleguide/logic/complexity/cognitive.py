@@ -18,7 +18,7 @@ Adapted from https://github.com/Melevir/cognitive_complexity
 """
 
 import ast
-from typing import Callable, Tuple
+from typing import List, Tuple
 
 from wemake_python_styleguide.logic.tree import bools, recursion
 from wemake_python_styleguide.types import AnyFunctionDef, AnyNodes
@@ -50,7 +50,7 @@ _INCREMENTERS: AnyNodes = (
 def _process_child_nodes(
     node: ast.AST,
     increment_by: int,
-    complexity_calculator: Callable[[ast.AST, int], int],
+    nodes_to_visit: List[Tuple[ast.AST, int]],
 ) -> int:
     child_complexity = 0
 
@@ -60,10 +60,7 @@ def _process_child_nodes(
                 increment_by += 1  # add +1 for all try nodes except body
             if node_num:
                 child_complexity += max(1, increment_by)
-        child_complexity += complexity_calculator(
-            child_node,
-            increment_by,
-        )
+        nodes_to_visit.append((child_node, increment_by))
 
     return child_complexity
 
@@ -87,9 +84,10 @@ def _process_node_itself(
     return increment_by, 0, True
 
 
-def _get_cognitive_complexity_for_node(
+def _process_node(
     node: ast.AST,
-    increment_by: int = 0,
+    increment_by: int,
+    nodes_to_visit: List[Tuple[ast.AST, int]],
 ) -> int:
     increment_by, base_complexity, should_iter_children = _process_node_itself(
         node,
@@ -101,12 +99,26 @@ def _get_cognitive_complexity_for_node(
         child_complexity += _process_child_nodes(
             node,
             increment_by,
-            _get_cognitive_complexity_for_node,
+            nodes_to_visit,
         )
 
     return base_complexity + child_complexity
 
 
+def _get_cognitive_complexity_for_node(
+    node: ast.AST,
+    increment_by: int = 0,
+) -> int:
+    complexity = 0
+    nodes_to_visit = [(node, increment_by)]
+
+    # We use an explicit stack instead of recursion,
+    # because deeply nested expressions hit the recursion limit:
+    while nodes_to_visit:
+        complexity += _process_node(*nodes_to_visit.pop(), nodes_to_visit)
+    return complexity
+
+
 def cognitive_score(funcdef: AnyFunctionDef) -> int:
     """
     A thin wrapper around 3rd party dependency.
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+"""
+Evaluation of constant ``ast`` nodes.
+
+Works the same way as :py:func:`ast.literal_eval` does,
+but iterables are evaluated with an explicit stack,
+so deeply nested literals do not raise ``RecursionError``.
+"""
+
+import ast
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union, cast
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.nodes import Constant
+
+#: Used to represent values that can not be evaluated.
+MISSING: Final = object()
+
+_NUMBERS: Final = (int, float, complex)
+
+_SIGNS: Final = (ast.UAdd, ast.USub)
+
+_COMPLEX_OPERATORS: Final = (ast.Add, ast.Sub)
+
+_ITERABLES: Final[Mapping[type, type]] = MappingProxyType({
+    ast.Tuple: tuple,
+    ast.List: list,
+    ast.Set: set,
+})
+
+_IterableNode = Union[ast.Tuple, ast.List, ast.Set, ast.Dict]
+
+#: Node and the size of the value stack when its children were pushed.
+_StackItem = Tuple[ast.AST, Optional[int]]
+
+
+def evaluate(node: ast.AST, strict: bool) -> Any:
+    """
+    Evaluates a node the same way as :py:func:`ast.literal_eval` does.
+
+    Copied from the CPython's source code.
+    Iterables must only be evaluated when their marks say they can be.
+    When ``strict`` is not set, ``ast.Name`` nodes are treated as constants.
+    """
+    evaluated: List[Any] = []
+    stack: List[_StackItem] = [(node, None)]
+    while stack:
+        current, start = stack.pop()
+        if start is not None:
+            evaluated[start:] = [_collect(current, evaluated[start:])]
+        elif isinstance(current, (ast.Tuple, ast.List, ast.Set, ast.Dict)):
+            stack.append((current, len(evaluated)))
+            # Marks guarantee that all children can be evaluated:
+            stack.extend((child, None) for child in _children(current))
+        else:
+            evaluated.append(_evaluate_scalar(current, strict))
+    return evaluated[0]
+
+
+def _children(node: _IterableNode) -> Sequence[ast.AST]:
+    # Children are popped from the stack, so they go in the reversed order:
+    if isinstance(node, ast.Dict):
+        keys = cast(List[ast.expr], node.keys)
+        return [*reversed(node.values), *reversed(keys)]
+    return node.elts[::-1]
+
+
+def _collect(node: ast.AST, children: Sequence[Any]) -> Any:
+    if isinstance(node, ast.Dict):
+        keys_count = len(node.keys)
+        return dict(zip(children[:keys_count], children[keys_count:]))
+    return _ITERABLES[type(node)](children)
+
+
+def _evaluate_scalar(node: ast.AST, strict: bool) -> Any:  # noqa: WPS231
+    if isinstance(node, (Constant, ast.NameConstant)):
+        return node.value
+    elif isinstance(node, ast.Num):  # pragma: py-gte-38
+        return node.n
+    elif isinstance(node, (ast.Str, ast.Bytes)):  # pragma: py-gte-38
+        # We wrap strings to tell the difference between strings and names:
+        return node.s if strict else '"{0!r}"'.format(node.s)
+    elif isinstance(node, ast.BinOp):
+        if isinstance(node.op, _COMPLEX_OPERATORS):
+            return _evaluate_complex(node, strict)
+    return _evaluate_signed_num(node, strict)
+
+
+def _evaluate_num(node: ast.AST, strict: bool) -> Any:
+    if isinstance(node, Constant):  # pragma: py-lt-38
+        # `ast.literal_eval` does not treat `bool` values as numbers:
+        is_bool = strict and isinstance(node.value, bool)
+        if isinstance(node.value, _NUMBERS) and not is_bool:
+            return node.value
+    elif isinstance(node, ast.Num):  # pragma: py-gte-38
+        return node.n
+    return MISSING
+
+
+def _evaluate_signed_num(node: ast.AST, strict: bool) -> Any:
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, _SIGNS):
+        operand = _evaluate_num(node.operand, strict)
+        if not isinstance(operand, _NUMBERS):
+            return MISSING
+        return +operand if isinstance(node.op, ast.UAdd) else -operand
+    elif isinstance(node, ast.Name) and not strict:
+        # That's what is modified from the original
+        # We return string names as is, see how we return strings:
+        return node.id
+    return _evaluate_num(node, strict)
+
+
+def _evaluate_complex(node: ast.BinOp, strict: bool) -> Any:
+    left = _evaluate_signed_num(node.left, strict)
+    right = _evaluate_num(node.right, strict)
+    if isinstance(left, (int, float)) and isinstance(right, complex):
+        if isinstance(node.op, ast.Add):
+            return left + right
+        return left - right
+    return MISSING
@@ -3,6 +3,8 @@
 import ast
 from typing import Optional
 
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.logic.safe_eval import get_literal_mark
 from wemake_python_styleguide.types import ContextNodes
 
 
@@ -12,20 +14,45 @@ def is_literal(node: ast.AST) -> bool:
 
     If the node contains only literals it will be evaluated.
     When node relies on some other names, it won't be evaluated.
+
+    Relies on the marks set by the ``set_literal_marks`` transformation.
     """
-    try:
-        ast.literal_eval(node)
-    except ValueError:
-        return False
-    else:
-        return True
+    mark = get_literal_mark(node)
+    return mark is not None and mark.has_value
 
 
 def get_parent(node: ast.AST) -> Optional[ast.AST]:
     """Returns the parent node or ``None`` if node has no parent."""
-    return getattr(node, 'wps_parent', None)
+    table, index = tables.find(node)
+    if table is None:
+        return None
+    return table.parents[index]
 
 
 def get_context(node: ast.AST) -> Optional[ContextNodes]:
-    """Returns the context or ``None`` if node has no context."""
-    return getattr(node, 'wps_context', None)
+    """
+    Returns the context or ``None`` if node has no context.
+
+    What we call "a context"?
+    Context is where exactly this node belongs on a global level.
+
+    Example:
+    .. code:: python
+
+        if some_value > 2:
+            test = 'passed'
+
+    Despite the fact ``test`` variable has ``Assign`` as it parent
+    it will have ``Module`` as a context.
+
+    What contexts do we respect?
+
+    - :py:class:`ast.Module`
+    - :py:class:`ast.ClassDef`
+    - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
+
+    """
+    table, index = tables.find(node)
+    if table is None:
+        return None
+    return table.contexts[index]
@@ -1,96 +1,114 @@
 # -*- coding: utf-8 -*-
 
-from ast import (
-    AST,
-    Add,
-    BinOp,
-    Bytes,
-    Dict,
-    List,
-    Name,
-    NameConstant,
-    Num,
-    Set,
-    Str,
-    Sub,
-    Tuple,
-    UAdd,
-    UnaryOp,
-    USub,
-)
-from typing import Any, Optional, Union
-
-from wemake_python_styleguide.compat.nodes import Constant
-
-
-def _convert_num(node: Optional[AST]):
-    if isinstance(node, Constant):  # pragma: py-lt-38
-        if isinstance(node.value, (int, float, complex)):
-            return node.value
-    elif isinstance(node, Num):  # pragma: py-gte-38
-        return node.n
-    elif isinstance(node, Name):  # That's what is modified from the original
-        # We return string names as is, see how we return strings:
-        return node.id
-    raise ValueError('malformed node or string: {0!r}'.format(node))
-
-
-def _convert_signed_num(node: Optional[AST]):
-    if isinstance(node, UnaryOp) and isinstance(node.op, (UAdd, USub)):
-        operand = _convert_num(node.operand)
-        return +operand if isinstance(node.op, UAdd) else -operand
-    return _convert_num(node)
-
-
-def _convert_complex(node: BinOp) -> Optional[complex]:
-    left = _convert_signed_num(node.left)
-    right = _convert_num(node.right)
-    if isinstance(left, (int, float)) and isinstance(right, complex):
-        if isinstance(node.op, Add):
-            return left + right
-        return left - right
-    return None
+"""
+Safe evaluation of constant ``ast`` nodes.
+
+We do not call :py:func:`ast.literal_eval` on the same subtrees
+over and over again. Instead, there's a single bottom-up pass
+(see ``set_literal_marks`` transformation) that marks every node
+that can be evaluated with a :class:`LiteralMark`.
+
+Marks are built from the already computed marks of the child nodes,
+so there are no exceptions involved for regular nodes.
+Marks only tell whether a node can be evaluated.
+Values are evaluated when visitors ask for them,
+so nested literals do not store copies of all their children.
+"""
+
+from ast import AST, Dict, List, Set, Tuple
+from typing import Any, Iterable, Optional, Sequence, Union, cast
 
+import attr
+from typing_extensions import final
 
-def _convert_iterable(node: Union[Tuple, List, Set, Dict]):
-    if isinstance(node, Tuple):
-        return tuple(map(literal_eval_with_names, node.elts))
-    elif isinstance(node, List):
-        return list(map(literal_eval_with_names, node.elts))
-    elif isinstance(node, Set):
-        return set(map(literal_eval_with_names, node.elts))
-    return dict(zip(
-        map(literal_eval_with_names, node.keys),
-        map(literal_eval_with_names, node.values),
-    ))
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.logic.evaluation import MISSING, evaluate
 
 
-def literal_eval_with_names(  # noqa: WPS231
-    node: Optional[AST],
-) -> Any:
+@final
+@attr.dataclass(frozen=True, slots=True)
+class LiteralMark(object):
     """
-    Safely evaluate constants and ``ast.Name`` nodes.
+    Represents the result of the literal analysis for a single node.
+
+    ``has_value`` tells whether this node is a constant literal.
+    ``has_named_value`` is the same, but treats ``ast.Name`` nodes as constants.
+    ``is_hashable`` tells whether the value can be used in sets and dicts.
+    """
+
+    node: AST
+    has_value: bool
+    has_named_value: bool
+    is_hashable: bool
+
+    @property
+    def value(self) -> Any:  # noqa: WPS110
+        """Returns what :py:func:`ast.literal_eval` would return."""
+        if not self.has_value:
+            return MISSING
+        return evaluate(self.node, strict=True)
 
-    We need this function to tell
-    that ``[name]`` and ``[name]`` are the same nodes.
+    @property
+    def named_value(self) -> Any:
+        """
+        Returns the value, but with ``ast.Name`` nodes as constants.
 
-    Copied from the CPython's source code.
-    Modified to treat ``ast.Name`` nodes as constants.
+        We need it to tell that ``[name]`` and ``[name]`` are the same nodes.
+        All constant literals have named values, so all marks have them.
+        """
+        return evaluate(self.node, strict=False)
 
-    See: :py:`ast.literal_eval` source.
 
-    We intentionally ignore complexity violation here,
-    becase we try to stay as close to the original source as possible.
+def get_literal_mark(node: Optional[AST]) -> Optional[LiteralMark]:
+    """Returns the literal mark or ``None`` if node is not a literal."""
+    if node is None:
+        return None
+    return cast(Optional[LiteralMark], tables.get_annotation(node, 'literal'))
+
+
+def mark_literal(node: AST) -> Optional[LiteralMark]:
+    """
+    Marks a single node from the marks of its children.
+
+    Children must be marked before their parents.
+    Returns ``None`` if node can not be evaluated in any way.
     """
-    if isinstance(node, (Constant, NameConstant)):
-        return node.value
-    elif isinstance(node, (Str, Bytes, Num)):  # pragma: py-gte-38
-        # We wrap strings to tell the difference between strings and names:
-        return node.n if isinstance(node, Num) else '"{0!r}"'.format(node.s)
-    elif isinstance(node, (Tuple, List, Set, Dict)):
-        return _convert_iterable(node)
-    elif isinstance(node, BinOp) and isinstance(node.op, (Add, Sub)):
-        maybe_complex = _convert_complex(node)
-        if maybe_complex is not None:
-            return maybe_complex
-    return _convert_signed_num(node)
+    if isinstance(node, (Tuple, List, Set, Dict)):
+        mark = _mark_iterable(node)
+    else:
+        # Other nodes do not have literal children, they are cheap:
+        mark = LiteralMark(
+            node,
+            has_value=evaluate(node, strict=True) is not MISSING,
+            has_named_value=evaluate(node, strict=False) is not MISSING,
+            is_hashable=True,
+        )
+    if mark.has_value or mark.has_named_value:
+        return mark
+    return None
+
+
+def _mark_iterable(node: Union[Tuple, List, Set, Dict]) -> LiteralMark:
+    children: Sequence[Optional[AST]]
+    hashed_children: Sequence[Optional[AST]]
+    if isinstance(node, Dict):
+        children = [*node.keys, *node.values]
+        hashed_children = node.keys
+    else:
+        children = node.elts
+        hashed_children = node.elts if isinstance(node, Set) else []
+
+    marks = [get_literal_mark(child) for child in children]
+    # Unhashable keys and set items are really rare:
+    is_valid = _all_marks(map(get_literal_mark, hashed_children), 'is_hashable')
+    is_tuple = isinstance(node, Tuple)
+    return LiteralMark(
+        node,
+        has_value=is_valid and _all_marks(marks, 'has_value'),
+        has_named_value=is_valid and _all_marks(marks, 'has_named_value'),
+        is_hashable=is_tuple and _all_marks(marks, 'is_hashable'),
+    )
+
+
+def _all_marks(marks: Iterable[Optional[LiteralMark]], flag: str) -> bool:
+    return all(mark is not None and getattr(mark, flag) for mark in marks)
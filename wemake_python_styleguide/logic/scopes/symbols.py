@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-file symbol tables.
+
+We collect names that are bound and used in every context
+in a single pass over the node table of a file.
+Visitors query symbol tables instead of walking the tree again,
+so all of them share the same scoping rules.
+
+Contexts are the same as in ``get_context``:
+modules, classes, and functions.
+But decorators, base classes, annotations, and default values
+are evaluated where a class or a function is defined,
+so they belong to the outer scope, unlike ``get_context`` says.
+"""
+
+import ast
+from typing import Dict, List, Optional, Tuple, cast
+
+import attr
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.logic.naming.name_nodes import (
+    flat_variable_names,
+    get_variables_from_node,
+)
+from wemake_python_styleguide.types import ContextNodes
+
+#: Nodes with parts that are evaluated in the outer scope.
+_HEADERS: Final = (*tables.CONTEXTS, ast.arguments, ast.arg)
+
+#: Fields of these nodes that are evaluated in the outer scope.
+_HEADER_FIELDS: Final = (
+    'decorator_list',
+    'bases',
+    'keywords',
+    'returns',
+    'defaults',
+    'kw_defaults',
+    'annotation',
+)
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class Binding(object):
+    """
+    Represents names that are bound by a single node.
+
+    ``node`` is the statement that defines names:
+    ``import`` and ``with`` statements are used
+    instead of their ``alias`` and ``withitem`` nodes.
+    ``position`` is the traversal index of the original node.
+    """
+
+    node: ast.AST
+    names: Tuple[str, ...]
+    context: ContextNodes
+    position: int
+    is_local: bool
+
+
+@final
+class Scope(object):
+    """Represents all nodes, bindings, and usages of a single context."""
+
+    __slots__ = ('context', 'outer', 'nodes', 'bindings', 'definitions', 'uses')
+
+    def __init__(self, context: ContextNodes, outer: Optional['Scope']) -> None:
+        """Creates an empty scope inside the outer one."""
+        self.context = context
+        self.outer = outer
+        self.nodes: List[ast.AST] = []
+        self.bindings: List[Binding] = []
+        self.definitions: Dict[str, List[Binding]] = {}
+        self.uses: Dict[str, List[ast.Name]] = {}
+
+    def lookup(self, name: str, position: int) -> List[Binding]:
+        """Returns bindings of a name that are defined before the position."""
+        return [
+            binding
+            for binding in self.definitions.get(name, [])
+            if binding.position < position
+        ]
+
+    def add_node(self, node: ast.AST) -> None:
+        """Registers a node that directly belongs to this scope."""
+        self.nodes.append(node)
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            self.uses.setdefault(node.id, []).append(node)
+
+    def add_binding(self, binding: Binding) -> None:
+        """Registers new names in this scope."""
+        self.bindings.append(binding)
+        for name in binding.names:
+            self.definitions.setdefault(name, []).append(binding)
+
+
+@final
+class SymbolTable(object):
+    """Stores scopes of all contexts in a single file."""
+
+    __slots__ = ('scopes', 'bindings', 'node_scopes')
+
+    def __init__(self, table: tables.NodeTable) -> None:
+        """
+        Collects all scopes in a single pass over the node table.
+
+        Bindings are stored in the same order our visitors use.
+        Scopes of all nodes are stored in the order of the node table.
+        """
+        root_scope = Scope(cast(ContextNodes, table.nodes[0]), None)
+        self.scopes: Dict[ast.AST, Scope] = {root_scope.context: root_scope}
+        self.bindings: List[Binding] = []
+        self.node_scopes = [root_scope]
+
+        for index, node in enumerate(table.nodes):
+            parent = table.parents[index]
+            if parent is None:
+                continue  # root scope is already created
+
+            scope = self._get_node_scope(table, parent, node)
+            self.node_scopes.append(scope)
+            if isinstance(node, tables.CONTEXTS):
+                self.scopes[node] = Scope(node, scope)
+            scope.add_node(node)
+            self._bind(table, index, scope)
+
+    def _get_node_scope(
+        self,
+        table: tables.NodeTable,
+        parent: ast.AST,
+        node: ast.AST,
+    ) -> Scope:
+        if isinstance(node, ast.arg):
+            # Lambdas are not contexts, so their arguments belong
+            # to the closest context, even when lambdas are in headers:
+            context = table.contexts[table.index(node)]
+            return self.scopes[cast(ContextNodes, context)]
+        if self._is_header(parent, node):
+            # Headers are evaluated where their definition is:
+            while isinstance(parent, (ast.arguments, ast.arg)):
+                parent = cast(ast.AST, table.parents[table.index(parent)])
+            return self.node_scopes[table.index(parent)]
+        if isinstance(parent, tables.CONTEXTS):
+            return self.scopes[parent]
+        return self.node_scopes[table.index(parent)]
+
+    def _is_header(self, parent: ast.AST, node: ast.AST) -> bool:
+        if not isinstance(parent, _HEADERS):
+            return False
+        for field in _HEADER_FIELDS:
+            field_value = getattr(parent, field, None)
+            if isinstance(field_value, list) and node in field_value:
+                return True
+            if node is field_value:
+                return True
+        return False
+
+    def _bind(
+        self,
+        table: tables.NodeTable,
+        index: int,
+        scope: Scope,
+    ) -> None:
+        node = table.nodes[index]
+        names = self._get_local_names(node)
+        is_local = names is not None
+        if names is None:
+            names = self._get_block_names(node)
+        if names is None:
+            return
+
+        if isinstance(node, (ast.alias, ast.withitem)):
+            statement = cast(ast.AST, table.parents[index])
+        else:
+            statement = node
+
+        binding = Binding(
+            statement,
+            tuple(names),
+            scope.context,
+            index,
+            is_local=is_local,
+        )
+        self.bindings.append(binding)
+        scope.add_binding(binding)
+        table.annotate(node, 'binding', binding)
+
+    def _get_block_names(self, node: ast.AST) -> Optional[List[str]]:
+        if isinstance(node, (*FunctionNodes, ast.ClassDef, ast.ExceptHandler)):
+            return [node.name] if node.name else []
+        if isinstance(node, ast.alias):
+            return [node.asname or node.name]
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            return get_variables_from_node(node.target)
+        if isinstance(node, ast.withitem) and node.optional_vars:
+            return get_variables_from_node(node.optional_vars)
+        return None
+
+    def _get_local_names(self, node: ast.AST) -> Optional[List[str]]:
+        if isinstance(node, (ast.Assign, ast.AnnAssign)):
+            return list(flat_variable_names([node]))
+        if isinstance(node, ast.arg):
+            return [node.arg]
+        return None
+
+
+def get_symbols(node: ast.AST) -> SymbolTable:
+    """Returns the symbol table of a file with the given node."""
+    table = tables.get_table(node)
+    symbols = table.annotation(0, 'symbols')
+    if symbols is None:
+        symbols = SymbolTable(table)
+        table.annotate(table.nodes[0], 'symbols', symbols)
+    return cast(SymbolTable, symbols)
+
+
+def get_scope(context: ContextNodes) -> Scope:
+    """Returns the scope of a module, class, or function."""
+    return get_symbols(context).scopes[context]
+
+
+def get_binding(node: ast.AST) -> Binding:
+    """
+    Returns the binding of a node that defines names.
+
+    Should be only used with nodes that always define names:
+    assigns, arguments, definitions, loops, except handlers,
+    import aliases, and ``withitem`` nodes with variables.
+    """
+    get_symbols(node)
+    return cast(Binding, tables.get_annotation(node, 'binding'))
+
+
+def lookup(node: ast.Name) -> List[Binding]:
+    """Returns bindings of a name in its scope defined before the usage."""
+    _, position = tables.find(node)
+    return get_symbols(node).node_scopes[position].lookup(node.id, position)
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-file side tables with annotations for ``ast`` nodes.
+
+We used to call ``setattr`` on every node to store
+things like ``wps_parent`` and ``wps_context`` properties.
+It adds an instance dict entry per node,
+and parent pointers create reference cycles
+that can only be freed by the cyclic garbage collector.
+
+Now we store all annotations in a per-file :class:`NodeTable`.
+Nodes are indexed by their depth-first traversal order,
+which is the same order our visitors use,
+``id`` of a node is mapped to its index.
+Tables hold strong references to all nodes of a tree,
+so ``id`` values are never reused while the table is alive.
+
+Tables are owned by the checker that creates them.
+They are active for the current thread only while transformations
+and visitors run, and they are dropped when the checker finishes.
+Accessors never create or activate tables on their own,
+so nothing is kept alive when the owner goes away.
+Nodes do not reference tables, so memory is freed right away.
+"""
+
+import ast
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.compat.aliases import FunctionNodes
+from wemake_python_styleguide.types import ContextNodes
+
+#: Nodes that we use as contexts, see ``get_context`` for more information.
+CONTEXTS: Final = (
+    ast.Module,
+    ast.ClassDef,
+    *FunctionNodes,
+)
+
+_NOT_FOUND: Final = -1
+
+_Column = Dict[int, object]
+_Entry = Tuple[ast.AST, Optional[ast.AST], Optional[ContextNodes]]
+
+
+@final
+class NodeTable(object):
+    """
+    Stores annotations for all nodes of a single tree.
+
+    Parents and contexts are stored as lists, since every node has them.
+    Other annotations are sparse: they are stored in named columns.
+    """
+
+    __slots__ = (
+        'nodes',
+        'parents',
+        'contexts',
+        'ends',
+        'indexes',
+        'columns',
+        '_depth',
+        '_was_active',
+    )
+
+    def __init__(self, tree: ast.AST) -> None:
+        """
+        Indexes all nodes of a tree in a depth-first pre-order.
+
+        This order guarantees that parents come before their children
+        and that every subtree is stored as a continuous slice.
+        """
+        self.nodes: List[ast.AST] = []
+        self.parents: List[Optional[ast.AST]] = []
+        self.contexts: List[Optional[ContextNodes]] = []
+        self.ends: List[int] = []
+        self.indexes: Dict[int, int] = {}
+        self.columns: Dict[str, _Column] = {}
+        self._depth = 0
+        self._was_active = False
+
+        stack: List[_Entry] = [(tree, None, None)]
+        while stack:
+            node, parent, context = stack.pop()
+            self.indexes[id(node)] = len(self.nodes)
+            self.nodes.append(node)
+            self.parents.append(parent)
+            self.contexts.append(context)
+            self.ends.append(len(self.nodes))
+
+            if isinstance(node, CONTEXTS):
+                context = node
+            stack.extend(
+                (child, node, context)
+                for child in reversed(list(ast.iter_child_nodes(node)))
+            )
+        self._set_ends()
+
+    def index(self, node: ast.AST) -> int:
+        """Returns the node's index or ``-1`` if node is not in this table."""
+        return self.indexes.get(id(node), _NOT_FOUND)
+
+    def annotate(self, node: ast.AST, column: str, annotation: object) -> None:
+        """Stores an annotation for the given node."""
+        self.columns.setdefault(column, {})[self.index(node)] = annotation
+
+    def annotation(self, index: int, column: str) -> Optional[object]:
+        """Returns the annotation of a node with the given index."""
+        return self.columns.get(column, {}).get(index)
+
+    def __enter__(self) -> 'NodeTable':
+        """Activates this table until the block ends, unless it was active."""
+        if not self._depth:
+            self._was_active = self in _active.tables
+        self._depth += 1
+        activate(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Deactivates this table, when the outermost block has activated it."""
+        self._depth -= 1
+        if self._depth or self._was_active:
+            return
+        # Table might be already dropped by its owner:
+        if self in _active.tables:
+            _active.tables.remove(self)
+
+    def _set_ends(self) -> None:
+        # Children are always stored after their parents,
+        # so we can collect subtree ends in a single backward pass:
+        ends = reversed(self.ends)
+        for parent, end in zip(reversed(self.parents), ends):
+            if parent is not None:
+                parent_index = self.indexes[id(parent)]
+                self.ends[parent_index] = max(self.ends[parent_index], end)
+
+
+class _ActiveTables(threading.local):
+    def __init__(self) -> None:
+        self.tables: List[NodeTable] = []
+
+
+_active: Final = _ActiveTables()
+
+
+def activate(table: NodeTable) -> None:
+    """Makes table visible to all accessors in the current thread."""
+    if table not in _active.tables:
+        _active.tables.append(table)
+
+
+def drop(table: NodeTable) -> None:
+    """Deactivates the table and releases all its nodes and annotations."""
+    if table in _active.tables:
+        _active.tables.remove(table)
+    table.nodes.clear()
+    table.parents.clear()
+    table.contexts.clear()
+    table.ends.clear()
+    table.indexes.clear()
+    table.columns.clear()
+
+
+def find(node: ast.AST) -> Tuple[Optional[NodeTable], int]:
+    """Returns the active table of the node and the node's index there."""
+    for table in reversed(_active.tables):
+        index = table.index(node)
+        if index != _NOT_FOUND:
+            return table, index
+    return None, _NOT_FOUND
+
+
+def get_table(node: ast.AST) -> NodeTable:
+    """
+    Returns the active table with the given node.
+
+    Tables are never created here, their owners activate them.
+    Raises ``LookupError`` when the node is not in any active table.
+    """
+    table, _ = find(node)
+    if table is None:
+        raise LookupError('Node is not in any active table: {0!r}'.format(
+            node,
+        ))
+    return table
+
+
+def get_annotation(node: ast.AST, column: str) -> Optional[object]:
+    """Returns the annotation of a node or ``None`` if there's nothing."""
+    table, index = find(node)
+    if table is None:
+        return None
+    return table.annotation(index, column)
@@ -35,3 +35,29 @@ def parts(node: AnyAccess) -> Iterable[ast.AST]:
         if chained_item is None:
             return
         iterator = chained_item
+
+
+def get_dotted_name(node: ast.AST) -> Optional[str]:
+    """
+    Returns ``.`` separated name for names and attribute chains.
+
+    We build names directly from nodes, so it is much cheaper
+    than rendering the source code of a node.
+
+    >>> import ast
+    >>> get_dotted_name(ast.parse('self.some.method').body[0].value)
+    'self.some.method'
+
+    >>> get_dotted_name(ast.parse('method().some').body[0].value) is None
+    True
+
+    """
+    names = []
+    while isinstance(node, ast.Attribute):
+        names.append(node.attr)
+        node = node.value
+
+    if not isinstance(node, ast.Name):
+        return None
+    names.append(node.id)
+    return '.'.join(reversed(names))
@@ -2,11 +2,9 @@
 
 import ast
 
+from wemake_python_styleguide.logic import aggregates
+
 
 def count_boolops(node: ast.AST) -> int:
     """Counts how many ``BoolOp`` nodes there are in a node."""
-    return len([
-        subnode
-        for subnode in ast.walk(node)
-        if isinstance(subnode, ast.BoolOp)
-    ])
+    return aggregates.count_boolops(node)
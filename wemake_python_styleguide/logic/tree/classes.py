@@ -1,9 +1,36 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional
+import ast
+from typing import Optional, Tuple, cast
 
+import attr
+from typing_extensions import final
+
+from wemake_python_styleguide.compat.aliases import AssignNodes, FunctionNodes
+from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.constants import ALLOWED_BUILTIN_CLASSES
+from wemake_python_styleguide.logic import tables, walk
 from wemake_python_styleguide.logic.naming.builtins import is_builtin_name
+from wemake_python_styleguide.logic.scopes.symbols import get_scope
+from wemake_python_styleguide.types import AnyAssign, AnyFunctionDef
+
+
+@final
+@attr.dataclass(frozen=True, slots=True)
+class ClassSummary(object):
+    """
+    Represents members of a single class.
+
+    Methods and assigns are the ones defined in the class body,
+    they are stored in the same order as they are defined.
+    Instance attributes are all ``self.some = ...`` like stores
+    inside the class, including nested functions and classes.
+    """
+
+    methods: Tuple[AnyFunctionDef, ...]
+    assigns: Tuple[AnyAssign, ...]
+    slots: Tuple[AnyAssign, ...]
+    instance_attributes: Tuple[ast.Attribute, ...]
 
 
 def is_forbidden_super_class(class_name: Optional[str]) -> bool:
@@ -34,3 +61,47 @@ def is_forbidden_super_class(class_name: Optional[str]) -> bool:
     if class_name in ALLOWED_BUILTIN_CLASSES:
         return False
     return is_builtin_name(class_name)
+
+
+def get_summary(node: ast.ClassDef) -> ClassSummary:
+    """
+    Returns members of a class.
+
+    Summary is collected once per class and then shared between visitors.
+    """
+    summary = tables.get_annotation(node, 'class_summary')
+    if summary is None:
+        summary = _summarize(node)
+        tables.get_table(node).annotate(node, 'class_summary', summary)
+    return cast(ClassSummary, summary)
+
+
+def _summarize(node: ast.ClassDef) -> ClassSummary:
+    own_nodes = get_scope(node).nodes
+    assigns = tuple(
+        sub_node
+        for sub_node in own_nodes
+        if isinstance(sub_node, AssignNodes)
+    )
+    return ClassSummary(
+        methods=tuple(
+            sub_node
+            for sub_node in own_nodes
+            if isinstance(sub_node, FunctionNodes)
+        ),
+        assigns=assigns,
+        slots=tuple(
+            assign
+            for assign in assigns
+            if any(
+                isinstance(target, ast.Name) and target.id == '__slots__'
+                for target in get_assign_targets(assign)
+            )
+        ),
+        instance_attributes=tuple(
+            sub_node
+            for sub_node in walk.get_subtree(node)
+            if isinstance(sub_node, ast.Attribute) and
+            isinstance(sub_node.ctx, ast.Store)
+        ),
+    )
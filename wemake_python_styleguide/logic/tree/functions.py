@@ -4,7 +4,7 @@ from ast import Call, Yield, YieldFrom, arg
 from typing import Container, List, Optional
 
 from wemake_python_styleguide.compat.functions import get_posonlyargs
-from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic.tree.attributes import get_dotted_name
 from wemake_python_styleguide.logic.walk import is_contained
 from wemake_python_styleguide.types import (
     AnyFunctionDef,
@@ -25,12 +25,29 @@ def given_function_called(node: Call, to_check: Container[str]) -> str:
     ''
 
     """
-    function_name = source.node_to_string(node.func)
+    function_name = get_call_name(node)
     if function_name in to_check:
         return function_name
     return ''
 
 
+def get_call_name(node: Call) -> str:
+    """
+    Returns ``.`` separated name of a called function.
+
+    Returns an empty string when function is not a name or an attribute.
+
+    >>> import ast
+    >>> get_call_name(ast.parse('os.path.join()').body[0].value)
+    'os.path.join'
+
+    >>> get_call_name(ast.parse('some()()').body[0].value)
+    ''
+
+    """
+    return get_dotted_name(node.func) or ''
+
+
 def is_method(function_type: Optional[str]) -> bool:
     """
     Returns whether a given function type belongs to a class.
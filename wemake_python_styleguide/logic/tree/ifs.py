@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Union, cast
 
+from wemake_python_styleguide.logic import tables
 from wemake_python_styleguide.types import AnyNodes
 
 _IfAndElifASTNode = Union[ast.If, List[ast.stmt]]
@@ -10,7 +11,7 @@ _IfAndElifASTNode = Union[ast.If, List[ast.stmt]]
 
 def has_elif(node: ast.If) -> bool:
     """Tells if this node is a part of a ``if`` chain or just a single one."""
-    return getattr(node, 'wps_if_chain', False)  # noqa: WPS425
+    return tables.get_annotation(node, 'if_chain') is not None
 
 
 def has_else(node: ast.If) -> bool:
@@ -21,7 +22,7 @@ def has_else(node: ast.If) -> bool:
 
 def root_if(node: ast.If) -> Optional[ast.If]:
     """Returns the previous ``if`` node in the chain if it exists."""
-    return getattr(node, 'wps_if_chained', None)
+    return cast(Optional[ast.If], tables.get_annotation(node, 'if_chained'))
 
 
 def chain(node: ast.If) -> Iterable[_IfAndElifASTNode]:
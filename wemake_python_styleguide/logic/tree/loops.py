@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+import ast
+from typing import Optional, Union, cast
+
+from typing_extensions import Final
+
+from wemake_python_styleguide.compat.aliases import ForNodes
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.types import AnyFor
+
+#: Nodes that can own ``break`` and ``continue`` statements.
+LOOPS: Final = (*ForNodes, ast.While)
+
+_AnyLoop = Union[AnyFor, ast.While]
+
+
+def get_loop(node: Union[ast.Break, ast.Continue]) -> Optional[_AnyLoop]:
+    """
+    Returns the closest loop that contains ``break`` or ``continue`` node.
+
+    Note, that statements in ``else`` blocks of loops
+    belong to the enclosing loop, not to the one that owns ``else``.
+    """
+    return cast(Optional[_AnyLoop], tables.get_annotation(node, 'loop'))
+
+
+def has_break(node: _AnyLoop) -> bool:
+    """Tells whether the loop has its own ``break`` statement."""
+    return tables.get_annotation(node, 'has_break') is not None
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from ast import AST, Attribute, Call, ClassDef, walk
+from ast import AST, Attribute, Call, ClassDef
 
 from wemake_python_styleguide.logic.nodes import get_context
 from wemake_python_styleguide.logic.tree.functions import given_function_called
+from wemake_python_styleguide.logic.walk import get_subtree
 from wemake_python_styleguide.types import AnyFunctionDef
 
 
@@ -17,14 +18,14 @@ def _is_self_call(func: AnyFunctionDef, node: AST) -> bool:
 
 def _check_method_recursion(func: AnyFunctionDef) -> bool:
     return bool([
-        node for node in walk(func)
+        node for node in get_subtree(func)
         if _is_self_call(func, node)
     ])
 
 
 def _check_function_recursion(func: AnyFunctionDef) -> bool:
     return bool([
-        node for node in walk(func)
+        node for node in get_subtree(func)
         if isinstance(node, Call) and given_function_called(node, {func.name})
     ])
 
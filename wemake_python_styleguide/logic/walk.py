@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Iterator, Optional, Type, TypeVar, Union
+from typing import Iterator, List, Optional, Type, TypeVar, Union
 
+from wemake_python_styleguide.logic import tables
 from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.types import AnyNodes
 
@@ -74,3 +75,16 @@ def get_subnodes_by_type(
     for child in ast.walk(node):
         if isinstance(child, subnodes_type):
             yield child
+
+
+def get_subtree(node: ast.AST) -> List[ast.AST]:
+    """
+    Returns the node with all its children in depth-first order.
+
+    Unlike ``ast.walk`` it does not traverse the tree again
+    when the node has an active table.
+    """
+    table, index = tables.find(node)
+    if table is None:
+        return tables.NodeTable(node).nodes
+    return table.nodes[index:table.ends[index]]
@@ -58,6 +58,30 @@ You can also show all options that ``flake8`` supports by running:
     :str:`wemake_python_styleguide.options.defaults.ALLOWED_DOMAIN_NAMES`
 - ``forbidden-domain-names`` - list of forbidden domain names, defaults to
     :str:`wemake_python_styleguide.options.defaults.FORBIDDEN_DOMAIN_NAMES`
+- ``max-violations`` - maximum number of violations in a module,
+    other checks are skipped when it is reached,
+    use ``1`` to stop on the first violation, defaults to
+    :str:`wemake_python_styleguide.options.defaults.MAX_VIOLATIONS`
+- ``max-file-seconds`` - maximum number of seconds to check a module,
+    visitors that do not fit in are skipped, defaults to
+    :str:`wemake_python_styleguide.options.defaults.MAX_FILE_SECONDS`
+- ``max-visitor-seconds`` - maximum number of seconds to run a visitor,
+    visitors that do not fit in are skipped, defaults to
+    :str:`wemake_python_styleguide.options.defaults.MAX_VISITOR_SECONDS`
+- ``checks-tier`` - tier of visitors to run: ``fast``, ``standard``,
+    or ``full``, cheaper tiers skip expensive checks, defaults to
+    :str:`wemake_python_styleguide.options.defaults.CHECKS_TIER`
+- ``baseline-file`` - file with known violations that are not reported,
+    see :mod:`wemake_python_styleguide.baseline`, defaults to
+    :str:`wemake_python_styleguide.options.defaults.BASELINE_FILE`
+- ``trace-file`` - file to write trace events of each checked module,
+    its transformation, and visitors, see
+    :mod:`wemake_python_styleguide.tracing`, defaults to
+    :str:`wemake_python_styleguide.options.defaults.TRACE_FILE`
+- ``memory-profile`` - file to write memory used by the transformation
+    and each visitor of each checked module, see
+    :mod:`wemake_python_styleguide.tracing`, defaults to
+    :str:`wemake_python_styleguide.options.defaults.MEMORY_PROFILE`
 
 .. rubric:: Complexity options
 
@@ -136,13 +160,14 @@ You can also show all options that ``flake8`` supports by running:
 
 """
 
-from typing import ClassVar, Mapping, Optional, Sequence, Union
+from typing import ClassVar, Dict, Mapping, Optional, Sequence, Union
 
 import attr
 from flake8.options.manager import OptionManager
 from typing_extensions import final
 
 from wemake_python_styleguide.options import defaults
+from wemake_python_styleguide.presets import tiers
 
 ConfigValuesTypes = Union[str, int, bool, Sequence[str]]
 
@@ -160,6 +185,7 @@ class _Option(object):
     action: str = 'store'
     comma_separated_list: bool = False
     dest: Optional[str] = None
+    choices: Optional[Sequence[str]] = None
 
     def __attrs_post_init__(self):
         """Is called after regular init is done."""
@@ -167,6 +193,11 @@ class _Option(object):
             self, 'help', ' '.join((self.help, 'Defaults to: %default')),
         )
 
+    @property
+    def dest_name(self) -> str:
+        """Returns the name of an attribute that stores this option."""
+        return self.dest or self.long_option_name[2:].replace('-', '_')
+
     def asdict_no_none(self) -> Mapping[str, ConfigValuesTypes]:
         dct = attr.asdict(self)
         return {key: opt for key, opt in dct.items() if opt is not None}
@@ -237,6 +268,46 @@ class Configuration(object):
             type='string',
             comma_separated_list=True,
         ),
+        _Option(
+            '--max-violations',
+            defaults.MAX_VIOLATIONS,
+            'Maximum amount of violations per module, 0 means no limit.',
+        ),
+        _Option(
+            '--max-file-seconds',
+            defaults.MAX_FILE_SECONDS,
+            'Maximum seconds to check a module, 0 means no limit.',
+        ),
+        _Option(
+            '--max-visitor-seconds',
+            defaults.MAX_VISITOR_SECONDS,
+            'Maximum seconds to run a single visitor, 0 means no limit.',
+        ),
+        _Option(
+            '--checks-tier',
+            defaults.CHECKS_TIER,
+            'Tier of checks to run: fast, standard, or full.',
+            type='choice',
+            choices=tuple(tiers.TIERS),
+        ),
+        _Option(
+            '--baseline-file',
+            defaults.BASELINE_FILE,
+            'Baseline file with known violations that are not reported.',
+            type=None,
+        ),
+        _Option(
+            '--trace-file',
+            defaults.TRACE_FILE,
+            'File to write trace events of checked modules and visitors.',
+            type=None,
+        ),
+        _Option(
+            '--memory-profile',
+            defaults.MEMORY_PROFILE,
+            'File to write memory used by visitors of checked modules.',
+            type=None,
+        ),
 
         # Complexity:
 
@@ -389,3 +460,10 @@ class Configuration(object):
         """Registers options for our plugin."""
         for option in self._options:
             parser.add_option(**option.asdict_no_none())
+
+    def get_defaults(self) -> Dict[str, ConfigValuesTypes]:
+        """Returns default values of all options by their attribute names."""
+        return {
+            option.dest_name: option.default
+            for option in self._options
+        }
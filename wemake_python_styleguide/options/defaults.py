@@ -44,6 +44,27 @@ ALLOWED_DOMAIN_NAMES: Final = ()
 #: Domain names that extends variable names' blacklist.
 FORBIDDEN_DOMAIN_NAMES: Final = ()
 
+#: Maximum amount of violations per module, ``0`` means there's no limit.
+MAX_VIOLATIONS: Final = 0
+
+#: Maximum seconds to check a single module, ``0`` means there's no limit.
+MAX_FILE_SECONDS: Final = 0
+
+#: Maximum seconds to run a single visitor, ``0`` means there's no limit.
+MAX_VISITOR_SECONDS: Final = 0
+
+#: Tier of visitors to run, all visitors are in the ``full`` tier.
+CHECKS_TIER: Final = 'full'
+
+#: Baseline file with known violations, empty string means there's no file.
+BASELINE_FILE: Final = ''
+
+#: File to write trace events into, empty string means there's no file.
+TRACE_FILE: Final = ''
+
+#: File to write memory usage into, empty string means there's no file.
+MEMORY_PROFILE: Final = ''
+
 
 # ===========
 # Complexity:
@@ -6,6 +6,7 @@ import attr
 from typing_extensions import final
 
 from wemake_python_styleguide.options import defaults
+from wemake_python_styleguide.presets import tiers
 from wemake_python_styleguide.types import ConfigurationOptions
 
 
@@ -67,6 +68,13 @@ class _ValidatedOptions(object):
     nested_classes_whitelist: Tuple[str, ...] = attr.ib(converter=tuple)
     allowed_domain_names: Tuple[str, ...] = attr.ib(converter=tuple)
     forbidden_domain_names: Tuple[str, ...] = attr.ib(converter=tuple)
+    max_violations: int = attr.ib(validator=[_min_max(min=0)])
+    max_file_seconds: int = attr.ib(validator=[_min_max(min=0)])
+    max_visitor_seconds: int = attr.ib(validator=[_min_max(min=0)])
+    checks_tier: str = attr.ib(validator=[attr.validators.in_(tiers.TIERS)])
+    baseline_file: str
+    trace_file: str
+    memory_profile: str
 
     # Complexity:
     max_arguments: int = attr.ib(validator=[_min_max(min=1)])
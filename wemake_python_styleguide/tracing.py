@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Writes trace events and memory usage of checks.
+
+Aggregate timings do not show stragglers and load imbalance
+between ``flake8`` job processes. So, spans can be written into a file:
+
+.. code:: bash
+
+    flake8 --trace-file=trace.json --jobs=4 .
+
+Open this file with ``chrome://tracing`` or https://ui.perfetto.dev
+to view each checked file, its ``ast`` transformation,
+and each visitor as spans of the process that checked them.
+
+The file uses the JSON array format of trace events.
+Spans of each file are appended with a single write
+as soon as the file is checked,
+so all processes can write into the same file.
+That's why the closing bracket is omitted, viewers do not require it.
+
+Memory usage can be written into a file as well:
+
+.. code:: bash
+
+    flake8 --memory-profile=memory.jsonl --jobs=4 .
+
+It contains a JSON object per line for each checked file:
+its ``filename``, ``pid`` of the process that checked it,
+``peak_rss`` of this process in bytes after the file is checked,
+and ``steps``: the transformation and each visitor by its class name.
+
+``tracemalloc`` is used to find out how many bytes each step
+has ``allocated`` at most and how many of them are ``retained``
+when it is finished: mostly, violations and internal state of visitors.
+Visitors keep their state until they check the next file.
+Traces are cleared before each step, so other ``tracemalloc``
+users do not work in this mode. Checks are also several times slower.
+
+Nothing is measured or stored when these options are not set.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from typing_extensions import Final, final
+
+from wemake_python_styleguide.types import ConfigurationOptions
+
+if sys.platform != 'win32':  # pragma: no cover
+    import resource  # noqa: WPS433
+
+#: Trace events use microseconds.
+_MICROSECONDS: Final = 1000000
+
+_TRACE_START: Final = '[\n'
+
+#: ``ru_maxrss`` is in bytes on macOS and in kilobytes on other systems.
+_RSS_UNIT: Final = 1 if sys.platform == 'darwin' else 1024
+
+#: Several threads might check files with the same trace files.
+_write_lock: Final = threading.Lock()
+
+
+@final
+class Trace(object):
+    """Spans of a single checked file, they are written all at once."""
+
+    __slots__ = ('start', '_trace_file', '_filename', '_events')
+
+    def __init__(self, trace_file: str, filename: str) -> None:
+        """Starts the span of a file, empty ``trace_file`` disables it."""
+        self.start = time.perf_counter()
+        self._trace_file = trace_file
+        self._filename = filename
+        self._events: List[str] = []
+
+    def add_span(self, name: str, category: str, start: float) -> None:
+        """Adds a span that has started at ``start`` and ends now."""
+        if not self._trace_file:
+            return
+
+        end = time.perf_counter()
+        self._events.append(json.dumps({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start * _MICROSECONDS,
+            'dur': (end - start) * _MICROSECONDS,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': {'filename': self._filename},
+        }))
+
+    def finish(self) -> None:
+        """Adds the span of the whole file and writes all spans."""
+        self.add_span(self._filename, 'file', self.start)
+        if self._events:
+            trace_events = '{0},\n'.format(',\n'.join(self._events))
+            _append(self._trace_file, trace_events, _TRACE_START)
+            self._events = []
+
+
+@final
+class MemoryProfile(object):
+    """Memory used by each step of a single checked file."""
+
+    __slots__ = ('_profile_file', '_filename', '_steps')
+
+    def __init__(self, profile_file: str, filename: str) -> None:
+        """Starts ``tracemalloc``, empty ``profile_file`` disables it."""
+        self._profile_file = profile_file
+        self._filename = filename
+        self._steps: Dict[str, Dict[str, int]] = {}
+        if profile_file and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def start_step(self) -> None:
+        """Starts to count memory of the next step from zero."""
+        if self._profile_file:
+            tracemalloc.clear_traces()
+
+    def add_step(self, name: str) -> None:
+        """Stores memory that was used since the step has started."""
+        if self._profile_file:
+            retained, allocated = tracemalloc.get_traced_memory()
+            self._steps[name] = {'allocated': allocated, 'retained': retained}
+
+    def finish(self) -> None:
+        """Writes memory of all steps."""
+        if self._steps:
+            file_memory = json.dumps({
+                'filename': self._filename,
+                'pid': os.getpid(),
+                'peak_rss': _get_peak_rss(),
+                'steps': self._steps,
+            })
+            _append(self._profile_file, '{0}\n'.format(file_memory))
+            self._steps = {}
+
+
+def create_trace_files(options: ConfigurationOptions) -> None:
+    """Starts new trace files, job processes only append to them."""
+    if multiprocessing.current_process().name != 'MainProcess':
+        return
+
+    trace_files = (
+        (options.trace_file, _TRACE_START),
+        (options.memory_profile, ''),
+    )
+    for trace_file, file_start in trace_files:
+        if trace_file:
+            with open(trace_file, 'w') as trace:
+                trace.write(file_start)
+
+
+def _get_peak_rss() -> Optional[int]:
+    if sys.platform == 'win32':  # pragma: no cover
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT
+
+
+def _append(trace_file: str, trace_lines: str, file_start: str = '') -> None:
+    with _write_lock:
+        # Unbuffered file writes all lines with a single system call:
+        with open(trace_file, 'ab', buffering=0) as trace:
+            # Trace file is created here, when checker is used without flake8:
+            if not trace.tell():
+                trace_lines = file_start + trace_lines
+            trace.write(trace_lines.encode('utf8'))
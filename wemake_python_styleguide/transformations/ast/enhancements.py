@@ -1,17 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Optional, Tuple, Type
+from typing import List, Optional
 
-from wemake_python_styleguide.compat.aliases import FunctionNodes
-from wemake_python_styleguide.logic.nodes import get_parent
-from wemake_python_styleguide.types import ContextNodes
-
-_CONTEXTS: Tuple[Type[ContextNodes], ...] = (
-    ast.Module,
-    ast.ClassDef,
-    *FunctionNodes,
-)
+from wemake_python_styleguide.logic import tables
+from wemake_python_styleguide.logic.safe_eval import mark_literal
+from wemake_python_styleguide.logic.tree.loops import LOOPS
 
 
 def set_if_chain(tree: ast.AST) -> ast.AST:
@@ -36,65 +30,81 @@ def set_if_chain(tree: ast.AST) -> ast.AST:
     Since they are very similar it very hard to make a different when
     actually working with nodes. So, we need a simple way to separate them.
     """
-    for statement in ast.walk(tree):
+    table = tables.get_table(tree)
+    for statement in table.nodes:
         if isinstance(statement, ast.If):
-            _apply_if_statement(statement)
+            _apply_if_statement(table, statement)
     return tree
 
 
-def set_node_context(tree: ast.AST) -> ast.AST:
+def set_literal_marks(tree: ast.AST) -> ast.AST:
     """
-    Used to set proper context to all nodes.
+    Used to evaluate all constant literals in a single pass.
 
-    What we call "a context"?
-    Context is where exactly this node belongs on a global level.
+    We visit nodes bottom-up: reversed pre-order
+    guarantees that all children are marked before their parents.
+    So, each node is evaluated from the marks of its children
+    without evaluating the same nested literals again.
 
-    Example:
-    .. code:: python
+    Nodes that can not be evaluated do not get any marks.
 
-        if some_value > 2:
-            test = 'passed'
+    .. versionadded:: 0.14.0
+
+    """
+    table = tables.get_table(tree)
+    for node in reversed(table.nodes):
+        mark = mark_literal(node)
+        if mark is not None:
+            table.annotate(node, 'literal', mark)
+    return tree
 
-    Despite the fact ``test`` variable has ``Assign`` as it parent
-    it will have ``Module`` as a context.
 
-    What contexts do we respect?
+def set_loop_owners(tree: ast.AST) -> ast.AST:
+    """
+    Used to find loops that own ``break`` and ``continue`` statements.
 
-    - :py:class:`ast.Module`
-    - :py:class:`ast.ClassDef`
-    - :py:class:`ast.FunctionDef` and :py:class:`ast.AsyncFunctionDef`
+    Every node inherits the closest loop from its parent,
+    parents are always indexed before their children.
+    Statements in ``else`` blocks belong to the enclosing loop,
+    because ``break`` there does not stop the loop that owns ``else``.
+    So, we find owners of all statements in a single pass
+    instead of walking each loop and all its nested loops again.
 
-    .. versionchanged:: 0.8.1
+    .. versionadded:: 0.14.0
 
     """
-    for statement in ast.walk(tree):
-        current_context = _find_context(statement, _CONTEXTS)
-        setattr(statement, 'wps_context', current_context)  # noqa: B010
+    table = tables.get_table(tree)
+    owners: List[Optional[ast.AST]] = []
+    for index, node in enumerate(table.nodes):
+        parent = table.parents[index]
+        if parent is None:
+            owners.append(None)
+        elif isinstance(parent, LOOPS) and node not in parent.orelse:
+            owners.append(parent)
+        else:
+            owners.append(owners[table.index(parent)])
+        _apply_loop_owner(table, node, owners[-1])
     return tree
 
 
-def _find_context(
+def _apply_loop_owner(
+    table: tables.NodeTable,
     node: ast.AST,
-    contexts: Tuple[Type[ast.AST], ...],
-) -> Optional[ast.AST]:
-    """
-    We changed how we find and assign contexts in 0.8.1 version.
+    loop: Optional[ast.AST],
+) -> None:
+    """We need to link loop control statements with their loops."""
+    if loop is None or not isinstance(node, (ast.Break, ast.Continue)):
+        return
 
-    It happened because of the bug #520
-    See: https://github.com/wemake-services/wemake-python-styleguide/issues/520
-    """
-    parent = get_parent(node)
-    if parent is None:
-        return None
-    elif isinstance(parent, contexts):
-        return parent
-    return _find_context(parent, contexts)
+    table.annotate(node, 'loop', loop)
+    if isinstance(node, ast.Break):
+        table.annotate(loop, 'has_break', True)  # noqa: WPS425
 
 
-def _apply_if_statement(statement: ast.If) -> None:
+def _apply_if_statement(table: tables.NodeTable, statement: ast.If) -> None:
     """We need to add extra properties to ``if`` conditions."""
     for child in ast.iter_child_nodes(statement):
         if isinstance(child, ast.If):
             if child in statement.orelse:
-                setattr(statement, 'wps_if_chained', True)  # noqa: WPS425
-                setattr(child, 'wps_if_chain', statement)  # noqa: B010
+                table.annotate(statement, 'if_chained', True)  # noqa: WPS425
+                table.annotate(child, 'if_chain', statement)
@@ -3,52 +3,19 @@
 import ast
 
 from pep8ext_naming import NamingChecker
-from typing_extensions import final
 
+from wemake_python_styleguide.logic import tables
 from wemake_python_styleguide.transformations.ast.bugfixes import (
     fix_async_offset,
     fix_line_number,
 )
 from wemake_python_styleguide.transformations.ast.enhancements import (
     set_if_chain,
-    set_node_context,
+    set_literal_marks,
+    set_loop_owners,
 )
 
 
-@final
-class _ClassVisitor(ast.NodeVisitor):
-    """Used to set method types inside classes."""
-
-    def __init__(self, transformer: NamingChecker) -> None:
-        super().__init__()
-        self.transformer = transformer
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802
-        self.transformer.tag_class_functions(node)
-        self.generic_visit(node)
-
-
-def _set_parent(tree: ast.AST) -> ast.AST:
-    """
-    Sets parents for all nodes that do not have this prop.
-
-    This step is required due to how `flake8` works.
-    It does not set the same properties as `ast` module.
-
-    This function was the cause of `issue-112`. Twice.
-    Since the ``0.6.1`` we use ``'wps_parent'`` with a prefix.
-    This should fix the issue with conflicting plugins.
-
-    .. versionchanged:: 0.0.11
-    .. versionchanged:: 0.6.1
-
-    """
-    for statement in ast.walk(tree):
-        for child in ast.iter_child_nodes(statement):
-            setattr(child, 'wps_parent', statement)  # noqa: B010
-    return tree
-
-
 def _set_function_type(tree: ast.AST) -> ast.AST:
     """
     Sets the function type for methods.
@@ -56,19 +23,30 @@ def _set_function_type(tree: ast.AST) -> ast.AST:
     Can set: `method`, `classmethod`, `staticmethod`.
 
     .. versionchanged:: 0.3.0
+    .. versionchanged:: 0.14.0
 
     """
-    transformer = _ClassVisitor(NamingChecker(tree, 'stdin'))
-    transformer.visit(tree)
+    transformer = NamingChecker(tree, 'stdin')
+    for node in tables.get_table(tree).nodes:
+        if isinstance(node, ast.ClassDef):
+            transformer.tag_class_functions(node)
     return tree
 
 
-def transform(tree: ast.AST) -> ast.AST:
+def transform(tree: ast.AST, table: tables.NodeTable) -> ast.AST:
     """
     Mutates the given ``ast`` tree.
 
     Applies all possible tranformations.
 
+    Parents and contexts of all nodes are stored in the passed
+    :class:`wemake_python_styleguide.logic.tables.NodeTable` instance,
+    other annotations are added there as well.
+    We do not modify nodes at all since ``0.14.0``,
+    it used to be the cause of `issue-112`. Twice.
+    The table is only active while transformations run,
+    its owner activates it again when visitors run.
+
     Ordering:
     - initial ones
     - bugfixes
@@ -76,8 +54,7 @@ def transform(tree: ast.AST) -> ast.AST:
 
     """
     pipeline = (
-        # Initial, should be the first ones, ordering inside is important:
-        _set_parent,
+        # Initial, should be the first one:
         _set_function_type,
 
         # Bugfixes, order is not important:
@@ -85,10 +62,12 @@ def transform(tree: ast.AST) -> ast.AST:
         fix_line_number,
 
         # Enhancements, order is not important:
-        set_node_context,
         set_if_chain,
+        set_literal_marks,
+        set_loop_owners,
     )
 
-    for tranformation in pipeline:
-        tree = tranformation(tree)
+    with table:
+        for tranformation in pipeline:
+            tree = tranformation(tree)
     return tree
@@ -129,6 +129,34 @@ class ConfigurationOptions(Protocol):
     def forbidden_domain_names(self) -> Tuple[str, ...]:
         ...
 
+    @property
+    def max_violations(self) -> int:
+        ...
+
+    @property
+    def max_file_seconds(self) -> int:
+        ...
+
+    @property
+    def max_visitor_seconds(self) -> int:
+        ...
+
+    @property
+    def checks_tier(self) -> str:
+        ...
+
+    @property
+    def baseline_file(self) -> str:
+        ...
+
+    @property
+    def trace_file(self) -> str:
+        ...
+
+    @property
+    def memory_profile(self) -> str:
+        ...
+
     # Complexity:
     @property
     def max_arguments(self) -> int:
@@ -54,6 +54,7 @@ Reference
 import abc
 import ast
 import tokenize
+from functools import lru_cache
 from typing import ClassVar, Optional, Set, Tuple, Union
 
 from typing_extensions import final
@@ -66,7 +67,22 @@ ErrorNode = Union[
 ]
 
 
-class BaseViolation(object, metaclass=abc.ABCMeta):
+class _ViolationMeta(abc.ABCMeta):
+    """
+    Adds empty ``__slots__`` to all violation classes.
+
+    Violations only store their location and message parts,
+    so instances do not need ``__dict__`` at all.
+    There can be thousands of violations in a single legacy module.
+    """
+
+    def __new__(cls, name, bases, namespace):
+        """Creates violation class without instance dictionary."""
+        namespace.setdefault('__slots__', ())
+        return super().__new__(cls, name, bases, namespace)
+
+
+class BaseViolation(object, metaclass=_ViolationMeta):
     """
     Abstract base class for all style violations.
 
@@ -75,6 +91,10 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
 
     Each subclass must define ``error_template`` and ``code`` fields.
 
+    Violations do not keep their nodes, only locations are stored.
+    So, trees and tokens can be freed as soon as the visitor is finished.
+    The message is formatted only when it is requested.
+
     Attributes:
         error_template: message that will be shown to user after formatting.
         code: violation unique number. Used to identify the violation.
@@ -84,6 +104,8 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
 
     """
 
+    __slots__ = ('_position', '_text', '_baseline')
+
     error_template: ClassVar[str]
     code: ClassVar[int]
     previous_codes: ClassVar[Set[int]]
@@ -107,7 +129,7 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
             baseline: some complexity violations show the logic threshold here.
 
         """
-        self._node = node
+        self._position = self._node_location(node)
         self._text = text
         self._baseline = baseline
 
@@ -137,7 +159,7 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
         Adds violation letter to the numbers.
         Also ensures that codes like ``3`` will be represented as ``WPS003``.
         """
-        return 'WPS{0}'.format(str(self.code).zfill(3))
+        return _format_code(self.code)
 
     @final
     def _postfix_information(self) -> str:
@@ -150,28 +172,29 @@ class BaseViolation(object, metaclass=abc.ABCMeta):
             return ''
         return self.postfix_template.format(self._baseline)
 
-    @abc.abstractmethod
+    @final
     def _location(self) -> Tuple[int, int]:
-        """Base method for showing error location."""
+        """Returns error location that was stored on creation."""
+        return self._position
+
+    @abc.abstractmethod
+    def _node_location(self, node) -> Tuple[int, int]:
+        """Base method for finding error location."""
 
 
 class _BaseASTViolation(BaseViolation, metaclass=abc.ABCMeta):
     """Used as a based type for all ``ast`` violations."""
 
-    _node: Optional[ast.AST]
-
     @final
-    def _location(self) -> Tuple[int, int]:
-        line_number = getattr(self._node, 'lineno', 0)
-        column_offset = getattr(self._node, 'col_offset', 0)
+    def _node_location(self, node: Optional[ast.AST]) -> Tuple[int, int]:
+        line_number = getattr(node, 'lineno', 0)
+        column_offset = getattr(node, 'col_offset', 0)
         return line_number, column_offset
 
 
 class ASTViolation(_BaseASTViolation, metaclass=abc.ABCMeta):
     """Violation for ``ast`` based style visitors."""
 
-    _node: ast.AST
-
 
 class MaybeASTViolation(_BaseASTViolation, metaclass=abc.ABCMeta):
     """
@@ -194,18 +217,14 @@ class MaybeASTViolation(_BaseASTViolation, metaclass=abc.ABCMeta):
 class TokenizeViolation(BaseViolation, metaclass=abc.ABCMeta):
     """Violation for ``tokenize`` based visitors."""
 
-    _node: tokenize.TokenInfo
-
     @final
-    def _location(self) -> Tuple[int, int]:
-        return self._node.start
+    def _node_location(self, node: tokenize.TokenInfo) -> Tuple[int, int]:
+        return node.start
 
 
 class SimpleViolation(BaseViolation, metaclass=abc.ABCMeta):
     """Violation for cases where there's no associated nodes."""
 
-    _node: None
-
     def __init__(
         self,
         node=None,
@@ -216,7 +235,7 @@ class SimpleViolation(BaseViolation, metaclass=abc.ABCMeta):
         super().__init__(node, text=text, baseline=baseline)
 
     @final
-    def _location(self) -> Tuple[int, int]:
+    def _node_location(self, node: None) -> Tuple[int, int]:
         """
         Return violation location inside the file.
 
@@ -224,3 +243,8 @@ class SimpleViolation(BaseViolation, metaclass=abc.ABCMeta):
         Cannot be ignored by inline ``noqa`` comments.
         """
         return 0, 0
+
+
+@lru_cache(maxsize=None)
+def _format_code(code: int) -> str:
+    return 'WPS{0}'.format(str(code).zfill(3))
@@ -16,11 +16,15 @@ Summary
    :nosignatures:
 
    InternalErrorViolation
+   TooManyViolationsViolation
+   TimeBudgetViolation
 
 Respect your objects
 --------------------
 
 .. autoclass:: InternalErrorViolation
+.. autoclass:: TooManyViolationsViolation
+.. autoclass:: TimeBudgetViolation
 
 """
 
@@ -48,3 +52,71 @@ class InternalErrorViolation(SimpleViolation):
         'Internal error happened, see log. Please, take some time to report it'
     )
     code = 0
+
+
+@final
+class TooManyViolationsViolation(SimpleViolation):
+    """
+    Happens when a module has too many violations to check it further.
+
+    It is not a style problem itself.
+    It shows that all other checks were skipped for this module,
+    so not all violations are reported.
+    It is useful to find out whether modules are clean
+    as fast as possible, for example in ``pre-commit`` hooks.
+
+    Visitors that are cheaper to run go first in this mode.
+    Violations on lines with ``noqa`` comments are not counted.
+    Known violations from ``--baseline-file`` are not counted either.
+
+    Configuration:
+        This rule is configurable with ``--max-violations``
+        and ``--baseline-file``.
+        Default:
+        :str:`wemake_python_styleguide.options.defaults.MAX_VIOLATIONS`
+        and
+        :str:`wemake_python_styleguide.options.defaults.BASELINE_FILE`
+
+    .. versionadded:: 0.14.0
+
+    """
+
+    error_template = 'Found too many violations, other checks are skipped: {0}'
+    code = 1
+
+
+@final
+class TimeBudgetViolation(SimpleViolation):
+    """
+    Happens when some visitors did not fit in the time budget.
+
+    It is not a style problem itself.
+    It shows that some checks were skipped for this module,
+    so not all violations are reported.
+    Names of the skipped visitors are listed.
+
+    It is useful for huge modules, like generated ones,
+    that can take minutes to be checked.
+    Visitors that run out of time are stopped,
+    their violations are not reported.
+    When the time budget of a whole module is over,
+    all the other visitors are skipped.
+    Cheaper ``--checks-tier`` can be used instead,
+    when some modules constantly run out of time.
+    Use ``--trace-file`` to find out which visitors are slow
+    and ``--memory-profile`` to find out how much memory they use.
+
+    Configuration:
+        This rule is configurable with ``--max-file-seconds``
+        and ``--max-visitor-seconds``.
+        Default:
+        :str:`wemake_python_styleguide.options.defaults.MAX_FILE_SECONDS`
+        and
+        :str:`wemake_python_styleguide.options.defaults.MAX_VISITOR_SECONDS`
+
+    .. versionadded:: 0.14.0
+
+    """
+
+    error_template = 'Found visitors that ran out of time: {0}'
+    code = 2
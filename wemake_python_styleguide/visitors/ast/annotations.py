@@ -8,7 +8,10 @@ from wemake_python_styleguide.types import AnyFunctionDef
 from wemake_python_styleguide.violations.consistency import (
     MultilineFunctionAnnotationViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SUBTREE_COST,
+    BaseNodeVisitor,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 
@@ -20,6 +23,8 @@ from wemake_python_styleguide.visitors.decorators import alias
 class WrongAnnotationVisitor(BaseNodeVisitor):
     """Ensures that annotations are used correctly."""
 
+    cost = SUBTREE_COST
+
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
         Checks return type annotations.
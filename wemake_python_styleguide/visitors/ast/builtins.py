@@ -3,7 +3,6 @@
 import ast
 import string
 from collections import Counter, Hashable, defaultdict
-from contextlib import suppress
 from typing import (
     ClassVar,
     DefaultDict,
@@ -238,6 +237,8 @@ class WrongAssignmentVisitor(base.BaseNodeVisitor):
 class WrongCollectionVisitor(base.BaseNodeVisitor):
     """Ensures that collection definitions are correct."""
 
+    cost = base.SOURCE_COST
+
     _elements_in_sets: ClassVar[AnyNodes] = (
         ast.Str,
         ast.Bytes,
@@ -340,21 +341,22 @@ class WrongCollectionVisitor(base.BaseNodeVisitor):
                 node_repr = source.node_to_string(set_item)
                 elements.append(node_repr.strip().strip('(').strip(')'))
 
-            real_item = unwrap_starred_node(real_item)
-
-            # Non-constant nodes raise ValueError,
-            # unhashables raise TypeError:
-            with suppress(ValueError, TypeError):
-                # Similar value:
-                element_values.append(
-                    safe_eval.literal_eval_with_names(
-                        real_item,
-                    ) if isinstance(
-                        real_item, self._elements_to_eval,
-                    ) else set_item,
-                )
+            # Similar value:
+            element_values.append(self._get_element_value(
+                set_item,
+                unwrap_starred_node(real_item),
+            ))
         self._report_set_elements(node, elements, element_values)
 
+    def _get_element_value(self, set_item: ast.AST, real_item: ast.AST):
+        mark = safe_eval.get_literal_mark(real_item)
+        is_evaluated = mark is not None and mark.has_named_value
+        if isinstance(real_item, self._elements_to_eval) and is_evaluated:
+            return mark.named_value  # type: ignore
+        # Non-constant nodes and unhashables are never similar,
+        # because all nodes are unique:
+        return set_item
+
     def _report_set_elements(
         self,
         node: Union[ast.Set, ast.Dict],
@@ -2,13 +2,12 @@
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, FrozenSet, List, Optional, Tuple
+from typing import ClassVar, DefaultDict, FrozenSet, List, Optional
 
 from typing_extensions import final
 
 from wemake_python_styleguide import constants, types
 from wemake_python_styleguide.compat.aliases import AssignNodes, FunctionNodes
-from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.logic import nodes, source, walk
 from wemake_python_styleguide.logic.arguments import function_args, super_args
 from wemake_python_styleguide.logic.naming import access, name_nodes
@@ -126,6 +125,8 @@ class WrongClassVisitor(base.BaseNodeVisitor):
 class WrongMethodVisitor(base.BaseNodeVisitor):
     """Visits functions, but treats them as methods."""
 
+    cost = base.SUBTREE_COST
+
     _staticmethod_names: ClassVar[FrozenSet[str]] = frozenset((
         'staticmethod',
     ))
@@ -242,13 +243,11 @@ class WrongMethodVisitor(base.BaseNodeVisitor):
 
 
 @final
-@decorators.alias('visit_any_assign', (
-    'visit_Assign',
-    'visit_AnnAssign',
-))
 class WrongSlotsVisitor(base.BaseNodeVisitor):
     """Visits class attributes."""
 
+    cost = base.SOURCE_COST
+
     _whitelisted_slots_nodes: ClassVar[types.AnyNodes] = (
         ast.Tuple,
         ast.Attribute,
@@ -257,23 +256,18 @@ class WrongSlotsVisitor(base.BaseNodeVisitor):
         ast.Call,
     )
 
-    def visit_any_assign(self, node: types.AnyAssign) -> None:
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
-        Checks all assigns that have correct context.
+        Checks all ``__slots__`` assigns of a class.
 
         Raises:
             WrongSlotsViolation
 
         """
-        self._check_slots(node)
+        for slots_assign in classes.get_summary(node).slots:
+            self._check_slots(slots_assign)
         self.generic_visit(node)
 
-    def _contains_slots_assign(self, node: types.AnyAssign) -> bool:
-        for target in get_assign_targets(node):
-            if isinstance(target, ast.Name) and target.id == '__slots__':
-                return True
-        return False
-
     def _count_slots_items(
         self,
         node: types.AnyAssign,
@@ -294,12 +288,6 @@ class WrongSlotsVisitor(base.BaseNodeVisitor):
                 return
 
     def _check_slots(self, node: types.AnyAssign) -> None:
-        if not isinstance(nodes.get_context(node), ast.ClassDef):
-            return
-
-        if not self._contains_slots_assign(node):
-            return
-
         if not isinstance(node.value, self._whitelisted_slots_nodes):
             self.add_violation(oop.WrongSlotsViolation(node))
             return
@@ -337,34 +325,13 @@ class ClassAttributeVisitor(base.BaseNodeVisitor):
         self._check_attributes_shadowing(node)
         self.generic_visit(node)
 
-    def _get_attributes(
-        self,
-        node: ast.ClassDef,
-    ) -> Tuple[List[types.AnyAssign], List[ast.Attribute]]:
-        class_attributes = []
-        instance_attributes = []
-
-        for nd in ast.walk(node):
-            if isinstance(nd, ast.Attribute) and isinstance(nd.ctx, ast.Store):
-                instance_attributes.append(nd)
-                continue
-
-            has_assign = (
-                nodes.get_context(nd) == node and
-                getattr(nd, 'value', None)
-            )
-            if isinstance(nd, AssignNodes) and has_assign:
-                class_attributes.append(nd)
-
-        return class_attributes, instance_attributes
-
     def _check_attributes_shadowing(self, node: ast.ClassDef) -> None:
-        class_attributes, instance_attributes = self._get_attributes(node)
-        class_attribute_names = set(
-            name_nodes.flat_variable_names(class_attributes),
-        )
+        summary = classes.get_summary(node)
+        class_attribute_names = set(name_nodes.flat_variable_names(
+            assign for assign in summary.assigns if assign.value
+        ))
 
-        for instance_attr in instance_attributes:
+        for instance_attr in summary.instance_attributes:
             if instance_attr.attr in class_attribute_names:
                 self.add_violation(
                     oop.ShadowedClassAttributeViolation(
@@ -390,12 +357,10 @@ class ClassMethodOrderVisitor(base.BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_method_order(self, node: ast.ClassDef) -> None:
-        method_nodes: List[str] = []
-
-        for subnode in ast.walk(node):
-            if isinstance(subnode, FunctionNodes):
-                if nodes.get_context(subnode) == node:
-                    method_nodes.append(subnode.name)
+        method_nodes = [
+            method.name
+            for method in classes.get_summary(node).methods
+        ]
 
         ideal = sorted(method_nodes, key=self._ideal_order, reverse=True)
         for existing_order, ideal_order in zip(method_nodes, ideal):
@@ -7,7 +7,7 @@ from typing_extensions import final
 
 from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
-from wemake_python_styleguide.logic import nodes, source
+from wemake_python_styleguide.logic import nodes, safe_eval, source
 from wemake_python_styleguide.logic.naming.name_nodes import is_same_variable
 from wemake_python_styleguide.logic.tree import (
     compares,
@@ -37,14 +37,15 @@ from wemake_python_styleguide.violations.refactoring import (
     WrongInCompareTypeViolation,
     WrongIsCompareViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import SOURCE_COST, BaseNodeVisitor
 from wemake_python_styleguide.visitors.decorators import alias
 
 
 def _is_correct_len(sign: ast.cmpop, comparator: ast.AST) -> bool:
     """This is a helper function to tell what calls to ``len()`` are valid."""
     if isinstance(operators.unwrap_unary_node(comparator), ast.Num):
-        numeric_value = ast.literal_eval(comparator)
+        mark = safe_eval.get_literal_mark(comparator)
+        numeric_value = mark.value if mark else None
         if numeric_value == 0:
             return False
         if numeric_value == 1:
@@ -282,6 +283,8 @@ class WrongComparisionOrderVisitor(BaseNodeVisitor):
 class WrongConditionalVisitor(BaseNodeVisitor):
     """Finds wrong conditional arguments."""
 
+    cost = SOURCE_COST
+
     _forbidden_nodes: ClassVar[AnyNodes] = (
         # Constants:
         ast.Num,
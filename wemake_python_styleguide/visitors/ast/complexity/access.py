@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from itertools import takewhile
-from typing import Set, cast
 
 from typing_extensions import final
 
-from wemake_python_styleguide.logic.tree import attributes
+from wemake_python_styleguide.logic.aggregates import get_chain_length
+from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.types import AnyAccess
 from wemake_python_styleguide.violations.complexity import (
     TooDeepAccessViolation,
@@ -18,11 +17,6 @@ from wemake_python_styleguide.visitors.base import BaseNodeVisitor
 class AccessVisitor(BaseNodeVisitor):
     """Counts access number for expressions."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Keeps visited accesses to not visit them again."""
-        super().__init__(*args, **kwargs)
-        self._visited_accesses: Set[AnyAccess] = set()
-
     def visit_Subscript(self, node: ast.Attribute) -> None:
         """
         Checks subscript access number.
@@ -45,21 +39,18 @@ class AccessVisitor(BaseNodeVisitor):
         self._check_consecutive_access_number(node)
         self.generic_visit(node)
 
-    def _is_any_access(self, node: ast.AST) -> bool:
-        return isinstance(node, (ast.Attribute, ast.Subscript))
+    def _is_chained(self, node: AnyAccess) -> bool:
+        parent = get_parent(node)
+        return (
+            isinstance(parent, (ast.Attribute, ast.Subscript)) and
+            parent.value is node
+        )
 
     def _check_consecutive_access_number(self, node: AnyAccess) -> None:
-        if node in self._visited_accesses:
-            return
-
-        consecutive_access = cast(Set[AnyAccess], set(takewhile(
-            self._is_any_access,
-            attributes.parts(node),
-        )))
-
-        self._visited_accesses.update(consecutive_access)
-        access_number = len(consecutive_access)
+        if self._is_chained(node):
+            return  # we only check the outermost access in a chain
 
+        access_number = get_chain_length(node)
         if access_number > self.options.max_access_level:
             self.add_violation(
                 TooDeepAccessViolation(
@@ -10,13 +10,18 @@ from wemake_python_styleguide.violations.complexity import (
     TooManyBaseClassesViolation,
     TooManyPublicAttributesViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SUBTREE_COST,
+    BaseNodeVisitor,
+)
 
 
 @final
 class ClassComplexityVisitor(BaseNodeVisitor):
     """Checks class complexity."""
 
+    cost = SUBTREE_COST
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Checking class definitions.
@@ -6,6 +6,7 @@ from typing import ClassVar, DefaultDict, List, Union
 
 from typing_extensions import final
 
+from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.constants import MAX_LEN_YIELD_TUPLE
 from wemake_python_styleguide.logic.nodes import get_parent
 from wemake_python_styleguide.logic.tree.functions import is_method
@@ -39,11 +40,6 @@ ModuleMembers = Union[AnyFunctionDef, ast.ClassDef]
 class ModuleMembersVisitor(BaseNodeVisitor):
     """Counts classes and functions in a module."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked metrics."""
-        super().__init__(*args, **kwargs)
-        self._public_items_count = 0
-
     def visit_module_members(self, node: ModuleMembers) -> None:
         """
         Counts the number of ModuleMembers in a single module.
@@ -56,6 +52,9 @@ class ModuleMembersVisitor(BaseNodeVisitor):
         self._check_members_count(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._public_items_count = 0
+
     def _check_members_count(self, node: ModuleMembers) -> None:
         """This method increases the number of module members."""
         is_real_method = is_method(getattr(node, 'function_type', None))
@@ -92,12 +91,6 @@ class ModuleMembersVisitor(BaseNodeVisitor):
 class ImportMembersVisitor(BaseNodeVisitor):
     """Counts imports in a module."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked metrics."""
-        super().__init__(*args, **kwargs)
-        self._imports_count = 0
-        self._imported_names_count = 0
-
     def visit_any_import(self, node: AnyImport) -> None:
         """
         Counts the number of ``import`` and ``from ... import ...``.
@@ -111,6 +104,10 @@ class ImportMembersVisitor(BaseNodeVisitor):
         self._imported_names_count += len(node.names)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._imports_count = 0
+        self._imported_names_count = 0
+
     def _check_imports_count(self) -> None:
         if self._imports_count > self.options.max_imports:
             self.add_violation(
@@ -135,19 +132,10 @@ class ImportMembersVisitor(BaseNodeVisitor):
 
 
 @final
-@alias('visit_any_function', (
-    'visit_FunctionDef',
-    'visit_AsyncFunctionDef',
-))
 class MethodMembersVisitor(BaseNodeVisitor):
     """Counts methods in a single class."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked methods in different classes."""
-        super().__init__(*args, **kwargs)
-        self._methods: DefaultDict[ast.ClassDef, int] = defaultdict(int)
-
-    def visit_any_function(self, node: AnyFunctionDef) -> None:
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
         Counts the number of methods in a single class.
 
@@ -155,24 +143,22 @@ class MethodMembersVisitor(BaseNodeVisitor):
             TooManyMethodsViolation
 
         """
-        self._check_method(node)
+        self._check_methods(node)
         self.generic_visit(node)
 
-    def _check_method(self, node: AnyFunctionDef) -> None:
-        parent = get_parent(node)
-        if isinstance(parent, ast.ClassDef):
-            self._methods[parent] += 1
-
-    def _post_visit(self) -> None:
-        for node, count in self._methods.items():
-            if count > self.options.max_methods:
-                self.add_violation(
-                    TooManyMethodsViolation(
-                        node,
-                        text=str(count),
-                        baseline=self.options.max_methods,
-                    ),
-                )
+    def _check_methods(self, node: ast.ClassDef) -> None:
+        # Methods in ``if`` and ``try`` blocks are not counted:
+        methods_count = sum(
+            isinstance(sub_node, FunctionNodes) for sub_node in node.body
+        )
+        if methods_count > self.options.max_methods:
+            self.add_violation(
+                TooManyMethodsViolation(
+                    node,
+                    text=str(methods_count),
+                    baseline=self.options.max_methods,
+                ),
+            )
 
 
 @final
@@ -253,13 +239,6 @@ class ElifVisitor(BaseNodeVisitor):
     #: Maximum number of `elif` blocks in a single `if` condition:
     _max_elifs: ClassVar[int] = 3
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates internal ``elif`` counter."""
-        super().__init__(*args, **kwargs)
-        self._if_children: DefaultDict[ast.If, List[ast.If]] = defaultdict(
-            list,
-        )
-
     def visit_If(self, node: ast.If) -> None:
         """
         Checks condition not to reimplement switch.
@@ -271,6 +250,11 @@ class ElifVisitor(BaseNodeVisitor):
         self._check_elifs(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._if_children: DefaultDict[ast.If, List[ast.If]] = defaultdict(
+            list,
+        )
+
     def _get_root_if_node(self, node: ast.If) -> ast.If:
         for root, children in self._if_children.items():
             if node in children:
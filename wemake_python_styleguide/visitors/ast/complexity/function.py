@@ -26,7 +26,10 @@ from wemake_python_styleguide.violations.complexity import (
     TooManyLocalsViolation,
     TooManyReturnsViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SUBTREE_COST,
+    BaseNodeVisitor,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 _FunctionCounter = DefaultDict[AnyFunctionDef, int]
@@ -131,10 +134,7 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked metrics."""
-        super().__init__(*args, **kwargs)
-        self._counter = _ComplexityCounter()
+    cost = SUBTREE_COST
 
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
@@ -163,6 +163,9 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
         self._counter.check_arguments_count(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._counter = _ComplexityCounter()
+
     def _check_function_internals(self) -> None:
         for var_node, variables in self._counter.variables.items():
             if len(variables) > self.options.max_local_variables:
@@ -229,10 +232,7 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 class CognitiveComplexityVisitor(BaseNodeVisitor):
     """Used to count cognitive score and average module complexity."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """We use to save all functions' complexity here."""
-        super().__init__(*args, **kwargs)
-        self._functions: DefaultDict[AnyFunctionDef, int] = defaultdict(int)
+    cost = SUBTREE_COST
 
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
@@ -246,6 +246,9 @@ class CognitiveComplexityVisitor(BaseNodeVisitor):
         self._functions[node] = cognitive.cognitive_score(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._functions: DefaultDict[AnyFunctionDef, int] = defaultdict(int)
+
     def _post_visit(self) -> None:
         if not self._functions:
             return  # module can be empty
@@ -43,12 +43,6 @@ class JonesComplexityVisitor(BaseNodeVisitor):
         *FunctionNodes,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initializes line number counter."""
-        super().__init__(*args, **kwargs)
-        self._lines: DefaultDict[int, List[ast.AST]] = defaultdict(list)
-        self._to_ignore: List[ast.AST] = []
-
     def visit(self, node: ast.AST) -> None:
         """
         Visits all nodes, sums the number of nodes per line.
@@ -68,6 +62,10 @@ class JonesComplexityVisitor(BaseNodeVisitor):
 
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._lines: DefaultDict[int, List[ast.AST]] = defaultdict(list)
+        self._to_ignore: List[ast.AST] = []
+
     def _post_visit(self) -> None:
         """
         Triggers after the whole module was processed.
@@ -4,11 +4,11 @@ import ast
 from collections import defaultdict
 from typing import ClassVar, DefaultDict, List, Union
 
-from typing_extensions import final
+from typing_extensions import Final, final
 
 from wemake_python_styleguide.compat.aliases import FunctionNodes
 from wemake_python_styleguide.constants import SPECIAL_ARGUMENT_NAMES_WHITELIST
-from wemake_python_styleguide.logic import nodes, source, walk
+from wemake_python_styleguide.logic import aggregates, nodes, source, walk
 from wemake_python_styleguide.types import AnyNodes
 from wemake_python_styleguide.violations import complexity
 from wemake_python_styleguide.visitors import base
@@ -19,16 +19,14 @@ _Annotated = Union[ast.arg, ast.AnnAssign]
 
 _AnnNodes = (ast.AnnAssign, ast.arg)
 
+#: Expressions are rendered with ``astor``, which is recursive.
+_MAX_EXPRESSION_HEIGHT: Final = 100
+
 
 @final
 class StringOveruseVisitor(base.BaseNodeVisitor):
     """Restricts several string usages."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Inits the counter for constants."""
-        super().__init__(*args, **kwargs)
-        self._string_constants: DefaultDict[str, int] = defaultdict(int)
-
     def visit_Str(self, node: ast.Str) -> None:
         """
         Restricts to over-use string constants.
@@ -40,6 +38,9 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
         self._check_string_constant(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._string_constants: DefaultDict[str, int] = defaultdict(int)
+
     def _check_string_constant(self, node: ast.Str) -> None:
         parent = nodes.get_parent(node)
         if isinstance(parent, _AnnNodes) and parent.annotation == node:
@@ -65,6 +66,8 @@ class StringOveruseVisitor(base.BaseNodeVisitor):
 class ExpressionOveruseVisitor(base.BaseNodeVisitor):
     """Finds overused expressions."""
 
+    cost = base.SOURCE_COST
+
     _expressions: ClassVar[AnyNodes] = (
         # We do not treat `ast.Attribute`s as expressions
         # because they are too widely used. That's a compromise.
@@ -90,14 +93,6 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
 
     _msg: ClassVar[str] = '{0}; used {1}'
 
-    def __init__(self, *args, **kwargs) -> None:
-        """We need to track expression usage in functions and modules."""
-        super().__init__(*args, **kwargs)
-        self._module_expressions: _Expressions = defaultdict(list)
-        self._function_expressions: _FunctionExpressions = defaultdict(
-            lambda: defaultdict(list),
-        )
-
     def visit(self, node: ast.AST) -> None:
         """
         Visits all nodes in a module to find overused values.
@@ -110,8 +105,18 @@ class ExpressionOveruseVisitor(base.BaseNodeVisitor):
             self._add_expression(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._module_expressions: _Expressions = defaultdict(list)
+        self._function_expressions: _FunctionExpressions = defaultdict(
+            lambda: defaultdict(list),
+        )
+
     def _add_expression(self, node: ast.AST) -> None:
         ignore_predicates = [
+            # Deeply nested expressions are not reused in real code,
+            # we check them first, because other checks walk up the tree:
+            _is_too_deep,
+
             self._is_decorator,
             self._is_self_method,
             self._is_annotation,
@@ -193,6 +198,10 @@ def _is_class_context(node: ast.AST) -> bool:
     return isinstance(nodes.get_context(node), ast.ClassDef)
 
 
+def _is_too_deep(node: ast.AST) -> bool:
+    return aggregates.get_height(node) > _MAX_EXPRESSION_HEIGHT
+
+
 def _is_super_call(node: ast.AST) -> bool:
     if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
         return node.func.id == 'super'
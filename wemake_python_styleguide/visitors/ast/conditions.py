@@ -8,6 +8,7 @@ from typing import ClassVar, DefaultDict, List, Mapping, Set, Type
 from typing_extensions import final
 
 from wemake_python_styleguide.logic import source
+from wemake_python_styleguide.logic.aggregates import get_max_line
 from wemake_python_styleguide.logic.tree import ifs, operators
 from wemake_python_styleguide.logic.tree.compares import CompareBounds
 from wemake_python_styleguide.logic.tree.functions import given_function_called
@@ -26,7 +27,7 @@ from wemake_python_styleguide.violations.refactoring import (
     UselessLenCompareViolation,
     UselessReturningElseViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import SOURCE_COST, BaseNodeVisitor
 
 _OperatorPairs = Mapping[Type[ast.boolop], Type[ast.cmpop]]
 
@@ -70,11 +71,6 @@ class IfStatementVisitor(BaseNodeVisitor):
         ast.Continue,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        """We need to store visited ``if`` not to dublicate violations."""
-        super().__init__(*args, **kwargs)
-        self._visited_ifs: Set[ast.If] = set()
-
     def visit_If(self, node: ast.If) -> None:
         """
         Checks ``if`` nodes.
@@ -105,6 +101,9 @@ class IfStatementVisitor(BaseNodeVisitor):
         self._check_negated_conditions(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._visited_ifs: Set[ast.If] = set()
+
     def _check_negated_conditions(self, node: AnyIf) -> None:
         if isinstance(node, ast.If) and not ifs.has_else(node):
             return
@@ -118,12 +117,8 @@ class IfStatementVisitor(BaseNodeVisitor):
 
     def _check_multiline_conditions(self, node: ast.If) -> None:
         """Checks multiline conditions ``if`` statement nodes."""
-        start_lineno = getattr(node, 'lineno', None)
-        for sub_nodes in ast.walk(node.test):
-            sub_lineno = getattr(sub_nodes, 'lineno', None)
-            if sub_lineno is not None and sub_lineno > start_lineno:
-                self.add_violation(MultilineConditionsViolation(node))
-                break
+        if get_max_line(node.test) > node.lineno:
+            self.add_violation(MultilineConditionsViolation(node))
 
     def _check_useless_else(self, node: ast.If) -> None:
         real_ifs = []
@@ -162,11 +157,7 @@ class IfStatementVisitor(BaseNodeVisitor):
 class BooleanConditionVisitor(BaseNodeVisitor):
     """Ensures that boolean conditions are correct."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """We need to store some bool nodes not to visit them twice."""
-        super().__init__(*args, **kwargs)
-        self._same_nodes: List[ast.BoolOp] = []
-        self._isinstance_calls: List[ast.BoolOp] = []
+    cost = SOURCE_COST
 
     def visit_BoolOp(self, node: ast.BoolOp) -> None:
         """
@@ -181,6 +172,10 @@ class BooleanConditionVisitor(BaseNodeVisitor):
         self._check_isinstance_calls(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._same_nodes: List[ast.BoolOp] = []
+        self._isinstance_calls: List[ast.BoolOp] = []
+
     def _get_all_names(
         self,
         node: ast.BoolOp,
@@ -223,6 +218,8 @@ class BooleanConditionVisitor(BaseNodeVisitor):
 class ImplicitBoolPatternsVisitor(BaseNodeVisitor):
     """Is used to find implicit patterns that are formed by boolops."""
 
+    cost = SOURCE_COST
+
     _allowed: ClassVar[_OperatorPairs] = {
         ast.And: ast.NotEq,
         ast.Or: ast.Eq,
@@ -22,7 +22,11 @@ from wemake_python_styleguide.violations.refactoring import (
     NestedTryViolation,
     UselessFinallyViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SOURCE_COST,
+    SUBTREE_COST,
+    BaseNodeVisitor,
+)
 
 
 def _find_returing_nodes(
@@ -52,6 +56,8 @@ def _find_returing_nodes(
 class WrongTryExceptVisitor(BaseNodeVisitor):
     """Responsible for examining ``try`` and friends."""
 
+    cost = SOURCE_COST
+
     _bad_returning_nodes: ClassVar[AnyNodes] = (
         ast.Return,
         ast.Raise,
@@ -118,6 +124,8 @@ class WrongTryExceptVisitor(BaseNodeVisitor):
 class NestedTryBlocksVisitor(BaseNodeVisitor):
     """Ensures that there are no nested ``try`` blocks."""
 
+    cost = SUBTREE_COST
+
     def visit_Try(self, node: ast.Try) -> None:
         """
         Visits all try nodes in the tree.
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from contextlib import suppress
-from typing import ClassVar, Dict, List, Union
+from typing import ClassVar, List
 
 from typing_extensions import final
 
@@ -12,9 +11,10 @@ from wemake_python_styleguide.constants import (
     FUNCTIONS_BLACKLIST,
     LITERALS_BLACKLIST,
 )
-from wemake_python_styleguide.logic import nodes, walk
+from wemake_python_styleguide.logic import nodes, safe_eval, tables, walk
 from wemake_python_styleguide.logic.arguments import function_args
 from wemake_python_styleguide.logic.naming import access
+from wemake_python_styleguide.logic.scopes import symbols
 from wemake_python_styleguide.logic.tree import (
     attributes,
     exceptions,
@@ -44,8 +44,6 @@ from wemake_python_styleguide.violations.refactoring import (
 )
 from wemake_python_styleguide.visitors import base, decorators
 
-LocalVariable = Union[ast.Name, ast.ExceptHandler]
-
 
 @final
 class WrongFunctionCallVisitor(base.BaseNodeVisitor):
@@ -203,6 +201,8 @@ class WrongFunctionCallContextVisitior(base.BaseNodeVisitor):
 class FunctionDefinitionVisitor(base.BaseNodeVisitor):
     """Responsible for checking function internals."""
 
+    cost = base.SUBTREE_COST
+
     _allowed_default_value_types: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Attribute,
@@ -214,6 +214,17 @@ class FunctionDefinitionVisitor(base.BaseNodeVisitor):
         ast.Ellipsis,
     )
 
+    #: Arguments, imports, and definitions are not variables:
+    _variable_bindings: ClassVar[AnyNodes] = (
+        ast.Assign,
+        ast.AnnAssign,
+        ast.For,
+        ast.AsyncFor,
+        ast.With,
+        ast.AsyncWith,
+        ast.ExceptHandler,
+    )
+
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
         Checks regular, lambda, and async functions.
@@ -230,15 +241,10 @@ class FunctionDefinitionVisitor(base.BaseNodeVisitor):
         self.generic_visit(node)
 
     def _check_unused_variables(self, node: AnyFunctionDef) -> None:
-        local_variables: Dict[str, List[LocalVariable]] = {}
-        for body_item in node.body:
-            for sub_node in ast.walk(body_item):
-                if isinstance(sub_node, (ast.Name, ast.ExceptHandler)):
-                    var_name = self._get_variable_name(sub_node)
-                    self._maybe_update_variable(
-                        sub_node, var_name, local_variables,
-                    )
-        self._ensure_used_variables(local_variables)
+        scope = symbols.get_scope(node)
+        for var_name, bindings in scope.definitions.items():
+            if self._has_variable(bindings) and access.is_protected(var_name):
+                self._ensure_unused_variable(scope, var_name)
 
     def _check_argument_default_values(self, node: AnyFunctionDef) -> None:
         for arg in node.args.defaults:
@@ -262,46 +268,36 @@ class FunctionDefinitionVisitor(base.BaseNodeVisitor):
                     StopIterationInsideGeneratorViolation(sub_node),
                 )
 
-    def _maybe_update_variable(
-        self,
-        sub_node: LocalVariable,
-        var_name: str,
-        local_variables: Dict[str, List[LocalVariable]],
-    ) -> None:
-        defs = local_variables.get(var_name)
-        if defs is not None:
-            if not var_name or access.is_unused(var_name):
-                # We check unused variable usage in a different place:
-                # see `visitors/ast/naming.py`
-                return
-            defs.append(sub_node)
-            return
-
-        is_name_def = (
-            isinstance(sub_node, ast.Name) and
-            isinstance(sub_node.ctx, ast.Store)
+    def _has_variable(self, bindings: List[symbols.Binding]) -> bool:
+        # Arguments are not variables, even when they are assigned later:
+        return any(
+            isinstance(binding.node, self._variable_bindings)
+            for binding in bindings
         )
 
-        if is_name_def or isinstance(sub_node, ast.ExceptHandler):
-            local_variables[var_name] = []
-
-    def _ensure_used_variables(
+    def _ensure_unused_variable(
         self,
-        local_variables: Dict[str, List[LocalVariable]],
+        scope: symbols.Scope,
+        var_name: str,
     ) -> None:
-        for varname, usages in local_variables.items():
-            for node in usages:
-                if access.is_protected(varname):
+        # Closures use this variable, unless they define their own one:
+        scopes = [scope]
+        while scopes:
+            inner_scope = scopes.pop()
+            for usage in inner_scope.uses.get(var_name, []):
+                bindings = symbols.lookup(usage)
+                if inner_scope is not scope or self._has_variable(bindings):
                     self.add_violation(
                         naming.UnusedVariableIsUsedViolation(
-                            node, text=varname,
+                            usage, text=var_name,
                         ),
                     )
-
-    def _get_variable_name(self, node: LocalVariable) -> str:
-        if isinstance(node, ast.Name):
-            return node.id
-        return getattr(node, 'name', '')
+            scopes.extend(
+                symbols.get_scope(nested_context)
+                for nested_context in inner_scope.nodes
+                if isinstance(nested_context, tables.CONTEXTS) and
+                var_name not in symbols.get_scope(nested_context).definitions
+            )
 
 
 @final
@@ -327,9 +323,10 @@ class UselessLambdaDefinitionVisitor(base.BaseNodeVisitor):
             # We return from this check, since `lambda` has some arguments.
             return
 
-        with suppress(ValueError):
-            return_value = ast.literal_eval(node.body)
-            if return_value is not None and not return_value:
+        mark = safe_eval.get_literal_mark(node.body)
+        if mark is not None and mark.has_value:
+            body_value = mark.value
+            if body_value is not None and not body_value:
                 self.add_violation(ImplicitPrimitiveViolation(node))
 
     def _check_useless_lambda(self, node: ast.Lambda) -> None:
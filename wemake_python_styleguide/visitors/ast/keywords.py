@@ -29,7 +29,10 @@ from wemake_python_styleguide.violations.consistency import (
     IncorrectYieldFromTargetViolation,
     MultipleContextManagerAssignmentsViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SUBTREE_COST,
+    BaseNodeVisitor,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 NamesAndReturns = Tuple[
@@ -71,6 +74,8 @@ class WrongRaiseVisitor(BaseNodeVisitor):
 class ConsistentReturningVisitor(BaseNodeVisitor):
     """Finds incorrect and inconsistent ``return`` and ``yield`` nodes."""
 
+    cost = SUBTREE_COST
+
     def visit_Return(self, node: ast.Return) -> None:
         """
         Checks ``return`` statements for consistency.
@@ -224,6 +229,8 @@ class WrongContextManagerVisitor(BaseNodeVisitor):
 class GeneratorKeywordsVisitor(BaseNodeVisitor):
     """Checks how generators are defined and used."""
 
+    cost = SUBTREE_COST
+
     _allowed_nodes: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Call,
@@ -234,11 +241,6 @@ class GeneratorKeywordsVisitor(BaseNodeVisitor):
         ast.GeneratorExp,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Here we store the information about ``yield`` locations."""
-        super().__init__(*args, **kwargs)
-        self._yield_locations: Dict[int, ast.Expr] = {}
-
     def visit_any_function(self, node: AnyFunctionDef) -> None:
         """
         We use this visitor method to check for consecutive ``yield`` nodes.
@@ -262,6 +264,9 @@ class GeneratorKeywordsVisitor(BaseNodeVisitor):
         self._check_yield_from_empty(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._yield_locations: Dict[int, ast.Expr] = {}
+
     def _check_consecutive_yields(self, node: AnyFunctionDef) -> None:
         for sub in ast.walk(node):
             if isinstance(sub, ast.Expr) and isinstance(sub.value, ast.Yield):
@@ -300,6 +305,8 @@ class GeneratorKeywordsVisitor(BaseNodeVisitor):
 class ConsistentReturningVariableVisitor(BaseNodeVisitor):
     """Finds variables that are only used in `return` statements."""
 
+    cost = SUBTREE_COST
+
     _checking_nodes: ClassVar[AnyNodes] = (
         ast.Assign,
         ast.AnnAssign,
@@ -359,22 +366,14 @@ class ConsistentReturningVariableVisitor(BaseNodeVisitor):
                     return_sub_nodes[variable_name] = sub_node
         return returns, return_sub_nodes
 
-    def _is_correct_return_node(
-        self,
-        node: AnyFunctionDef,
-        sub_node: ast.AST,
-    ) -> bool:
-        if get_context(sub_node) != node:
-            return False
-        return isinstance(sub_node, self._checking_nodes)
-
     def _check_variables_for_return(self, node: AnyFunctionDef) -> None:
-        nodes = list(
-            filter(
-                lambda sub: self._is_correct_return_node(node, sub),
-                ast.walk(node),
-            ),
-        )
+        # The last ``return`` is reported, so we keep the breadth-first order:
+        nodes = [
+            sub_node
+            for sub_node in ast.walk(node)
+            if isinstance(sub_node, self._checking_nodes) and
+            get_context(sub_node) is node
+        ]
         assign = self._get_assign_node_variables(nodes)
         names = self._get_name_nodes_variable(nodes)
         returns, return_sub_nodes = self._get_return_node_variables(nodes)
@@ -2,14 +2,15 @@
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, List, Optional, Union
+from typing import ClassVar, DefaultDict, Union
 
 from typing_extensions import final
 
-from wemake_python_styleguide.compat.aliases import AssignNodes, ForNodes
+from wemake_python_styleguide.compat.aliases import AssignNodes
 from wemake_python_styleguide.compat.functions import get_assign_targets
 from wemake_python_styleguide.logic import nodes, source, walk
-from wemake_python_styleguide.logic.tree import operators, slices
+from wemake_python_styleguide.logic.aggregates import get_max_line
+from wemake_python_styleguide.logic.tree import loops, operators, slices
 from wemake_python_styleguide.logic.tree.variables import (
     is_valid_block_variable_definition,
 )
@@ -55,14 +56,11 @@ _AnyComprehension = Union[
 class WrongComprehensionVisitor(base.BaseNodeVisitor):
     """Checks comprehensions for correctness."""
 
+    cost = base.SUBTREE_COST
+
     _max_ifs: ClassVar[int] = 1
     _max_fors: ClassVar[int] = 2
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked metrics."""
-        super().__init__(*args, **kwargs)
-        self._fors: DefaultDict[ast.AST, int] = defaultdict(int)
-
     def visit_comprehension(self, node: ast.comprehension) -> None:
         """
         Finds multiple ``if`` and ``for`` nodes inside the comprehension.
@@ -87,6 +85,9 @@ class WrongComprehensionVisitor(base.BaseNodeVisitor):
         self._check_contains_yield(node)
         self.generic_visit(node)
 
+    def _pre_visit(self) -> None:
+        self._fors: DefaultDict[ast.AST, int] = defaultdict(int)
+
     def _check_ifs(self, node: ast.comprehension) -> None:
         if len(node.ifs) > self._max_ifs:
             # We are trying to fix line number in the report,
@@ -118,6 +119,8 @@ class WrongComprehensionVisitor(base.BaseNodeVisitor):
 class WrongLoopVisitor(base.BaseNodeVisitor):
     """Responsible for examining loops."""
 
+    cost = base.SUBTREE_COST
+
     def visit_any_loop(self, node: _AnyLoop) -> None:
         """
         Checks ``for`` and ``while`` loops.
@@ -134,38 +137,8 @@ class WrongLoopVisitor(base.BaseNodeVisitor):
         self._check_multiline_loop(node)
         self.generic_visit(node)
 
-    def _does_loop_contain_node(  # TODO: move, reuse in annotations.py
-        self,
-        loop: Optional[_AnyLoop],
-        to_check: ast.Break,
-    ) -> bool:
-        if loop is None:
-            return False
-
-        for inner_node in ast.walk(loop):
-            # We are checking this specific node, not just any `break`:
-            if to_check is inner_node:
-                return True
-        return False
-
-    def _has_break(self, node: _AnyLoop) -> bool:
-        closest_loop = None
-
-        for subnode in ast.walk(node):
-            if isinstance(subnode, (*ForNodes, ast.While)):
-                if subnode is not node:
-                    closest_loop = subnode
-
-            if isinstance(subnode, ast.Break):
-                is_nested_break = self._does_loop_contain_node(
-                    closest_loop, subnode,
-                )
-                if not is_nested_break:
-                    return True
-        return False
-
     def _check_loop_needs_else(self, node: _AnyLoop) -> None:
-        if node.orelse and not self._has_break(node):
+        if node.orelse and not loops.has_break(node):
             self.add_violation(UselessLoopElseViolation(node))
 
     def _check_lambda_inside_loop(self, node: _AnyLoop) -> None:
@@ -174,29 +147,25 @@ class WrongLoopVisitor(base.BaseNodeVisitor):
                 self.add_violation(LambdaInsideLoopViolation(node))
 
     def _check_useless_continue(self, node: _AnyLoop) -> None:
-        nodes_at_line: DefaultDict[int, List[ast.AST]] = defaultdict(list)
-        for sub_node in ast.walk(node):
-            lineno = getattr(sub_node, 'lineno', None)
-            if lineno is not None:
-                nodes_at_line[lineno].append(sub_node)
-
-        last_line = nodes_at_line[sorted(nodes_at_line.keys())[-1]]
-        if any(isinstance(last, ast.Continue) for last in last_line):
-            self.add_violation(UselessContinueViolation(node))
+        last_line = get_max_line(node)
+        for sub_node in walk.get_subtree(node):
+            is_last_continue = (
+                isinstance(sub_node, ast.Continue) and
+                sub_node.lineno == last_line and
+                loops.get_loop(sub_node) is node
+            )
+            if is_last_continue:
+                self.add_violation(UselessContinueViolation(node))
+                return
 
     def _check_multiline_loop(self, node: _AnyLoop) -> None:
-        start_lineno = getattr(node, 'lineno', None)
-
         if isinstance(node, ast.While):
             node_to_check = node.test
         else:
             node_to_check = node.iter
 
-        for sub_node in ast.walk(node_to_check):
-            sub_lineno = getattr(sub_node, 'lineno', None)
-            if sub_lineno is not None and sub_lineno > start_lineno:
-                self.add_violation(MultilineLoopViolation(node))
-                break
+        if get_max_line(node_to_check) > node.lineno:
+            self.add_violation(MultilineLoopViolation(node))
 
 
 @final
@@ -288,6 +257,8 @@ class WrongLoopDefinitionVisitor(base.BaseNodeVisitor):
 class SyncForLoopVisitor(base.BaseNodeVisitor):
     """We use this visitor to check just sync ``for`` loops."""
 
+    cost = base.SOURCE_COST
+
     def visit_For(self, node: ast.For) -> None:
         """
         Checks for hidden patterns in sync loops.
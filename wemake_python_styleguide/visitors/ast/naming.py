@@ -3,16 +3,7 @@
 import ast
 import itertools
 from collections import Counter
-from typing import (
-    Callable,
-    FrozenSet,
-    Iterable,
-    List,
-    Optional,
-    Tuple,
-    Union,
-    cast,
-)
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from typing_extensions import final
 
@@ -30,6 +21,7 @@ from wemake_python_styleguide.logic.naming import (
     logical,
     name_nodes,
 )
+from wemake_python_styleguide.logic.scopes.symbols import get_binding
 from wemake_python_styleguide.logic.tree import functions
 from wemake_python_styleguide.types import (
     AnyAssign,
@@ -389,13 +381,14 @@ class WrongVariableUsageVisitor(BaseNodeVisitor):
             UnusedVariableIsDefinedViolation
 
         """
+        binding = get_binding(node)
         is_inside_class_or_module = isinstance(
-            nodes.get_context(node),
+            binding.context,
             (ast.ClassDef, ast.Module),
         )
         self._check_assign_unused(
             node,
-            name_nodes.flat_variable_names([node]),
+            binding.names,
             is_local=not is_inside_class_or_module,
         )
         self.generic_visit(node)
@@ -408,8 +401,7 @@ class WrongVariableUsageVisitor(BaseNodeVisitor):
             UnusedVariableIsDefinedViolation
 
         """
-        if node.name:
-            self._check_assign_unused(node, [node.name])
+        self._check_assign_unused(node, get_binding(node).names)
         self.generic_visit(node)
 
     def visit_withitem(self, node: ast.withitem) -> None:
@@ -421,10 +413,8 @@ class WrongVariableUsageVisitor(BaseNodeVisitor):
 
         """
         if node.optional_vars:
-            self._check_assign_unused(
-                cast(ast.AST, nodes.get_parent(node)),
-                name_nodes.get_variables_from_node(node.optional_vars),
-            )
+            binding = get_binding(node)
+            self._check_assign_unused(binding.node, binding.names)
         self.generic_visit(node)
 
     def _check_variable_used(
@@ -76,6 +76,8 @@ class SubscriptVisitor(base.BaseNodeVisitor):
 class ImplicitDictGetVisitor(base.BaseNodeVisitor):
     """Checks for correct `.get` usage in code."""
 
+    cost = base.SOURCE_COST
+
     def visit_If(self, node: ast.If) -> None:
         """
         Checks the compares.
@@ -108,6 +110,8 @@ class ImplicitDictGetVisitor(base.BaseNodeVisitor):
 class CorrectKeyVisitor(base.BaseNodeVisitor):
     """Checks for correct `.get` usage in code."""
 
+    cost = base.SOURCE_COST
+
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """
         Checks that key usage is correct, without any errors.
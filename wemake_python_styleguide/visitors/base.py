@@ -64,10 +64,22 @@ Reference
 
 import abc
 import ast
+import time
 import tokenize
-from typing import List, Sequence, Type
-
-from typing_extensions import final
+from typing import (
+    Callable,
+    ClassVar,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+)
+
+from typing_extensions import Final, final
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.compat.routing import route_visit
@@ -75,6 +87,23 @@ from wemake_python_styleguide.logic.filenames import get_stem
 from wemake_python_styleguide.types import ConfigurationOptions
 from wemake_python_styleguide.violations.base import BaseViolation
 
+#: How many nodes or tokens are visited between time budget checks.
+_CHECK_TIME_EVERY: Final = 1000
+
+#: Released node visitors point to this tree instead of the last checked one.
+_EMPTY_TREE: Final = ast.Module(body=[], type_ignores=[])
+
+#: Visitor checks nodes or tokens with their closest neighbours only.
+LINEAR_COST: Final = 1
+
+#: Visitor walks subtrees or scopes of the visited nodes once again.
+SUBTREE_COST: Final = 2
+
+#: Visitor renders source code of the visited nodes to compare it.
+SOURCE_COST: Final = 3
+
+_Visitable = TypeVar('_Visitable', ast.AST, tokenize.TokenInfo)
+
 
 class BaseVisitor(object, metaclass=abc.ABCMeta):
     """
@@ -85,9 +114,15 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         filename: filename passed by ``flake8``, each visitor has a file name.
         violations: list of :term:`violations <violation>`
         for the specific visitor.
+        deadline: ``time.perf_counter()`` value when visitor has to stop,
+        it is ``None`` when there's no time budget.
+        cost: how expensive this visitor is, used to select visitors
+        by :mod:`wemake_python_styleguide.presets.tiers`.
 
     """
 
+    cost: ClassVar[int] = LINEAR_COST
+
     def __init__(
         self,
         options: ConfigurationOptions,
@@ -97,6 +132,8 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         self.options = options
         self.filename = filename
         self.violations: List[BaseViolation] = []
+        self.deadline: Optional[float] = None
+        self._file_attributes: FrozenSet[str] = frozenset()
 
     @classmethod
     def from_checker(
@@ -115,6 +152,23 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         """
         return cls(options=checker.options, filename=checker.filename)
 
+    def reset(self, checker=None) -> None:
+        """
+        Prepares this instance to check the next file of the checker.
+
+        Visitors are created once with options
+        and then can be reused for any number of files.
+        Attributes created by :meth:`_pre_visit` are dropped here,
+        ``run()`` creates them again for the next file.
+
+        Without a checker all references to the last file are dropped,
+        so idle instances do not keep its tree and violations alive.
+        """
+        self.filename = constants.STDIN if checker is None else checker.filename
+        self.violations = []
+        for attribute in self._file_attributes:
+            vars(self).pop(attribute, None)  # noqa: WPS421
+
     @final
     def add_violation(self, violation: BaseViolation) -> None:
         """Adds violation to the visitor."""
@@ -129,6 +183,15 @@ class BaseVisitor(object, metaclass=abc.ABCMeta):
         to do when it was told to ``run``.
         """
 
+    def _pre_visit(self) -> None:
+        """
+        Executed before any nodes are visited.
+
+        This method is the place to create per-file state,
+        so instances can be reused for other files.
+        By default does nothing.
+        """
+
     def _post_visit(self) -> None:
         """
         Executed after all nodes have been visited.
@@ -159,6 +222,7 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
         """Creates new ``ast`` based instance."""
         super().__init__(options, **kwargs)
         self.tree = tree
+        self._nodes_to_visit: List[ast.AST] = []
 
     @final
     @classmethod
@@ -173,6 +237,12 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
             tree=checker.tree,
         )
 
+    def reset(self, checker=None) -> None:
+        """Prepares this instance to check the next ``ast`` tree."""
+        self.tree = _EMPTY_TREE if checker is None else checker.tree
+        self._nodes_to_visit.clear()
+        super().reset(checker)
+
     def visit(self, tree: ast.AST) -> None:
         """
         Visits a node.
@@ -187,12 +257,43 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor, metaclass=abc.ABCMeta):
         """
         return route_visit(self, tree)
 
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Schedules all child nodes to be visited next.
+
+        Modified version of :class:`ast.NodeVisitor.generic_visit` method.
+        It does not recurse, children are visited by :meth:`run`
+        from an explicit stack. So, deeply nested expressions
+        like ``a + b + c + ...`` do not hit the recursion limit.
+
+        Nodes are still visited in the same depth-first order,
+        but ``generic_visit()`` must be the last call in ``visit_`` methods:
+        children are visited after the method returns.
+        """
+        self._nodes_to_visit.extend(
+            reversed(list(ast.iter_child_nodes(node))),
+        )
+
     @final
     def run(self) -> None:
-        """Recursively visits all ``ast`` nodes. Then executes post hook."""
-        self.visit(self.tree)
+        """
+        Visits all ``ast`` nodes with a stack. Executes both hooks.
+
+        Stops when the ``deadline`` is over, without the final hook.
+        """
+        self._file_attributes |= _created_by(self, self._pre_visit)
+        self._nodes_to_visit.append(self.tree)
+        if self.deadline is None:
+            while self._nodes_to_visit:
+                self.visit(self._nodes_to_visit.pop())
+        elif not _visit_until(self.deadline, self.visit, self._pop_nodes()):
+            return
         self._post_visit()
 
+    def _pop_nodes(self) -> Iterable[ast.AST]:
+        while self._nodes_to_visit:
+            yield self._nodes_to_visit.pop()
+
 
 class BaseFilenameVisitor(BaseVisitor, metaclass=abc.ABCMeta):
     """
@@ -222,6 +323,7 @@ class BaseFilenameVisitor(BaseVisitor, metaclass=abc.ABCMeta):
         """
         if self.filename != constants.STDIN:
             self.stem = get_stem(self.filename)
+            self._file_attributes |= _created_by(self, self._pre_visit)
             self.visit_filename()
             self._post_visit()
 
@@ -258,6 +360,11 @@ class BaseTokenVisitor(BaseVisitor, metaclass=abc.ABCMeta):
             file_tokens=checker.file_tokens,
         )
 
+    def reset(self, checker=None) -> None:
+        """Prepares this instance to check the next ``tokenize`` sequence."""
+        self.file_tokens = [] if checker is None else checker.file_tokens
+        super().reset(checker)
+
     def visit(self, token: tokenize.TokenInfo) -> None:
         """
         Runs custom defined handlers in a visitor for each specific token type.
@@ -282,7 +389,44 @@ class BaseTokenVisitor(BaseVisitor, metaclass=abc.ABCMeta):
 
     @final
     def run(self) -> None:
-        """Visits all token types that have a handler method."""
-        for token in self.file_tokens:
-            self.visit(token)
+        """
+        Visits all token types that have a handler method.
+
+        Stops when the ``deadline`` is over, without the final hook.
+        """
+        self._file_attributes |= _created_by(self, self._pre_visit)
+        if self.deadline is None:
+            for token in self.file_tokens:
+                self.visit(token)
+        elif not _visit_until(self.deadline, self.visit, self.file_tokens):
+            return
         self._post_visit()
+
+
+def _visit_until(
+    deadline: float,
+    visit: Callable[[_Visitable], None],
+    nodes: Iterable[_Visitable],
+) -> bool:
+    """
+    Visits nodes or tokens while there's time left.
+
+    Time is checked once in a while, since it is not free.
+    Returns ``False`` when visitor has run out of time.
+    """
+    nodes_before_check = _CHECK_TIME_EVERY
+    for node in nodes:
+        visit(node)
+        nodes_before_check -= 1
+        if not nodes_before_check:
+            if time.perf_counter() > deadline:
+                return False
+            nodes_before_check = _CHECK_TIME_EVERY
+    return True
+
+
+def _created_by(instance: object, callback: Callable[[], None]) -> Set[str]:
+    """Calls ``callback`` and returns names of new ``instance`` attributes."""
+    attributes = set(vars(instance))  # noqa: WPS421
+    callback()
+    return vars(instance).keys() - attributes  # noqa: WPS421
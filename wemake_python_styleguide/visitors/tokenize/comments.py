@@ -49,12 +49,6 @@ class WrongCommentVisitor(BaseTokenVisitor):
         r'^type:\s?([\w\d\[\]\'\"\.]+)$',
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initializes a counter."""
-        super().__init__(*args, **kwargs)
-        self._noqa_count = 0
-        self._no_cover_count = 0
-
     def visit_comment(self, token: tokenize.TokenInfo) -> None:
         """
         Performs comment checks.
@@ -70,6 +64,10 @@ class WrongCommentVisitor(BaseTokenVisitor):
         self._check_empty_doc_comment(token)
         self._check_cover_comments(token)
 
+    def _pre_visit(self) -> None:
+        self._noqa_count = 0
+        self._no_cover_count = 0
+
     def _check_noqa(self, token: tokenize.TokenInfo) -> None:
         comment_text = get_comment_text(token)
         match = self._noqa_check.match(comment_text)
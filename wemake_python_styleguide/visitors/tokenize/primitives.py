@@ -145,11 +145,6 @@ class WrongStringTokenVisitor(BaseTokenVisitor):
 
     _implicit_raw_strigns: ClassVar[Pattern] = re.compile(r'\\{2}.+')
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initializes new visitor and saves all docstrings."""
-        super().__init__(*args, **kwargs)
-        self._docstrings = get_docstring_tokens(self.file_tokens)
-
     def visit_string(self, token: tokenize.TokenInfo) -> None:
         """
         Finds incorrect string usages.
@@ -170,6 +165,9 @@ class WrongStringTokenVisitor(BaseTokenVisitor):
         self._check_implicit_raw_string(token)
         self._check_wrong_unicode_escape(token)
 
+    def _pre_visit(self) -> None:
+        self._docstrings = get_docstring_tokens(self.file_tokens)
+
     def _check_correct_multiline(self, token: tokenize.TokenInfo) -> None:
         _, string_def = split_prefixes(token)
         if has_triple_string_quotes(string_def):
@@ -232,11 +230,6 @@ class WrongStringConcatenationVisitor(BaseTokenVisitor):
         tokenize.INDENT,
     ))
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Adds extra ``_previous_token`` property."""
-        super().__init__(*args, **kwargs)
-        self._previous_token: Optional[tokenize.TokenInfo] = None
-
     def visit(self, token: tokenize.TokenInfo) -> None:
         """
         Ensures that all string are concatenated as we allow.
@@ -247,6 +240,9 @@ class WrongStringConcatenationVisitor(BaseTokenVisitor):
         """
         self._check_concatenation(token)
 
+    def _pre_visit(self) -> None:
+        self._previous_token: Optional[tokenize.TokenInfo] = None
+
     def _check_concatenation(self, token: tokenize.TokenInfo) -> None:
         if token.exact_type in self._ignored_tokens:
             return
@@ -44,11 +44,6 @@ class ExtraIndentationVisitor(BaseTokenVisitor):
         tokenize.NL,
     )
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates empty counter."""
-        super().__init__(*args, **kwargs)
-        self._offsets: Dict[int, tokenize.TokenInfo] = {}
-
     def visit(self, token: tokenize.TokenInfo) -> None:
         """
         Goes through all tokens to find wrong indentation.
@@ -59,6 +54,9 @@ class ExtraIndentationVisitor(BaseTokenVisitor):
         """
         self._check_extra_indentation(token)
 
+    def _pre_visit(self) -> None:
+        self._offsets: Dict[int, tokenize.TokenInfo] = {}
+
     def _check_extra_indentation(self, token: tokenize.TokenInfo) -> None:
         lineno, _offset = token.start
         if lineno not in self._offsets:
@@ -109,11 +107,6 @@ class BracketLocationVisitor(BaseTokenVisitor):
     We track all kind of brackets: round, square, and curly.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates line tracking for tokens."""
-        super().__init__(*args, **kwargs)
-        self._lines: TokenLines = defaultdict(list)
-
     def visit(self, token: tokenize.TokenInfo) -> None:
         """
         Goes trough all tokens to separate them by line numbers.
@@ -124,6 +117,9 @@ class BracketLocationVisitor(BaseTokenVisitor):
         """
         self._lines[token.start[0]].append(token)
 
+    def _pre_visit(self) -> None:
+        self._lines: TokenLines = defaultdict(list)
+
     def _annotate_brackets(
         self,
         tokens: List[tokenize.TokenInfo],